@@ -0,0 +1,128 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Callable
+
+from app.config import ADMIN_CHANNEL_ID, CHANNEL_ID, GUILD_ID
+from app.database.cache_events import cache_bus
+from app.log import logger
+from app.repositories.guild_configs import list_guild_configs, upsert_guild_config
+
+
+@dataclass(frozen=True)
+class GuildConfig:
+    guild_id: int
+    scrum_channel_id: int
+    admin_channel_id: int | None = None
+
+    @classmethod
+    def from_row(cls, row: dict) -> "GuildConfig":
+        return cls(
+            guild_id=int(row["guild_id"]),
+            scrum_channel_id=int(row["scrum_channel_id"]),
+            admin_channel_id=int(row["admin_channel_id"]) if row.get("admin_channel_id") else None,
+        )
+
+
+class GuildConfigMap:
+    """길드별 인증/관리자 채널 설정을 메모리에 보관하는 맵입니다.
+
+    시작 시 guild_configs 테이블에서 읽어 오고, 설정을 바꾸면 DB와 맵을 함께 갱신합니다.
+    채널 검사는 모두 이 맵으로 O(1)에 처리합니다.
+    """
+
+    def __init__(self, default: GuildConfig | None = None, default_admin_channel_id: int | None = None):
+        # 환경변수(GUILD_ID/CHANNEL_ID)로 지정한 설정은 DB에 행이 없어도 동작하도록 기본값으로 둡니다.
+        self._default = default
+        self._default_admin_channel_id = default_admin_channel_id
+        self._stored: dict[int, GuildConfig] = {}  # DB에 저장된 설정
+        self._by_guild: dict[int, GuildConfig] = {}
+        self._by_scrum_channel: dict[int, GuildConfig] = {}
+        self._loaded = False
+        self._listeners: list[Callable[[GuildConfig], None]] = []
+        self._reindex()
+
+    def _reindex(self) -> None:
+        configs = dict(self._stored)
+        if self._default and self._default.guild_id not in configs:
+            configs[self._default.guild_id] = self._default
+        self._by_guild = configs
+        self._by_scrum_channel = {config.scrum_channel_id: config for config in configs.values()}
+
+    def __len__(self) -> int:
+        return len(self._by_guild)
+
+    def get(self, guild_id: int | None) -> GuildConfig | None:
+        return self._by_guild.get(guild_id) if guild_id is not None else None
+
+    def for_scrum_channel(self, channel_id: int | None) -> GuildConfig | None:
+        return self._by_scrum_channel.get(channel_id) if channel_id is not None else None
+
+    def is_scrum_channel(self, channel_id: int | None) -> bool:
+        return channel_id in self._by_scrum_channel
+
+    def scrum_channel_ids(self) -> list[int]:
+        return list(self._by_scrum_channel)
+
+    def admin_channel_for(self, guild_id: int | None) -> int | None:
+        """길드의 관리자 채널을 반환합니다. 지정되지 않았으면 기본 관리자 채널(ADMIN_CHANNEL_ID)을 씁니다."""
+        config = self.get(guild_id)
+        if config and config.admin_channel_id:
+            return config.admin_channel_id
+        return self._default_admin_channel_id
+
+    def on_change(self, listener: Callable[[GuildConfig], None]) -> None:
+        """설정이 추가되거나 바뀔 때 호출할 함수를 등록합니다."""
+        self._listeners.append(listener)
+
+    def _notify(self, configs: list[GuildConfig]) -> None:
+        for config in configs:
+            for listener in self._listeners:
+                try:
+                    listener(config)
+                except Exception as e:
+                    logger.warning(f"길드 설정 변경 처리 실패 (guild_id={config.guild_id}): {e}")
+
+    async def load(self) -> None:
+        """처음 한 번 DB에서 설정을 읽어 옵니다."""
+        if not self._loaded:
+            await self.refresh()
+
+    async def refresh(self) -> None:
+        """DB의 설정으로 맵 전체를 다시 만듭니다. 새로 생기거나 바뀐 설정은 리스너에 알립니다."""
+        rows = await list_guild_configs()
+        configs = {}
+        for row in rows:
+            config = GuildConfig.from_row(row)
+            configs[config.guild_id] = config
+        changed = [config for guild_id, config in configs.items() if self._by_guild.get(guild_id) != config]
+        self._stored = configs
+        self._reindex()
+        self._loaded = True
+        self._notify(changed)
+
+    async def set(self, guild_id: int, scrum_channel_id: int, admin_channel_id: int | None) -> GuildConfig:
+        """설정을 DB에 저장하고 맵에도 바로 반영합니다."""
+        row = await upsert_guild_config(str(guild_id), str(scrum_channel_id), str(admin_channel_id) if admin_channel_id else None)
+        config = GuildConfig.from_row(row) if row else GuildConfig(guild_id, scrum_channel_id, admin_channel_id)
+        self._stored[config.guild_id] = config
+        self._reindex()
+        self._notify([config])
+        await cache_bus.publish("guild_config", str(config.guild_id))
+        return config
+
+    async def refresh_loop(self, is_closed: Callable[[], bool], interval: float) -> None:
+        """봇 밖에서(DB에서 직접) 바꾼 설정도 반영되도록 주기적으로 다시 읽습니다. is_closed()가 참이 되면 멈춥니다."""
+        while not is_closed():
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"길드 설정 새로고침 실패: {e}")
+
+
+guild_configs = GuildConfigMap(
+    default=GuildConfig(GUILD_ID, CHANNEL_ID, ADMIN_CHANNEL_ID) if CHANNEL_ID else None,
+    default_admin_channel_id=ADMIN_CHANNEL_ID,
+)
+# 다른 클러스터 워커에서 설정을 바꾸면 DB에서 다시 읽습니다.
+cache_bus.subscribe("guild_config", lambda guild_id: guild_configs.refresh())
@@ -0,0 +1,131 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from app.config import SCRUM_INDEX_TOMBSTONES
+from app.log import logger
+from app.repositories.scrum_entries import get_latest_scrum_entry, get_recent_scrum_entries
+from app.utils.scrum_message import parse_scrum_message
+
+
+@dataclass
+class LatestScrum:
+    message_id: int
+    channel_id: int
+    yesterday: str
+    today: str
+    comment: str
+
+    @classmethod
+    def from_row(cls, row: dict) -> "LatestScrum":
+        """scrum_entries 레코드로부터 인덱스 항목을 만듭니다."""
+        return cls(
+            message_id=int(row["message_id"]),
+            channel_id=int(row["channel_id"]),
+            yesterday=row.get("yesterday_work") or "",
+            today=row.get("today_plan") or "",
+            comment=row.get("comment") or "",
+        )
+
+    @classmethod
+    def from_message(cls, message_id: int, channel_id: int, text: str) -> "LatestScrum":
+        """인증 메시지 본문으로부터 인덱스 항목을 만듭니다."""
+        sections = parse_scrum_message(text)
+        return cls(
+            message_id=message_id,
+            channel_id=channel_id,
+            yesterday=sections.yesterday,
+            today=sections.today,
+            comment=sections.comment,
+        )
+
+
+class ScrumIndex:
+    """채널별 유저의 최근 인증 메시지를 메모리에 보관하는 인덱스입니다.
+
+    채널 히스토리를 훑지 않고 O(1)로 최근 인증을 찾기 위해 사용합니다.
+    인덱스에 없으면 DB(scrum_entries)에서 조회한 뒤 인덱스에 채워 넣습니다.
+    """
+
+    def __init__(self, max_tombstones: int = SCRUM_INDEX_TOMBSTONES):
+        self._latest: dict[tuple[int, int], LatestScrum] = {}  # (channel_id, user_id) -> 최근 인증
+        self._key_by_message: dict[int, tuple[int, int]] = {}
+        # 삭제된 메시지 ID (DB 에 남은 옛 행으로 다시 채우지 않도록). 최근 것만 max_tombstones 개 기억합니다.
+        self._deleted: OrderedDict[int, None] = OrderedDict()
+        self._max_tombstones = max_tombstones
+        self._warmed: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+    def get(self, user_id: int, channel_id: int) -> LatestScrum | None:
+        return self._latest.get((channel_id, user_id))
+
+    def put(self, user_id: int, entry: LatestScrum) -> None:
+        """기존 항목보다 최신(또는 같은) 메시지일 때만 인덱스를 갱신합니다."""
+        if entry.message_id in self._deleted:
+            return
+
+        # 메시지 ID는 스노우플레이크라 크기 비교가 곧 시간 비교입니다.
+        key = (entry.channel_id, user_id)
+        current = self._latest.get(key)
+        if current and current.message_id > entry.message_id:
+            return
+        if current:
+            self._key_by_message.pop(current.message_id, None)
+
+        self._latest[key] = entry
+        self._key_by_message[entry.message_id] = key
+
+    def remove_message(self, message_id: int) -> None:
+        """삭제된 메시지를 인덱스에서 제거합니다."""
+        self._deleted[message_id] = None
+        self._deleted.move_to_end(message_id)
+        while len(self._deleted) > self._max_tombstones:
+            self._deleted.popitem(last=False)
+        key = self._key_by_message.pop(message_id, None)
+        if key is not None:
+            self._latest.pop(key, None)
+
+    def clear(self) -> None:
+        """인덱스를 비우고 다음 warm() 때 DB에서 다시 채우도록 합니다."""
+        self._latest.clear()
+        self._key_by_message.clear()
+        self._deleted.clear()
+        self._warmed.clear()
+
+    async def warm(self, channel_id: int) -> None:
+        """채널마다 한 번 DB의 최근 인증으로 인덱스를 채웁니다."""
+        if channel_id in self._warmed:
+            return
+        try:
+            rows = await get_recent_scrum_entries(str(channel_id))
+        except Exception as e:
+            logger.warning(f"스크럼 인덱스 초기화 실패 (channel_id={channel_id}): {e}")
+            return
+
+        for row in rows:
+            self.put(int(row["user_id"]), LatestScrum.from_row(row))
+        self._warmed.add(channel_id)
+        logger.info(f"스크럼 인덱스 초기화 완료 (channel_id={channel_id}): {len(rows)}건")
+
+    async def lookup(self, user_id: int, channel_id: int) -> LatestScrum | None:
+        """유저의 채널 내 최근 인증을 조회합니다. 인덱스에 없으면 DB에서 가져옵니다."""
+        entry = self.get(user_id, channel_id)
+        if entry:
+            return entry
+
+        try:
+            row = await get_latest_scrum_entry(str(user_id), str(channel_id))
+        except Exception as e:
+            logger.warning(f"최근 인증 DB 조회 실패: {e}")
+            return None
+
+        if not row or int(row["message_id"]) in self._deleted:
+            return None
+
+        entry = LatestScrum.from_row(row)
+        self.put(user_id, entry)
+        return entry
+
+
+scrum_index = ScrumIndex()
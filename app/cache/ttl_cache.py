@@ -0,0 +1,113 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+
+_MISSING = object()
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    # 기다리던 호출이 모두 취소된 로드의 예외가 "never retrieved" 경고로 남지 않게 합니다.
+    if not task.cancelled():
+        task.exception()
+
+
+class TTLCache:
+    """TTL 만료와 LRU 퇴출을 지원하는 비동기 read-through 캐시입니다.
+
+    같은 키에 대한 동시 미스는 하나의 로더 호출로 합쳐집니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        # 로딩 중에 set/invalidate 된 키: 로더의 (더 오래된) 결과를 저장하지 않습니다.
+        self._superseded: set[Hashable] = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """만료되지 않은 값이 캐시에 있는지 반환합니다. (조회 통계에는 넣지 않습니다)"""
+        return self._lookup(key) is not _MISSING
+
+    def _lookup(self, key: Hashable) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return _MISSING
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            # 만료된 항목은 저장소 장애 때 get_stale() 로 쓸 수 있도록 maxsize 안에서 남겨 둡니다.
+            return _MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def get_stale(self, key: Hashable) -> tuple[bool, Any]:
+        """만료 여부와 관계없이 캐시에 남아 있는 값을 (있는지, 값)으로 반환합니다."""
+        item = self._data.get(key)
+        if item is None:
+            return False, None
+        return True, item[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """값을 저장하고, 최대 크기를 넘으면 가장 오래 쓰이지 않은 항목을 퇴출합니다."""
+        if key in self._inflight:
+            self._superseded.add(key)
+        self._store(key, value)
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        if key in self._inflight:
+            self._superseded.add(key)
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """캐시에 있으면 바로 반환하고, 없으면 loader로 한 번만 불러와 저장합니다."""
+        value = self._lookup(key)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        task = self._inflight.get(key)
+        if task is None:
+            # 로더는 따로 태스크로 돌립니다. 처음 부른 쪽이 취소되어도 함께 기다리던 다른 호출은 결과를 받습니다.
+            task = asyncio.create_task(self._load(key, loader))
+            task.add_done_callback(_consume_exception)
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await loader()
+            if key not in self._superseded:
+                self._store(key, value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+            self._superseded.discard(key)
+
+    def stats(self) -> dict:
+        """히트/미스/퇴출 카운터를 반환합니다."""
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,346 @@
+## 샤드 클러스터 런처
+# 샤드를 여러 워커 프로세스에 나눠 실행해 게이트웨이 연결 하나/이벤트 루프 하나의 한계를 넘습니다.
+# - 런처(이 모듈)만 헬스체크/지표 서버를 띄우고, 워커는 상태/지표 스냅샷을 CLUSTER_STATE_DIR 에 남깁니다.
+# - 워커끼리의 메모리 캐시 무효화는 공유 로컬 DB의 cache_events 로 전달합니다. (app/database/cache_events.py)
+#
+# 실행: python -m app.cluster  (CLUSTER_WORKERS, SHARD_COUNT 로 워커/샤드 수 조절)
+import asyncio
+import glob
+import json
+import math
+import os
+import signal
+import sys
+import time
+from dataclasses import dataclass, field
+
+import aiohttp
+from aiohttp import web
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.parser import text_string_to_metric_families
+
+from app.config import (
+    CLUSTER_ID,
+    CLUSTER_REPORT_INTERVAL,
+    CLUSTER_STATE_DIR,
+    CLUSTER_WORKERS,
+    DISCORD_TOKEN,
+    SHARD_COUNT,
+    SHARD_IDS,
+    WEB_SERVER_PORT,
+)
+from app.log import logger
+
+
+DISCORD_API = "https://discord.com/api/v10"
+# 디스코드는 max_concurrency 개의 샤드마다 5초에 한 번만 IDENTIFY 를 허용합니다.
+IDENTIFY_INTERVAL = 5.0
+# 워커가 죽었을 때 재시작 대기 시간(초)의 최대값
+MAX_RESTART_BACKOFF = 60.0
+
+
+## 1. 워커 쪽: 상태/지표 스냅샷
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _worker_state(bot) -> dict:
+    # AutoShardedBot 은 샤드별 지연을, 일반 Bot 은 하나의 지연만 가집니다.
+    latencies = bot.latencies if hasattr(bot, "latencies") else [(0, bot.latency)]
+    return {
+        "cluster_id": CLUSTER_ID,
+        "pid": os.getpid(),
+        "shard_ids": SHARD_IDS,
+        "ready": bot.is_ready(),
+        "guilds": len(bot.guilds),
+        "latencies": {str(shard_id): latency for shard_id, latency in latencies if not math.isinf(latency)},
+        "updated_at": time.time(),
+    }
+
+
+def write_worker_snapshot(bot) -> None:
+    """워커의 상태(JSON)와 지표(Prometheus 텍스트)를 런처가 읽을 파일로 남깁니다."""
+    os.makedirs(CLUSTER_STATE_DIR, exist_ok=True)
+    base = os.path.join(CLUSTER_STATE_DIR, f"worker-{CLUSTER_ID}")
+    _write_atomic(f"{base}.prom", generate_latest(REGISTRY))
+    _write_atomic(f"{base}.json", json.dumps(_worker_state(bot)).encode("utf-8"))
+
+
+async def report_worker_state(bot, interval: float = CLUSTER_REPORT_INTERVAL) -> None:
+    """봇이 종료될 때까지 interval 초마다 스냅샷을 남깁니다."""
+    while not bot.is_closed():
+        try:
+            await asyncio.to_thread(write_worker_snapshot, bot)
+        except Exception as e:
+            logger.warning(f"워커 상태 기록 실패: {e}")
+        await asyncio.sleep(interval)
+
+
+## 2. 런처 쪽: 샤드 분배와 워커 관리
+async def fetch_gateway_info(token: str) -> tuple[int, int]:
+    """디스코드 권장 샤드 수와 IDENTIFY 동시 허용 수(max_concurrency)를 조회합니다."""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(
+            f"{DISCORD_API}/gateway/bot",
+            headers={"Authorization": f"Bot {token}"},
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as res:
+            res.raise_for_status()
+            data = await res.json()
+    return int(data["shards"]), int(data["session_start_limit"]["max_concurrency"])
+
+
+def split_shards(shard_count: int, workers: int) -> list[list[int]]:
+    """0..shard_count-1 을 워커 수만큼 연속 구간으로 나눕니다. (구간 크기 차이는 최대 1)"""
+    workers = max(1, min(workers, shard_count))
+    size, extra = divmod(shard_count, workers)
+    groups, start = [], 0
+    for index in range(workers):
+        end = start + size + (1 if index < extra else 0)
+        groups.append(list(range(start, end)))
+        start = end
+    return groups
+
+
+@dataclass
+class Worker:
+    cluster_id: int
+    shard_ids: list[int]
+    process: asyncio.subprocess.Process | None = None
+    restarts: int = 0
+    started_at: float = 0.0
+    supervisor: asyncio.Task | None = field(default=None, repr=False)
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+
+class ClusterLauncher:
+    """샤드 구간마다 봇 워커 프로세스를 띄우고, 죽으면 다시 띄웁니다."""
+
+    def __init__(self, shard_count: int, shard_groups: list[list[int]], max_concurrency: int, state_dir: str):
+        self.shard_count = shard_count
+        self.max_concurrency = max(1, max_concurrency)
+        self.state_dir = state_dir
+        self.workers = [Worker(cluster_id, shard_ids) for cluster_id, shard_ids in enumerate(shard_groups)]
+        self._stopping = False
+
+    def _env(self, worker: Worker) -> dict:
+        env = dict(os.environ)
+        env.update(
+            SHARDING="1",
+            SHARD_COUNT=str(self.shard_count),
+            SHARD_IDS=",".join(map(str, worker.shard_ids)),
+            CLUSTER_ID=str(worker.cluster_id),
+            CLUSTER_SIZE=str(len(self.workers)),
+            CLUSTER_STATE_DIR=self.state_dir,
+            # 헬스체크/지표 서버와 self-ping 은 런처만 맡습니다.
+            WEB_SERVER_ENABLED="0",
+        )
+        return env
+
+    def identify_time(self, worker: Worker) -> float:
+        """워커의 샤드가 모두 IDENTIFY 하는 데 걸리는 최소 시간입니다."""
+        return math.ceil(len(worker.shard_ids) / self.max_concurrency) * IDENTIFY_INTERVAL
+
+    async def _supervise(self, worker: Worker) -> None:
+        backoff = 1.0
+        while not self._stopping:
+            worker.process = await asyncio.create_subprocess_exec(
+                sys.executable, "-m", "app.discord_bot", env=self._env(worker)
+            )
+            worker.started_at = time.time()
+            logger.info(f"워커 {worker.cluster_id} 시작 (pid={worker.process.pid}, 샤드 {worker.shard_ids})")
+            returncode = await worker.process.wait()
+            if self._stopping:
+                return
+
+            # 한동안 잘 돌았다면 백오프를 처음부터 다시 셉니다.
+            if time.time() - worker.started_at > MAX_RESTART_BACKOFF:
+                backoff = 1.0
+            worker.restarts += 1
+            logger.error(f"워커 {worker.cluster_id} 종료 (code={returncode}), {backoff:.0f}초 후 재시작")
+            await asyncio.sleep(backoff)
+            backoff = min(MAX_RESTART_BACKOFF, backoff * 2)
+
+    async def start(self) -> None:
+        # 이전 실행의 스냅샷이 섞이지 않도록 지웁니다.
+        os.makedirs(self.state_dir, exist_ok=True)
+        for path in glob.glob(os.path.join(self.state_dir, "worker-*")):
+            os.remove(path)
+
+        for worker in self.workers:
+            worker.supervisor = asyncio.create_task(self._supervise(worker))
+            # 프로세스끼리 IDENTIFY 가 겹쳐 제한에 걸리지 않도록 앞 워커의 샤드가 연결될 시간만큼 기다립니다.
+            if worker is not self.workers[-1]:
+                await asyncio.sleep(self.identify_time(worker))
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """워커에 SIGTERM 을 보내고 종료를 기다립니다. timeout 안에 끝나지 않으면 강제 종료합니다."""
+        self._stopping = True
+        alive = [worker for worker in self.workers if worker.alive]
+        for worker in alive:
+            worker.process.terminate()
+        try:
+            await asyncio.wait_for(asyncio.gather(*(worker.process.wait() for worker in alive)), timeout)
+        except asyncio.TimeoutError:
+            for worker in alive:
+                if worker.alive:
+                    worker.process.kill()
+        for worker in self.workers:
+            if worker.supervisor:
+                worker.supervisor.cancel()
+
+    def _read_state(self, worker: Worker) -> dict | None:
+        try:
+            with open(os.path.join(self.state_dir, f"worker-{worker.cluster_id}.json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def status(self) -> list[dict]:
+        now = time.time()
+        statuses = []
+        for worker in self.workers:
+            state = self._read_state(worker) or {}
+            statuses.append({
+                "cluster_id": worker.cluster_id,
+                "shard_ids": worker.shard_ids,
+                "alive": worker.alive,
+                "restarts": worker.restarts,
+                "ready": bool(state.get("ready")) and worker.alive,
+                "guilds": state.get("guilds"),
+                "latencies": state.get("latencies", {}),
+                "snapshot_age": round(now - state["updated_at"], 1) if "updated_at" in state else None,
+            })
+        return statuses
+
+
+class ClusterMetricsCollector:
+    """워커들이 남긴 지표 스냅샷을 읽어 cluster 라벨을 붙여 하나로 합칩니다."""
+
+    def __init__(self, launcher: ClusterLauncher):
+        self.launcher = launcher
+
+    def collect(self):
+        up = GaugeMetricFamily("scrumbot_cluster_worker_up", "워커 프로세스 실행 여부", labels=["cluster"])
+        restarts = CounterMetricFamily("scrumbot_cluster_worker_restarts", "워커 재시작 횟수", labels=["cluster"])
+        families: dict[str, Metric] = {}
+        for worker in self.launcher.workers:
+            cluster = str(worker.cluster_id)
+            up.add_metric([cluster], 1 if worker.alive else 0)
+            restarts.add_metric([cluster], worker.restarts)
+
+            path = os.path.join(self.launcher.state_dir, f"worker-{worker.cluster_id}.prom")
+            try:
+                with open(path, encoding="utf-8") as f:
+                    text = f.read()
+            except OSError:
+                continue
+            for family in text_string_to_metric_families(text):
+                merged = families.get(family.name)
+                if merged is None:
+                    merged = families[family.name] = Metric(family.name, family.documentation, family.type, family.unit)
+                for sample in family.samples:
+                    merged.samples.append(sample._replace(labels={**sample.labels, "cluster": cluster}))
+
+        yield up
+        yield restarts
+        yield from families.values()
+
+
+## 3. 런처 헬스체크/지표 서버
+async def start_web_server(launcher: ClusterLauncher) -> web.AppRunner:
+    # 런처는 봇을 띄우지 않으므로 outbox 등 로컬 DB 상태만 읽습니다.
+    from app.database.outbox import scrum_outbox
+
+    registry = CollectorRegistry()
+    registry.register(ClusterMetricsCollector(launcher))
+
+    async def health_check(request):
+        workers = launcher.status()
+        try:
+            outbox_backlog = await scrum_outbox.count()
+        except Exception as e:
+            logger.warning(f"outbox 상태 조회 실패: {e}")
+            outbox_backlog = None
+        status = "OK" if all(worker["alive"] for worker in workers) else "DEGRADED"
+        return web.json_response({"status": status, "outbox_backlog": outbox_backlog, "workers": workers}, status=200)
+
+    async def metrics(request):
+        body = await asyncio.to_thread(generate_latest, registry)
+        return web.Response(body=body, headers={"Content-Type": CONTENT_TYPE_LATEST})
+
+    app = web.Application()
+    app.router.add_get('/health', health_check)
+    app.router.add_get('/metrics', metrics)
+    app.router.add_get('/', health_check)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, '0.0.0.0', WEB_SERVER_PORT).start()
+    logger.info(f"🌐 Cluster health check server running on port {WEB_SERVER_PORT}")
+    return runner
+
+
+async def ping_self_loop(stopped: asyncio.Event) -> None:
+    url = os.environ.get("KOYEB_URL", "").strip()
+    if not url:
+        logger.warning("❌ KOYEB_URL 환경변수가 비어 있습니다.")
+        return
+    async with aiohttp.ClientSession() as session:
+        while not stopped.is_set():
+            try:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as res:
+                    logger.info(f"✅ Self-ping 성공: {res.status} (URL: {url})", extra={"sample_key": "self_ping"})
+            except Exception as e:
+                logger.warning(f"❌ Self-ping 실패: {type(e).__name__}: {e} (URL: {url})")
+            try:
+                await asyncio.wait_for(stopped.wait(), timeout=300)  # 5분 간격
+            except asyncio.TimeoutError:
+                pass
+
+
+async def main() -> None:
+    recommended, max_concurrency = await fetch_gateway_info(DISCORD_TOKEN)
+    shard_count = SHARD_COUNT or recommended
+    workers = CLUSTER_WORKERS or os.cpu_count() or 1
+    groups = [SHARD_IDS] if SHARD_IDS else split_shards(shard_count, workers)
+    logger.info(
+        f"샤드 클러스터 시작: 샤드 {shard_count}개 (권장 {recommended}), 워커 {len(groups)}개, "
+        f"max_concurrency={max_concurrency}"
+    )
+
+    launcher = ClusterLauncher(shard_count, groups, max_concurrency, CLUSTER_STATE_DIR)
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopped.set)
+
+    runner = await start_web_server(launcher)
+    ping_task = asyncio.create_task(ping_self_loop(stopped))
+    start_task = asyncio.create_task(launcher.start())
+    try:
+        await stopped.wait()
+    finally:
+        logger.info("샤드 클러스터 종료 중...")
+        start_task.cancel()
+        await launcher.stop()
+        ping_task.cancel()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except Exception as e:
+        logger.error(f"Fatal error: {e}")
+        sys.exit(1)
@@ -0,0 +1,412 @@
+import asyncio
+import io
+import os
+from datetime import date, datetime, timezone
+
+import discord
+from discord import app_commands, Interaction
+from discord.ext import commands
+
+from app.cache.guild_config import guild_configs
+from app.cache.scrum_index import LatestScrum, scrum_index
+from app.config import (
+    BACKFILL_PAGE_SIZE,
+    BACKFILL_REPORT_EVERY,
+    BACKFILL_REQUESTS_PER_SECOND,
+    EXPORT_DIR,
+    EXPORT_MAX_UPLOAD_BYTES,
+    PROFILE_MAX_SECONDS,
+    STREAK_REBUILD_PAGE_SIZE,
+)
+from app.database.backfill_cursor import BackfillCursor, backfill_cursors
+from app.database.streaks import streak_store
+from app.export import export_filename, export_scrum_entries, parse_export_date
+from app.log import logger
+from app.memory import memory_report
+from app.metrics import mark_interaction_error, observe_interaction
+from app.profiling import profile
+from app.repositories.scrum_entries import import_scrum_entries, iter_scrum_entry_pages
+from app.utils.rate_limiter import AsyncTokenBucket
+from app.utils.scrum_message import parse_scrum_author
+
+
+# 백필이 쓸 수 있는 디스코드 REST 호출 예산 (라이브 명령어가 굶지 않도록 제한)
+backfill_budget = AsyncTokenBucket(rate=BACKFILL_REQUESTS_PER_SECOND, capacity=1)
+
+
+class AdminCog(commands.Cog, name="Admin"):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self._backfill_task: asyncio.Task | None = None
+        self._profile_task: asyncio.Task | None = None
+        self._streak_task: asyncio.Task | None = None
+        self._export_task: asyncio.Task | None = None
+
+    async def cog_unload(self):
+        for task in (self._backfill_task, self._profile_task, self._streak_task, self._export_task):
+            if task and not task.done():
+                task.cancel()
+
+    async def _report(self, text: str, guild_id: int | None = None, file: discord.File | None = None) -> bool:
+        """길드의 관리자 채널로 진행 상황을 보고하고, 보냈는지 반환합니다."""
+        logger.info(text)
+        channel = self.bot.get_channel(guild_configs.admin_channel_for(guild_id) or 0)
+        if isinstance(channel, (discord.TextChannel, discord.Thread)):
+            try:
+                await channel.send(text, file=file)
+                return True
+            except discord.HTTPException as e:
+                logger.warning(f"관리자 채널 보고 실패: {e}")
+        return False
+
+    def _to_entry(self, message: discord.Message) -> dict | None:
+        """봇이 보낸 인증 메시지를 scrum_entries 레코드로 변환하고 최근 인증 인덱스도 갱신합니다."""
+        if self.bot.user is None or message.author.id != self.bot.user.id:
+            return None
+        user_id = parse_scrum_author(message.content)
+        if user_id is None:
+            return None
+
+        latest = LatestScrum.from_message(message.id, message.channel.id, message.content)
+        scrum_index.put(user_id, latest)
+        return {
+            "user_id": str(user_id),
+            "yesterday_work": latest.yesterday,
+            "today_plan": latest.today,
+            "comment": latest.comment,
+            "message_id": str(message.id),
+            "channel_id": str(message.channel.id),
+            "created_at": message.created_at.isoformat(),
+            "updated_at": message.edited_at.isoformat() if message.edited_at else None,
+            "is_edited": message.edited_at is not None,
+        }
+
+    async def _run_backfill(self, channel: discord.TextChannel | discord.Thread, reset: bool) -> None:
+        channel_id = str(channel.id)
+        guild_id = channel.guild.id
+        if reset:
+            await backfill_cursors.reset(channel_id)
+        cursor = await backfill_cursors.get(channel_id) or BackfillCursor(channel_id, 0, 0, 0)
+        imported_before = cursor.imported
+
+        await self._report(
+            f"📥 인증 백필 시작: #{channel.name} "
+            f"({'처음부터' if not cursor.last_message_id else f'{cursor.scanned}개 이후부터 이어서'})",
+            guild_id,
+        )
+        pages = 0
+        try:
+            while True:
+                # 페이지 하나가 REST 호출 하나이므로 호출 전에 예산을 받아 둡니다.
+                await backfill_budget.acquire()
+                after = discord.Object(id=cursor.last_message_id) if cursor.last_message_id else None
+                messages = [
+                    message
+                    async for message in channel.history(limit=BACKFILL_PAGE_SIZE, after=after, oldest_first=True)
+                ]
+                if not messages:
+                    break
+
+                entries = [entry for message in messages if (entry := self._to_entry(message))]
+                if entries:
+                    await import_scrum_entries(entries)
+
+                # 저장이 끝난 페이지까지만 커서를 옮겨야 재시작 시 빠짐없이 이어집니다.
+                cursor.last_message_id = messages[-1].id
+                cursor.scanned += len(messages)
+                cursor.imported += len(entries)
+                await backfill_cursors.save(cursor)
+
+                pages += 1
+                if pages % BACKFILL_REPORT_EVERY == 0:
+                    await self._report(
+                        f"📥 인증 백필 진행 중: 메시지 {cursor.scanned}개 확인, 인증 {cursor.imported}개 반영",
+                        guild_id,
+                    )
+        except asyncio.CancelledError:
+            logger.info(f"인증 백필 중단: 메시지 {cursor.scanned}개까지 진행")
+            raise
+        except Exception as e:
+            await self._report(f"❌ 인증 백필 실패 (다시 실행하면 이어서 진행합니다): {e}", guild_id)
+            return
+
+        await self._report(f"✅ 인증 백필 완료: 메시지 {cursor.scanned}개 확인, 인증 {cursor.imported}개 반영", guild_id)
+
+        # 가져온 과거 인증이 연속 인증/총 인증 수에도 반영되도록 채널 집계를 다시 계산합니다.
+        if cursor.imported > imported_before:
+            if self._streak_task and not self._streak_task.done():
+                await asyncio.wait({self._streak_task})
+            self._streak_task = asyncio.create_task(self._run_streak_rebuild(guild_id, channel.id))
+            await self._streak_task
+
+    @app_commands.command(name="인증백필", description="채널 히스토리의 인증 메시지를 DB로 가져옵니다.")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.rename(reset="처음부터")
+    @app_commands.describe(reset="저장된 진행 위치를 무시하고 처음부터 다시 가져옵니다.")
+    @observe_interaction("command", "인증백필")
+    async def backfill_scrum(self, interaction: Interaction, reset: bool = False):
+        try:
+            config = guild_configs.get(interaction.guild_id)
+            channel = self.bot.get_channel(config.scrum_channel_id) if config else None
+            if not isinstance(channel, (discord.TextChannel, discord.Thread)):
+                await interaction.response.send_message(
+                    "❌ 인증 채널을 찾을 수 없습니다.", ephemeral=True
+                )
+                return
+
+            if self._backfill_task and not self._backfill_task.done():
+                await interaction.response.send_message(
+                    "⏳ 이미 백필이 진행 중입니다.", ephemeral=True
+                )
+                return
+
+            self._backfill_task = asyncio.create_task(self._run_backfill(channel, reset))
+            await interaction.response.send_message(
+                "📥 인증 백필을 시작했습니다. 진행 상황은 관리자 채널로 보고됩니다.", ephemeral=True
+            )
+        except Exception as e:
+            logger.error(f"Error in backfill_scrum command: {e}")
+            mark_interaction_error()
+            if not interaction.response.is_done():
+                await interaction.response.send_message(
+                    "❌ 명령어 실행 중 오류가 발생했습니다.", ephemeral=True
+                )
+
+    async def _run_streak_rebuild(self, guild_id: int, channel_id: int) -> None:
+        await self._report("📊 인증 현황 재계산 시작", guild_id)
+        try:
+            count = await streak_store.rebuild(
+                channel_id, iter_scrum_entry_pages(str(channel_id), STREAK_REBUILD_PAGE_SIZE)
+            )
+        except Exception as e:
+            await self._report(f"❌ 인증 현황 재계산 실패: {e}", guild_id)
+            return
+        await self._report(f"✅ 인증 현황 재계산 완료: 인증 {count}개 반영", guild_id)
+
+    @app_commands.command(name="인증현황재계산", description="전체 인증 기록으로 연속 인증/총 인증 수를 다시 계산합니다.")
+    @app_commands.default_permissions(administrator=True)
+    @observe_interaction("command", "인증현황재계산")
+    async def rebuild_streaks(self, interaction: Interaction):
+        try:
+            config = guild_configs.get(interaction.guild_id)
+            if config is None:
+                await interaction.response.send_message(
+                    "❌ 이 서버에는 인증 채널이 설정되지 않았습니다.", ephemeral=True
+                )
+                return
+
+            if self._streak_task and not self._streak_task.done():
+                await interaction.response.send_message(
+                    "⏳ 이미 재계산이 진행 중입니다.", ephemeral=True
+                )
+                return
+
+            self._streak_task = asyncio.create_task(
+                self._run_streak_rebuild(config.guild_id, config.scrum_channel_id)
+            )
+            await interaction.response.send_message(
+                "📊 인증 현황 재계산을 시작했습니다. 결과는 관리자 채널로 보고됩니다.", ephemeral=True
+            )
+        except Exception as e:
+            logger.error(f"Error in rebuild_streaks command: {e}")
+            mark_interaction_error()
+            if not interaction.response.is_done():
+                await interaction.response.send_message(
+                    "❌ 명령어 실행 중 오류가 발생했습니다.", ephemeral=True
+                )
+
+    async def _run_export(
+        self, guild_id: int, channel_id: int, start: date | None, end: date | None, fmt: str
+    ) -> None:
+        path = os.path.join(EXPORT_DIR, export_filename(channel_id, start, end, fmt))
+        await self._report(f"📤 인증 내보내기 시작: <#{channel_id}> ({start or '처음'} ~ {end or '오늘'}, {fmt})", guild_id)
+        try:
+            result = await export_scrum_entries(path, fmt, channel_id, start, end, streak_store.tz)
+        except Exception as e:
+            await self._report(f"❌ 인증 내보내기 실패: {e}", guild_id)
+            return
+
+        summary = f"✅ 인증 내보내기 완료: 인증 {result.rows}개, {result.size / 2**20:.1f}MB"
+        if result.size > EXPORT_MAX_UPLOAD_BYTES:
+            await self._report(f"{summary}\n첨부하기에 커서 봇 서버에 저장했습니다: `{result.path}`", guild_id)
+            return
+        # 파일은 디스크에서 읽으며 올리므로 메모리에 통째로 올리지 않습니다. 올리고 나면 지웁니다.
+        if await self._report(summary, guild_id, file=discord.File(result.path)):
+            os.remove(result.path)
+        else:
+            await self._report(f"{summary}\n첨부에 실패해 봇 서버에 저장했습니다: `{result.path}`", guild_id)
+
+    @app_commands.command(name="인증내보내기", description="인증 기록을 gzip 으로 압축한 CSV/JSONL 파일로 내보냅니다.")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.rename(start="시작일", end="종료일", fmt="형식", channel="채널")
+    @app_commands.describe(
+        start="이 날짜부터 내보냅니다. (YYYY-MM-DD, 비우면 처음부터)",
+        end="이 날짜까지 내보냅니다. (YYYY-MM-DD, 비우면 오늘까지)",
+        fmt="파일 형식",
+        channel="내보낼 인증 채널 (비우면 이 서버의 인증 채널)",
+    )
+    @app_commands.choices(
+        fmt=[app_commands.Choice(name="CSV", value="csv"), app_commands.Choice(name="JSONL", value="jsonl")]
+    )
+    @observe_interaction("command", "인증내보내기")
+    async def export_scrum(
+        self,
+        interaction: Interaction,
+        start: str | None = None,
+        end: str | None = None,
+        fmt: str = "csv",
+        channel: discord.TextChannel | None = None,
+    ):
+        try:
+            config = guild_configs.get(interaction.guild_id)
+            channel_id = channel.id if channel else (config.scrum_channel_id if config else None)
+            if channel_id is None:
+                await interaction.response.send_message(
+                    "❌ 이 서버에는 인증 채널이 설정되지 않았습니다. 채널을 지정해주세요.", ephemeral=True
+                )
+                return
+
+            try:
+                start_date, end_date = parse_export_date(start), parse_export_date(end)
+            except ValueError as e:
+                await interaction.response.send_message(f"❌ {e}", ephemeral=True)
+                return
+            if start_date and end_date and start_date > end_date:
+                await interaction.response.send_message(
+                    "❌ 시작일이 종료일보다 늦습니다.", ephemeral=True
+                )
+                return
+
+            if self._export_task and not self._export_task.done():
+                await interaction.response.send_message(
+                    "⏳ 이미 내보내기가 진행 중입니다.", ephemeral=True
+                )
+                return
+
+            self._export_task = asyncio.create_task(
+                self._run_export(interaction.guild_id, channel_id, start_date, end_date, fmt)
+            )
+            await interaction.response.send_message(
+                "📤 인증 내보내기를 시작했습니다. 파일은 관리자 채널에 올라갑니다.", ephemeral=True
+            )
+        except Exception as e:
+            logger.error(f"Error in export_scrum command: {e}")
+            mark_interaction_error()
+            if not interaction.response.is_done():
+                await interaction.response.send_message(
+                    "❌ 명령어 실행 중 오류가 발생했습니다.", ephemeral=True
+                )
+
+    async def _run_profile(self, guild_id: int | None, seconds: int, cpu: bool) -> None:
+        try:
+            summary, report = await profile(seconds, cpu=cpu)
+        except Exception as e:
+            await self._report(f"❌ 프로파일링 실패: {e}", guild_id)
+            return
+
+        filename = f"profile-{datetime.now(timezone.utc):%Y%m%d-%H%M%S}.txt"
+        await self._report(
+            f"🔬 프로파일링 완료: {summary}",
+            guild_id,
+            file=discord.File(io.BytesIO(report.encode("utf-8")), filename=filename),
+        )
+
+    @app_commands.command(name="프로파일링", description="봇을 잠시 프로파일링하고 보고서를 관리자 채널에 올립니다.")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.rename(seconds="초", cpu="cprofile")
+    @app_commands.describe(
+        seconds="프로파일링할 시간(초)",
+        cpu="cProfile 로 함수 호출까지 측정합니다. 측정하는 동안 봇이 느려집니다.",
+    )
+    @observe_interaction("command", "프로파일링")
+    async def profile_bot(self, interaction: Interaction, seconds: app_commands.Range[int, 1, 3600] = 30, cpu: bool = True):
+        try:
+            if self._profile_task and not self._profile_task.done():
+                await interaction.response.send_message(
+                    "⏳ 이미 프로파일링이 진행 중입니다.", ephemeral=True
+                )
+                return
+
+            seconds = min(seconds, PROFILE_MAX_SECONDS)
+            self._profile_task = asyncio.create_task(self._run_profile(interaction.guild_id, seconds, cpu))
+            await interaction.response.send_message(
+                f"🔬 {seconds}초 동안 프로파일링합니다. 보고서는 관리자 채널에 올라갑니다.", ephemeral=True
+            )
+        except Exception as e:
+            logger.error(f"Error in profile_bot command: {e}")
+            mark_interaction_error()
+            if not interaction.response.is_done():
+                await interaction.response.send_message(
+                    "❌ 명령어 실행 중 오류가 발생했습니다.", ephemeral=True
+                )
+
+    @app_commands.command(name="메모리", description="봇 프로세스의 메모리 사용량과 캐시 크기를 확인합니다.")
+    @app_commands.default_permissions(administrator=True)
+    @observe_interaction("command", "메모리")
+    async def memory_usage(self, interaction: Interaction):
+        try:
+            report = memory_report(self.bot)
+            lines = [
+                f"🧠 RSS: {report['rss_bytes'] / 2**20:.1f}MB (최대 {report['peak_rss_bytes'] / 2**20:.1f}MB)",
+                f"길드 {report['guilds']} · 채널 {report['channels']} · 멤버 {report['members']} · 유저 {report['users']}",
+                f"메시지 캐시 {report['messages']}",
+                f"프로필 캐시 {report['profile_cache']} · 최근 인증 인덱스 {report['scrum_index']} · "
+                f"연속 인증 집계 {report['streaks']} · 길드 설정 {report['guild_configs']}",
+            ]
+            await interaction.response.send_message("\n".join(lines), ephemeral=True)
+        except Exception as e:
+            logger.error(f"Error in memory_usage command: {e}")
+            mark_interaction_error()
+            if not interaction.response.is_done():
+                await interaction.response.send_message(
+                    "❌ 명령어 실행 중 오류가 발생했습니다.", ephemeral=True
+                )
+
+    @app_commands.command(name="채널설정", description="이 서버의 인증 채널과 관리자 채널을 지정합니다.")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.rename(scrum_channel="인증채널", admin_channel="관리자채널")
+    @app_commands.describe(
+        scrum_channel="인증 메시지를 올릴 채널",
+        admin_channel="백필/재계산 등 진행 상황을 보고할 채널 (비우면 기본 관리자 채널)",
+    )
+    @observe_interaction("command", "채널설정")
+    async def configure_channels(
+        self,
+        interaction: Interaction,
+        scrum_channel: discord.TextChannel,
+        admin_channel: discord.TextChannel | None = None,
+    ):
+        try:
+            if interaction.guild_id is None:
+                await interaction.response.send_message(
+                    "❌ 서버 안에서만 사용할 수 있습니다.", ephemeral=True
+                )
+                return
+
+            # 인증 채널은 한 길드에만 속할 수 있습니다.
+            taken = guild_configs.for_scrum_channel(scrum_channel.id)
+            if taken and taken.guild_id != interaction.guild_id:
+                await interaction.response.send_message(
+                    "❌ 이미 다른 서버의 인증 채널로 지정된 채널입니다.", ephemeral=True
+                )
+                return
+
+            config = await guild_configs.set(
+                interaction.guild_id, scrum_channel.id, admin_channel.id if admin_channel else None
+            )
+            admin_text = f"<#{config.admin_channel_id}>" if config.admin_channel_id else "기본 관리자 채널"
+            await interaction.response.send_message(
+                f"✅ 채널 설정이 저장되었습니다.\n인증 채널: <#{config.scrum_channel_id}>\n관리자 채널: {admin_text}",
+                ephemeral=True,
+            )
+        except Exception as e:
+            logger.error(f"Error in configure_channels command: {e}")
+            mark_interaction_error()
+            if not interaction.response.is_done():
+                await interaction.response.send_message(
+                    "❌ 채널 설정 중 오류가 발생했습니다.", ephemeral=True
+                )
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(AdminCog(bot))
@@ -0,0 +1,70 @@
+from discord import app_commands, Interaction
+from discord.ext import commands
+
+from app.cache.guild_config import guild_configs
+from app.config import REMINDER_ENABLED
+from app.log import logger
+from app.metrics import mark_interaction_error, observe_interaction
+from app.reminders import guild_scrum_channel_id, parse_remind_at, reminder_scheduler
+from app.repositories.resilience import RepositoryTimeout, RepositoryUnavailable
+from app.repositories.scrum_reminders import set_scrum_reminder
+from app.utils.interaction import InteractionReply
+
+
+class ReminderCog(commands.Cog, name="Reminder"):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        if REMINDER_ENABLED:
+            # 봇이 준비되면 맡은 길드의 오늘 알림을 읽고 다음 알림 시각까지 잠듭니다.
+            reminder_scheduler.start(self.bot)
+            # /채널설정 으로 새로 설정된 길드의 알림도 바로 읽습니다.
+            guild_configs.on_change(lambda config: reminder_scheduler.wake())
+
+    async def cog_unload(self):
+        await reminder_scheduler.stop()
+
+    async def _save(self, interaction: Interaction, remind_at: str | None, done: str) -> None:
+        async with InteractionReply(interaction) as reply:
+            try:
+                if interaction.guild is None or guild_scrum_channel_id(interaction.guild) is None:
+                    await reply.send("❌ 이 서버에는 인증 채널이 설정되지 않았습니다.")
+                    return
+                await set_scrum_reminder(str(interaction.guild_id), str(interaction.user.id), remind_at)
+                reminder_scheduler.set_remind_at(interaction.guild_id, interaction.user.id, remind_at)
+                await reply.send(done)
+            except (RepositoryTimeout, RepositoryUnavailable) as e:
+                logger.warning(f"Repository unavailable in reminder command: {e}")
+                mark_interaction_error()
+                await reply.send_error("⏳ 지금은 저장소가 응답하지 않아 알림 설정을 저장하지 못했습니다. 잠시 후 다시 시도해주세요.")
+            except Exception as e:
+                logger.error(f"Error in reminder command: {e}")
+                mark_interaction_error()
+                await reply.send_error("❌ 알림 설정에 실패했습니다. 관리자에게 문의해주세요.")
+
+    @app_commands.command(name="알림설정", description="오늘 인증을 하지 않았으면 정한 시각에 DM으로 알려드립니다.")
+    @app_commands.rename(remind_at="시각")
+    @app_commands.describe(remind_at="알림을 받을 시각 (24시간제 HH:MM, 예: 21:00)")
+    @observe_interaction("command", "알림설정")
+    async def set_reminder(self, interaction: Interaction, remind_at: str):
+        parsed = parse_remind_at(remind_at)
+        if parsed is None:
+            await interaction.response.send_message(
+                "❌ 시각은 24시간제 HH:MM 형식으로 입력해주세요. (예: 21:00)", ephemeral=True
+            )
+            return
+        await self._save(
+            interaction,
+            parsed,
+            f"⏰ 매일 {parsed}까지 인증하지 않으면 DM으로 알려드릴게요.\n(DM을 받으려면 서버 멤버의 DM 허용이 켜져 있어야 합니다)",
+        )
+
+    @app_commands.command(name="알림해제", description="인증 알림 DM을 끕니다.")
+    @observe_interaction("command", "알림해제")
+    async def clear_reminder(self, interaction: Interaction):
+        await self._save(interaction, None, "🔕 인증 알림을 껐습니다.")
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(ReminderCog(bot))
@@ -2,53 +2,188 @@ import discord
 from discord import app_commands, ui, Interaction
 from discord.ext import commands
 import asyncio
-
-from app.repositories.scrum_entries import create_scrum_entry, update_scrum_entry
-from app.repositories.user_profiles import get_user_profile
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+from app.cache.guild_config import GuildConfig, guild_configs
+from app.cache.scrum_index import LatestScrum, scrum_index
+from app.config import (
+    CLUSTER_ID,
+    LATEST_SCRUM_FETCH_TIMEOUT,
+    MODAL_PREFETCH_TIMEOUT,
+    PROFILE_FETCH_TIMEOUT,
+    SCRUM_HISTORY_LIST_LIMIT,
+    STREAK_REBUILD_PAGE_SIZE,
+)
+from app.database.streaks import UserStreak, streak_store
+from app.reminders import reminder_scheduler
+from app.repositories.scrum_entries import (
+    enqueue_scrum_entry,
+    iter_scrum_entry_pages,
+    outbox_replayer,
+    scrum_entry_queue,
+    update_scrum_entry,
+)
+from app.repositories.scrum_history import (
+    ScrumVersion,
+    get_scrum_version,
+    list_scrum_versions,
+    record_scrum_edit_later,
+    wait_pending_records,
+)
+from app.repositories.user_profiles import get_user_profile, profile_cache
 from app.log import logger
+from app.metrics import mark_interaction_error, observe_interaction
+from app.utils.interaction import Fetched, InteractionReply, fetch
+from app.utils.outbound import KIND_EDIT, KIND_SEND, EditResult, outbound
+from app.utils.scrum_message import SECTION_BY_KEY, parse_scrum_author, render_scrum_body, render_scrum_message
+
+
+# 채널이 밀려 먼저 응답한 인터랙션의 마무리 태스크 (종료 시 기다립니다)
+_pending_replies: set[asyncio.Task] = set()
+
+# 수정 이력 항목(scrum_entries 컬럼) -> /인증기록 에 보여줄 이름
+HISTORY_FIELD_NAMES = {"yesterday_work": "어제 한 일", "today_plan": "오늘 계획", "comment": "하고 싶은 말"}
 
 
-def extract_section(text: str, start_heading: str, end_heading: str) -> str:
-    if not text:
+def streak_badge(days: int) -> str:
+    """연속 인증 일수에 맞는 배지를 반환합니다."""
+    if days >= 30:
+        return "🏆"
+    if days >= 7:
+        return "🔥"
+    if days >= 3:
+        return "✨"
+    return ""
+
+
+def format_streak(streak: UserStreak | None) -> str:
+    """인증 등록 응답에 덧붙일 연속 인증 문구를 만듭니다."""
+    if streak is None:
         return ""
+    days = streak.streak_on(streak_store.today())
+    badge = streak_badge(days)
+    return f"\n{badge + ' ' if badge else ''}{days}일 연속 인증 중 (총 {streak.total_posts}회)"
+
+
+async def reply_when_done(
+    interaction: Interaction,
+    job: asyncio.Future,
+    complete: Callable[[Any], Awaitable[str]],
+    timeout: float,
+    pending_text: str,
+    error_text: str,
+) -> None:
+    """채널 전송/수정 작업이 timeout 안에 끝나면 결과로 응답하고, 아니면 먼저 응답한 뒤 끝나면 그 응답을 고칩니다.
+
+    complete(결과)는 작업 뒤 처리(인덱스/DB 반영)를 하고 사용자에게 보여 줄 문구를 반환합니다.
+    """
+    done, _ = await asyncio.wait({job}, timeout=timeout)
+    if done:
+        await interaction.response.send_message(await complete(job.result()), ephemeral=True)
+        return
+
+    await interaction.response.send_message(pending_text, ephemeral=True)
+    task = asyncio.create_task(_finish_reply(interaction, job, complete, error_text))
+    _pending_replies.add(task)
+    task.add_done_callback(_pending_replies.discard)
+
+
+async def _finish_reply(
+    interaction: Interaction,
+    job: asyncio.Future,
+    complete: Callable[[Any], Awaitable[str]],
+    error_text: str,
+) -> None:
+    try:
+        text = await complete(await job)
+    except Exception as e:
+        logger.error(f"Error in delayed scrum reply: {e}")
+        mark_interaction_error()
+        text = error_text
+    try:
+        await interaction.edit_original_response(content=text)
+    except discord.HTTPException as e:
+        logger.warning(f"지연 응답 수정 실패: {e}")
+
+
+# 인증 작성 시작 버튼의 custom_id. 누른 유저와 채널은 인터랙션에서 알 수 있으므로 값을 담지 않습니다.
+START_SCRUM_CUSTOM_ID = "scrum:start"
+
+
+async def resolve_prefill(
+    user_id: int, channel_id: int, latest_timeout: float, profile_timeout: float
+) -> tuple[str, str, Fetched[dict | None]]:
+    """최근 인증과 프로필을 동시에 조회해 (어제 한 일, 오늘 계획, 프로필 조회 결과)를 반환합니다.
+
+    조회가 시간 한도를 넘기면 최근 인증은 인덱스에 있는 값으로, 프로필(루틴)은 없는 것으로 채웁니다.
+    """
+    latest, profile = await asyncio.gather(
+        fetch(
+            "latest_scrum",
+            lambda: scrum_index.lookup(user_id, channel_id),
+            latest_timeout,
+            lambda: scrum_index.get(user_id, channel_id),
+        ),
+        fetch("user_profile", lambda: get_user_profile(user_id), profile_timeout, lambda: None),
+    )
+    today_section = latest.value.today if latest.value else ""
+
+    # 루틴이 있으면 오늘 계획에 자동으로 설정
+    routine = (profile.value or {}).get('routine', '')
+    return today_section or "(없음)", routine or today_section, profile
 
-    lines = text.splitlines()
-    is_in_section = False
-    collected: list[str] = []
-    for line in lines:
-        if line.strip().startswith(start_heading):
-            is_in_section = True
-            continue
-        if is_in_section and end_heading and line.strip().startswith(end_heading):
-            break
-        if is_in_section:
-            collected.append(line)
-    return "\n".join(collected).strip()
 
 class StartScrumButton(ui.View):
-    def __init__(self, channel_id: int, user_id: int, yesterday: str, today: str, has_goals: bool = False):
-        super().__init__(timeout=300)  # 5분 타임아웃
-        self.channel_id = channel_id
-        self.user_id = user_id
-        self.yesterday = yesterday
-        self.today = today
-        self.has_goals = has_goals
+    """모든 유저의 "인증 작성 시작" 버튼을 처리하는 영구 뷰입니다.
 
-    @ui.button(label="인증 작성 시작", style=discord.ButtonStyle.primary, emoji="✍️")
+    봇이 시작할 때 하나만 등록하고, 버튼을 누른 시점에 캐시(없으면 DB)에서 모달에 채울 내용을 찾습니다.
+    custom_id 가 고정이라 재시작 뒤에도 이전에 보낸 버튼이 그대로 동작합니다.
+    """
+
+    def __init__(self):
+        super().__init__(timeout=None)
+
+    @ui.button(label="인증 작성 시작", style=discord.ButtonStyle.primary, emoji="✍️", custom_id=START_SCRUM_CUSTOM_ID)
+    @observe_interaction("button", "인증 작성 시작")
     async def start_scrum(self, interaction: Interaction, button: ui.Button):
         try:
+            config = guild_configs.for_scrum_channel(interaction.channel_id)
+            if config is None:
+                await interaction.response.send_message(
+                    "❌ 인증 채널 설정이 바뀌어 이 버튼을 사용할 수 없습니다. `/인증복사`를 다시 실행해주세요.", ephemeral=True
+                )
+                return
+
+            # 모달은 defer 한 뒤에 열 수 없으므로 조회가 늦으면 캐시에 있는 값으로 엽니다.
+            yesterday, today, _ = await resolve_prefill(
+                interaction.user.id, config.scrum_channel_id, MODAL_PREFETCH_TIMEOUT, MODAL_PREFETCH_TIMEOUT
+            )
             modal = ScrumModal(
-                channel_id=self.channel_id,
-                user_id=self.user_id,
-                yesterday=self.yesterday,
-                today=self.today
+                channel_id=config.scrum_channel_id,
+                user_id=interaction.user.id,
+                yesterday=yesterday,
+                today=today
             )
             await interaction.response.send_modal(modal)
         except Exception as e:
             logger.error(f"Error in start scrum button: {e}")
-            await interaction.response.send_message(
-                "❌ 모달을 열 수 없습니다.", ephemeral=True
-            )
+            mark_interaction_error()
+            if not interaction.response.is_done():
+                await interaction.response.send_message(
+                    "❌ 모달을 열 수 없습니다.", ephemeral=True
+                )
+
+
+def start_scrum_message_view() -> StartScrumButton:
+    """메시지에 붙일 버튼 뷰를 만듭니다.
+
+    메시지를 보낼 때 넘긴 뷰는 discord.py 가 메시지마다 따로 보관하고 에페메랄이면 15분 타임아웃을 겁니다.
+    보관되지 않도록 멈춘 뷰를 넘기고, 버튼 클릭은 봇에 등록한 영구 뷰가 custom_id 로 받아 처리합니다.
+    """
+    view = StartScrumButton()
+    view.stop()
+    return view
 
 class ScrumModal(ui.Modal, title="✍️ 인증 내용 작성"):
     def __init__(self, channel_id: int, user_id: int, yesterday: str, today: str):
@@ -58,17 +193,17 @@ class ScrumModal(ui.Modal, title="✍️ 인증 내용 작성"):
 
 
         self.yesterday_input: ui.TextInput = ui.TextInput(
-            label="🧐 어제 무엇을 했나요?",
+            label=SECTION_BY_KEY["yesterday"].label,
             style=discord.TextStyle.paragraph,
             default=yesterday,
         )
         self.today_input: ui.TextInput = ui.TextInput(
-            label="🫣 오늘 무엇을 할 계획인가요?",
+            label=SECTION_BY_KEY["today"].label,
             style=discord.TextStyle.paragraph,
             default=today,
         )
         self.comment_input: ui.TextInput = ui.TextInput(
-            label="😉 하고 싶은 말 (힘든 점, 좋은 일, 기대하는 모습 등)",
+            label=SECTION_BY_KEY["comment"].label,
             style=discord.TextStyle.paragraph,
             default="",
         )
@@ -77,6 +212,34 @@ class ScrumModal(ui.Modal, title="✍️ 인증 내용 작성"):
         self.add_item(self.today_input)
         self.add_item(self.comment_input)
 
+    async def _record(self, user_id: int, guild_id: int | None, sent_message: discord.Message) -> str:
+        """게시된 인증을 인덱스와 DB 큐에 반영하고 응답 문구를 반환합니다."""
+        scrum_index.put(
+            user_id,
+            LatestScrum(
+                message_id=sent_message.id,
+                channel_id=self.channel_id,
+                yesterday=self.yesterday_input.value,
+                today=self.today_input.value,
+                comment=self.comment_input.value,
+            ),
+        )
+        # 오늘 인증했으니 인증 알림 대상에서 뺍니다. (알림은 /알림설정 을 한 길드 ID 로 저장됩니다)
+        if guild_id is not None:
+            reminder_scheduler.mark_posted(guild_id, user_id)
+
+        # DB 저장은 write-behind 큐에서 일괄 처리하고 바로 응답합니다.
+        streak = await enqueue_scrum_entry(
+            user_id=str(user_id),
+            yesterday_work=self.yesterday_input.value,
+            today_plan=self.today_input.value,
+            comment=self.comment_input.value,
+            message_id=str(sent_message.id),
+            channel_id=str(self.channel_id)
+        )
+        return "✅ 인증이 등록되었습니다!" + format_streak(streak)
+
+    @observe_interaction("modal", "ScrumModal")
     async def on_submit(self, interaction: Interaction):
         try:
 
@@ -92,63 +255,84 @@ class ScrumModal(ui.Modal, title="✍️ 인증 내용 작성"):
                 )
                 return
 
-            content = (
-                f"🧐 어제 무엇을 했나요?\n{self.yesterday_input.value}\n\n"
-                f"🫣 오늘 무엇을 할 계획인가요?\n{self.today_input.value}\n\n"
-                f"😉 하고 싶은 말\n{self.comment_input.value}\n\n"
+            content = render_scrum_message(
+                interaction.user.id,
+                self.yesterday_input.value,
+                self.today_input.value,
+                self.comment_input.value,
             )
 
-            # 디스코드에 메시지 전송
-            sent_message = await check_channel.send(
-                f"<@{interaction.user.id}>님의 인증입니다\n\n{content}"
+            # 디스코드 전송은 채널 스케줄러에 맡기고, 채널이 밀려 있으면 기다리지 않고 먼저 응답합니다.
+            timeout = outbound.ack_timeout_for(self.channel_id, KIND_SEND)
+            posted = outbound.send(check_channel, content, key=interaction.user.id)
+            await reply_when_done(
+                interaction,
+                posted,
+                lambda sent_message: self._record(interaction.user.id, interaction.guild_id, sent_message),
+                timeout,
+                "⏳ 인증 채널에 메시지가 많아 게시를 잠시 기다리고 있습니다. 게시되면 이 메시지로 알려드릴게요.",
+                "❌ 인증 등록 중 오류가 발생했습니다.",
             )
-            
-            # DB에 저장
-            try:
-                await create_scrum_entry(
-                    user_id=str(interaction.user.id),
-                    yesterday_work=self.yesterday_input.value,
-                    today_plan=self.today_input.value,
-                    comment=self.comment_input.value,
-                    message_id=str(sent_message.id),
-                    channel_id=str(self.channel_id)
-                )
-                # 모달 응답 보내기
-                await interaction.response.send_message(
-                    "✅ 인증이 등록되었습니다!", ephemeral=True
-                )
-            except Exception as e:
-                logger.error(f"DB 저장 중 오류 발생: {e}")
-                await interaction.followup.send(
-                    "⚠️ 데이터베이스 저장 중 오류가 발생했습니다.", ephemeral=True
-                )
 
         except Exception as e:
             logger.error(f"Error in scrum modal submit: {e}")
+            mark_interaction_error()
             if not interaction.response.is_done():
                 await interaction.response.send_message(
                     "❌ 인증 등록 중 오류가 발생했습니다.", ephemeral=True
                 )
 
 
+def format_history_time(created_at: str | None) -> str:
+    """수정 이력의 시각을 인증 날짜 기준 시간대로 보여줍니다."""
+    if not created_at:
+        return "시각 없음"
+    return f"{datetime.fromisoformat(created_at).astimezone(streak_store.tz):%m/%d %H:%M}"
+
+
+def format_version_line(current: ScrumVersion, previous: ScrumVersion | None) -> str:
+    if current.version == 0:
+        summary = "원본"
+    elif previous is None:
+        summary = "수정"
+    else:
+        changed = [HISTORY_FIELD_NAMES[field] for field in current.changed_fields(previous)]
+        summary = ", ".join(changed) if changed else "변경 없음"
+    return f"v{current.version} · {format_history_time(current.created_at)} · {summary}"
+
+
 class ScrumEditModal(ui.Modal, title="✏️ 인증 내용 수정"):
-    def __init__(self, message_to_edit: discord.Message, yesterday: str, today: str, comment: str, user_id: int):
+    def __init__(
+        self,
+        message_to_edit: discord.Message | discord.PartialMessage,
+        yesterday: str,
+        today: str,
+        comment: str,
+        user_id: int,
+        previous: LatestScrum | None = None,
+    ):
         super().__init__()
         self.message_to_edit = message_to_edit
         self.user_id = user_id
+        # 수정 이력의 원본(version 0)으로 남길 수정 전 내용 (되돌리기는 입력창에 옛 버전을 채우므로 따로 받습니다)
+        self.previous = {
+            "yesterday_work": previous.yesterday if previous else yesterday,
+            "today_plan": previous.today if previous else today,
+            "comment": previous.comment if previous else comment,
+        }
 
         self.yesterday_input: ui.TextInput = ui.TextInput(
-            label="🧐 어제 무엇을 했나요?",
+            label=SECTION_BY_KEY["yesterday"].label,
             style=discord.TextStyle.paragraph,
             default=yesterday,
         )
         self.today_input: ui.TextInput = ui.TextInput(
-            label="🫣 오늘 무엇을 할 계획인가요?",
+            label=SECTION_BY_KEY["today"].label,
             style=discord.TextStyle.paragraph,
             default=today,
         )
         self.comment_input: ui.TextInput = ui.TextInput(
-            label="😉 하고 싶은 말 (힘든 점, 좋은 일, 기대하는 모습 등)",
+            label=SECTION_BY_KEY["comment"].label,
             style=discord.TextStyle.paragraph,
             default=comment,
         )
@@ -157,38 +341,74 @@ class ScrumEditModal(ui.Modal, title="✏️ 인증 내용 수정"):
         self.add_item(self.today_input)
         self.add_item(self.comment_input)
 
-    async def on_submit(self, interaction: Interaction):
+    async def _record(self, user_id: int, edited: EditResult) -> str:
+        """수정된 인증을 인덱스와 DB에 반영하고 응답 문구를 반환합니다."""
+        if edited.superseded:
+            # 뒤에 들어온 수정에 합쳐져 반영되었으므로, 오래된 내용으로 DB를 덮어쓰지 않습니다.
+            return "✅ 인증이 수정되었습니다!"
+
+        scrum_index.put(
+            user_id,
+            LatestScrum(
+                message_id=self.message_to_edit.id,
+                channel_id=self.message_to_edit.channel.id,
+                yesterday=self.yesterday_input.value,
+                today=self.today_input.value,
+                comment=self.comment_input.value,
+            ),
+        )
+
+        # DB 업데이트
         try:
-            content = (
-                f"🧐 어제 무엇을 했나요?\n{self.yesterday_input.value}\n\n"
-                f"🫣 오늘 무엇을 할 계획인가요?\n{self.today_input.value}\n\n"
-                f"😉 하고 싶은 말\n{self.comment_input.value}"
+            await update_scrum_entry(
+                message_id=str(self.message_to_edit.id),
+                yesterday_work=self.yesterday_input.value,
+                today_plan=self.today_input.value,
+                comment=self.comment_input.value
             )
+        except Exception as e:
+            logger.error(f"DB 업데이트 중 오류 발생: {e}")
+            mark_interaction_error()
+            return "⚠️ 데이터베이스 업데이트 중 오류가 발생했습니다."
+
+        record_scrum_edit_later(
+            str(self.message_to_edit.id),
+            self.previous,
+            {
+                "yesterday_work": self.yesterday_input.value,
+                "today_plan": self.today_input.value,
+                "comment": self.comment_input.value,
+            },
+            str(user_id),
+        )
+        return "✅ 인증이 수정되었습니다!"
 
-            # 기존 메시지 수정
-            new_content = f"<@{interaction.user.id}>님의 인증입니다 (수정됨)\n\n{content}"
-            await self.message_to_edit.edit(content=new_content)
+    @observe_interaction("modal", "ScrumEditModal")
+    async def on_submit(self, interaction: Interaction):
+        try:
+            # 기존 메시지 수정 (아직 보내지 않은 같은 메시지의 수정은 마지막 내용 하나로 합쳐집니다)
+            new_content = render_scrum_message(
+                interaction.user.id,
+                self.yesterday_input.value,
+                self.today_input.value,
+                self.comment_input.value,
+                edited=True,
+            )
+            channel_id = self.message_to_edit.channel.id
+            timeout = outbound.ack_timeout_for(channel_id, KIND_EDIT)
+            edited = outbound.edit(self.message_to_edit, new_content, key=interaction.user.id)
+            await reply_when_done(
+                interaction,
+                edited,
+                lambda result: self._record(interaction.user.id, result),
+                timeout,
+                "⏳ 인증 채널에 메시지가 많아 수정 반영을 잠시 기다리고 있습니다. 반영되면 이 메시지로 알려드릴게요.",
+                "❌ 인증 수정 중 오류가 발생했습니다.",
+            )
 
-            # DB 업데이트
-            try:
-                await update_scrum_entry(
-                    message_id=str(self.message_to_edit.id),
-                    yesterday_work=self.yesterday_input.value,
-                    today_plan=self.today_input.value,
-                    comment=self.comment_input.value
-                )
-                # 모달 응답 보내기
-                await interaction.response.send_message(
-                    "✅ 인증이 수정되었습니다!", ephemeral=True
-                )
-            except Exception as e:
-                logger.error(f"DB 업데이트 중 오류 발생: {e}")
-                await interaction.followup.send(
-                    "⚠️ 데이터베이스 업데이트 중 오류가 발생했습니다.", ephemeral=True
-                )
-            
         except Exception as e:
             logger.error(f"Error in scrum edit modal submit: {e}")
+            mark_interaction_error()
             if not interaction.response.is_done():
                 await interaction.response.send_message(
                     "❌ 인증 수정 중 오류가 발생했습니다.", ephemeral=True
@@ -198,163 +418,375 @@ class ScrumEditModal(ui.Modal, title="✏️ 인증 내용 수정"):
 class ScrumCog(commands.Cog, name="Scrum"):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-
-    @app_commands.command(name="인증복사", description="이전 인증에서 '오늘 계획'을 복사해 새 인증을 작성합니다.")
-    async def copy_scrum(self, interaction: Interaction):
+        self._prepare_task: asyncio.Task | None = None
+        self._channel_tasks: set[asyncio.Task] = set()
+
+    async def cog_load(self):
+        # 재시작 전에 보낸 "인증 작성 시작" 버튼도 처리하도록 영구 뷰를 등록합니다.
+        self.bot.add_view(StartScrumButton())
+
+        # outbox에 남은 작업을 재전송하고 write-behind 큐를 시작합니다.
+        # outbox 는 워커들이 함께 쓰므로 재전송은 0번 워커만 맡습니다. (다른 워커가 보내는 중인 작업을 다시 보내지 않도록)
+        if CLUSTER_ID == 0:
+            outbox_replayer.start()
+        scrum_entry_queue.start()
+
+        # 길드 설정을 읽은 뒤 인증 채널마다 최근 인증 인덱스와 인증 현황을 백그라운드에서 채웁니다.
+        self._prepare_task = asyncio.create_task(self._prepare())
+
+    async def cog_unload(self):
+        for task in (self._prepare_task, *self._channel_tasks):
+            if task and not task.done():
+                task.cancel()
+
+        # 채널 스케줄러에 남은 메시지를 보내고, 게시를 기다리던 인증을 마저 큐에 넣습니다.
+        await outbound.close()
+        if _pending_replies:
+            await asyncio.wait(set(_pending_replies), timeout=10)
+        await wait_pending_records(timeout=10)
+
+        # 종료 시 아직 저장되지 않은 인증을 모두 저장합니다.
+        await scrum_entry_queue.stop()
+        await outbox_replayer.stop()
+
+    async def _prepare(self) -> None:
         try:
-            channel_id = getattr(self.bot, "channel_id", None)
-            if channel_id is None:
-                await interaction.response.send_message(
-                    "❌ CHANNEL_ID가 설정되지 않았습니다.", ephemeral=True
+            await guild_configs.load()
+        except Exception as e:
+            # DB에서 읽지 못해도 환경변수로 지정한 기본 채널은 준비합니다.
+            logger.warning(f"길드 설정 로드 실패: {e}")
+        guild_configs.on_change(self._on_guild_config_change)
+
+        # 클러스터에서는 워커마다 맡은 길드(샤드)가 다르므로 이 워커가 볼 수 있는 인증 채널만 준비합니다.
+        # (다른 워커의 채널까지 재계산하면 그 워커가 갱신하는 인증 현황을 덮어씁니다)
+        # 환경변수 기본 설정은 GUILD_ID 없이 CHANNEL_ID 만 있을 수 있으므로 길드가 아니라 채널로 판단합니다.
+        await self.bot.wait_until_ready()
+        for channel_id in guild_configs.scrum_channel_ids():
+            if self.bot.get_channel(channel_id) is not None:
+                self._prepare_channel(channel_id)
+
+    def _on_guild_config_change(self, config: GuildConfig) -> None:
+        """새로 지정된 인증 채널도 바로 인덱스와 인증 현황을 채웁니다."""
+        if self.bot.get_channel(config.scrum_channel_id) is not None:
+            self._prepare_channel(config.scrum_channel_id)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        for channel_id in guild_configs.scrum_channel_ids():
+            if guild.get_channel(channel_id) is not None:
+                self._prepare_channel(channel_id)
+
+    def _prepare_channel(self, channel_id: int) -> None:
+        task = asyncio.create_task(self._warm_channel(channel_id))
+        self._channel_tasks.add(task)
+        task.add_done_callback(self._channel_tasks.discard)
+
+    async def _warm_channel(self, channel_id: int) -> None:
+        await scrum_index.warm(channel_id)
+        await self._load_streaks(channel_id)
+
+    async def _load_streaks(self, channel_id: int) -> None:
+        """저장된 인증 현황을 읽고, 처음 실행이라 비어 있으면 전체 기록에서 한 번 계산합니다."""
+        try:
+            await streak_store.load()
+            if not streak_store.has_channel(channel_id):
+                count = await streak_store.rebuild(
+                    channel_id, iter_scrum_entry_pages(str(channel_id), STREAK_REBUILD_PAGE_SIZE)
                 )
-                return
+                logger.info(f"인증 현황 초기 계산 완료 (channel_id={channel_id}): 인증 {count}개")
+        except Exception as e:
+            logger.warning(f"인증 현황 초기화 실패 (channel_id={channel_id}): {e}")
 
-            channel = self.bot.get_channel(channel_id)
-            user_id = interaction.user.id
-            latest_msg: discord.Message | None = None
+    def _is_scrum_post(self, channel_id: int, author_id: int) -> bool:
+        return (
+            guild_configs.is_scrum_channel(channel_id)
+            and self.bot.user is not None
+            and author_id == self.bot.user.id
+        )
 
-            if interaction.channel_id != channel_id:
-                await interaction.response.send_message(
-                    "이 채널에서는 사용할 수 없는 명령어입니다.", ephemeral=True
-                )
-                return
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if not self._is_scrum_post(message.channel.id, message.author.id):
+            return
+        user_id = parse_scrum_author(message.content)
+        if user_id is not None:
+            scrum_index.put(user_id, LatestScrum.from_message(message.id, message.channel.id, message.content))
+
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        content = payload.data.get("content")
+        author_id = int(payload.data.get("author", {}).get("id", 0))
+        if content is None or not self._is_scrum_post(payload.channel_id, author_id):
+            return
+        user_id = parse_scrum_author(content)
+        if user_id is not None:
+            scrum_index.put(user_id, LatestScrum.from_message(payload.message_id, payload.channel_id, content))
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        if guild_configs.is_scrum_channel(payload.channel_id):
+            scrum_index.remove_message(payload.message_id)
 
-            if not isinstance(channel, (discord.TextChannel, discord.Thread)):
-                await interaction.response.send_message(
-                    "❌ 텍스트 채널에서만 사용할 수 있습니다.", ephemeral=True
+    @app_commands.command(name="인증복사", description="이전 인증에서 '오늘 계획'을 복사해 새 인증을 작성합니다.")
+    @observe_interaction("command", "인증복사")
+    async def copy_scrum(self, interaction: Interaction):
+        async with InteractionReply(interaction) as reply:
+            try:
+                # 길드마다 지정된 인증 채널에서만 사용할 수 있습니다.
+                config = guild_configs.for_scrum_channel(interaction.channel_id)
+                if config is None:
+                    await reply.send("이 채널에서는 사용할 수 없는 명령어입니다.")
+                    return
+
+                channel_id = config.scrum_channel_id
+                channel = self.bot.get_channel(channel_id)
+                user_id = interaction.user.id
+
+                if not isinstance(channel, (discord.TextChannel, discord.Thread)):
+                    await reply.send("❌ 텍스트 채널에서만 사용할 수 있습니다.")
+                    return
+
+                # 캐시에 없는 값이 있으면 DB를 기다려야 하므로 먼저 defer 합니다.
+                if scrum_index.get(user_id, channel_id) is None or str(user_id) not in profile_cache:
+                    await reply.defer()
+
+                # 최근 인증과 사용자 프로필을 동시에 조회하고, 늦으면 캐시/빈 값으로 진행합니다.
+                # (모달에 채울 내용은 버튼을 누를 때 다시 찾으므로 여기서는 목표 안내에만 씁니다)
+                _, _, profile = await resolve_prefill(
+                    user_id, channel_id, LATEST_SCRUM_FETCH_TIMEOUT, PROFILE_FETCH_TIMEOUT
                 )
-                return
 
-            async for msg in channel.history(limit=200):
-                if msg.author.bot and f"<@{user_id}>" in msg.content:
-                    latest_msg = msg
-                    break
-                elif (
-                    msg.author.id == user_id
-                    and "🧐 어제 무엇을 했나요?" in msg.content
-                ):
-                    latest_msg = msg
-                    break
-
-            today_section = (
-                extract_section(
-                    latest_msg.content,
-                    "🫣 오늘 무엇을 할 계획인가요?",
-                    "😉 하고 싶은 말",
-                )
-                if latest_msg
-                else ""
+                if profile.degraded:
+                    # 프로필을 읽지 못하면 목표 안내 없이 바로 작성할 수 있게 합니다.
+                    await reply.send(
+                        "⚠️ 지금은 목표 정보를 불러올 수 없어 목표 없이 인증을 작성합니다.\n",
+                        view=start_scrum_message_view(),
+                    )
+                    return
+
+                user_profile = profile.value or {}
+
+                # 목표 정보가 있으면 먼저 보여주기
+                has_goals = user_profile.get('monthly_goal')
+
+                if has_goals:
+                    # 목표가 있는 경우: 버튼 사용
+                    await reply.send(
+                        f"🎯  {interaction.user.display_name}님의 목표\n\n"
+                        f"📅  월간 목표\n{user_profile.get('monthly_goal', '(없음)')}\n\n"
+                        f"📅  주간 목표\n{user_profile.get('weekly_goal', '(없음)')}\n\n"
+                        "위 목표를 참고하여 인증을 작성해주세요\n",
+                        view=start_scrum_message_view(),
+                    )
+                else:
+                    # 목표가 없는 경우: 버튼 비활성화
+                    await reply.send(
+                        "❌ 월간 목표를 먼저 설정해주세요.\n\n"
+                        "목표를 설정하려면 `/월간목표설정` 명령어를 사용해주세요.",
+                    )
+            except Exception as e:
+                logger.error(f"Error in copy_scrum command: {e}")
+                mark_interaction_error()
+                await reply.send_error("❌ 명령어 실행 중 오류가 발생했습니다.")
+
+    async def _find_editable_scrum(
+        self, interaction: Interaction, deadline: float
+    ) -> tuple[discord.TextChannel | discord.Thread, LatestScrum] | None:
+        """모달로 수정할 유저의 최근 인증을 찾습니다. 찾지 못하면 안내를 보내고 None 을 반환합니다."""
+        # 길드마다 지정된 인증 채널에서만 사용할 수 있습니다.
+        config = guild_configs.for_scrum_channel(interaction.channel_id)
+        if config is None:
+            await interaction.response.send_message(
+                "이 채널에서는 사용할 수 없는 명령어입니다.", ephemeral=True
             )
+            return None
 
-            # 사용자 프로필 조회 
-            user_profile = await get_user_profile(user_id)
-            
-            # 루틴이 있으면 오늘 계획에 자동으로 설정
-            routine = user_profile.get('routine', '') if user_profile else ''
-            today_plan = routine if routine else today_section or ""
-
-            # 목표 정보가 있으면 먼저 보여주기
-            has_goals = user_profile.get('monthly_goal')
+        channel_id = config.scrum_channel_id
+        channel = self.bot.get_channel(channel_id)
+        user_id = interaction.user.id
 
-            if has_goals:
-                # 목표가 있는 경우: 버튼 사용
-                view = StartScrumButton(channel_id, user_id, today_section or "(없음)", today_plan, has_goals=True)
-                await interaction.response.send_message(
-                    f"🎯  {interaction.user.display_name}님의 목표\n\n"
-                    f"📅  월간 목표\n{user_profile.get('monthly_goal', '(없음)')}\n\n"
-                    f"📅  주간 목표\n{user_profile.get('weekly_goal', '(없음)')}\n\n"
-                    "위 목표를 참고하여 인증을 작성해주세요\n", 
-                    view=view,
-                    ephemeral=True
-                )
-            else:
-                # 목표가 없는 경우: 버튼 비활성화
-                # view = StartScrumButton(channel_id, user_id, today_section or "(없음)", today_plan, has_goals=False)
-                await interaction.response.send_message(
-                    "❌ 월간 목표를 먼저 설정해주세요.\n\n"
-                    "목표를 설정하려면 `/월간목표설정` 명령어를 사용해주세요.",
-                    # view=view,
-                    ephemeral=True
-                )
-        except Exception as e:
-            logger.error(f"Error in copy_scrum command: {e}")
-            if not interaction.response.is_done():
-                await interaction.response.send_message(
-                    "❌ 명령어 실행 중 오류가 발생했습니다.", ephemeral=True
-                )
+        if not isinstance(channel, (discord.TextChannel, discord.Thread)):
+            await interaction.response.send_message(
+                "❌ 텍스트 채널에서만 사용할 수 있습니다.", ephemeral=True
+            )
+            return None
+
+        # 인덱스(없으면 DB)에서 해당 유저의 최근 인증 메시지 찾기
+        # 모달은 defer 한 뒤에 열 수 없으므로, 조회가 늦으면 기다리지 않고 다시 시도하도록 안내합니다.
+        latest = await fetch(
+            "latest_scrum",
+            lambda: scrum_index.lookup(user_id, channel_id),
+            max(deadline - asyncio.get_running_loop().time(), 0),
+            lambda: scrum_index.get(user_id, channel_id),
+        )
+        if not latest.value:
+            await interaction.response.send_message(
+                "⏳ 최근 인증을 불러오는 데 시간이 걸리고 있습니다. 잠시 후 다시 시도해주세요."
+                if latest.degraded
+                else "❌ 수정할 인증 메시지를 찾을 수 없습니다.",
+                ephemeral=True,
+            )
+            return None
+        return channel, latest.value
 
     @app_commands.command(name="인증수정", description="최근 인증 내용을 수정합니다.")
+    @observe_interaction("command", "인증수정")
     async def edit_scrum(self, interaction: Interaction):
         try:
-            channel_id = getattr(self.bot, "channel_id", None)
-            if channel_id is None:
-                await interaction.response.send_message(
-                    "❌ CHANNEL_ID가 설정되지 않았습니다.", ephemeral=True
-                )
+            found = await self._find_editable_scrum(
+                interaction, asyncio.get_running_loop().time() + MODAL_PREFETCH_TIMEOUT
+            )
+            if found is None:
                 return
+            channel, latest = found
 
-            channel = self.bot.get_channel(channel_id)
-            user_id = interaction.user.id
-            latest_msg: discord.Message | None = None
+            modal = ScrumEditModal(
+                message_to_edit=channel.get_partial_message(latest.message_id),
+                yesterday=latest.yesterday,
+                today=latest.today,
+                comment=latest.comment,
+                user_id=interaction.user.id,
+            )
+            await interaction.response.send_modal(modal)
 
-            if interaction.channel_id != channel_id:
+        except Exception as e:
+            logger.error(f"Error in edit_scrum command: {e}")
+            mark_interaction_error()
+            if not interaction.response.is_done():
                 await interaction.response.send_message(
-                    "이 채널에서는 사용할 수 없는 명령어입니다.", ephemeral=True
+                    "❌ 명령어 실행 중 오류가 발생했습니다.", ephemeral=True
                 )
-                return
 
-            if not isinstance(channel, (discord.TextChannel, discord.Thread)):
-                await interaction.response.send_message(
-                    "❌ 텍스트 채널에서만 사용할 수 있습니다.", ephemeral=True
-                )
+    @app_commands.command(name="인증기록", description="최근 인증의 수정 기록을 확인합니다.")
+    @app_commands.rename(version="버전")
+    @app_commands.describe(version="내용을 볼 버전 (비우면 최근 수정 목록을 보여줍니다)")
+    @observe_interaction("command", "인증기록")
+    async def scrum_history(self, interaction: Interaction, version: app_commands.Range[int, 0] | None = None):
+        async with InteractionReply(interaction) as reply:
+            try:
+                config = guild_configs.for_scrum_channel(interaction.channel_id)
+                if config is None:
+                    await reply.send("이 채널에서는 사용할 수 없는 명령어입니다.")
+                    return
+
+                latest = await scrum_index.lookup(interaction.user.id, config.scrum_channel_id)
+                if latest is None:
+                    await reply.send("❌ 수정 기록을 볼 인증 메시지를 찾을 수 없습니다.")
+                    return
+
+                if version is not None:
+                    found = await get_scrum_version(str(latest.message_id), version)
+                    if found is None:
+                        await reply.send(f"❌ v{version} 기록이 없습니다. `/인증기록`으로 버전을 확인해주세요.")
+                        return
+                    await reply.send(
+                        f"📜  v{found.version} ({format_history_time(found.created_at)})\n\n"
+                        + render_scrum_body(
+                            found.content["yesterday_work"], found.content["today_plan"], found.content["comment"]
+                        )
+                    )
+                    return
+
+                versions = await list_scrum_versions(str(latest.message_id), SCRUM_HISTORY_LIST_LIMIT)
+                if not versions:
+                    await reply.send("📜  최근 인증은 아직 수정한 적이 없습니다.")
+                    return
+                lines = ["📜  최근 인증의 수정 기록 (최신순)\n"]
+                for current, previous in zip(versions, [*versions[1:], None]):
+                    lines.append(format_version_line(current, previous))
+                lines.append("\n`/인증기록 버전:N` 으로 내용을 보고, `/인증되돌리기 버전:N` 으로 되돌릴 수 있습니다.")
+                await reply.send("\n".join(lines))
+            except Exception as e:
+                logger.error(f"Error in scrum_history command: {e}")
+                mark_interaction_error()
+                await reply.send_error("❌ 명령어 실행 중 오류가 발생했습니다.")
+
+    @app_commands.command(name="인증되돌리기", description="최근 인증을 이전 버전의 내용으로 되돌립니다.")
+    @app_commands.rename(version="버전")
+    @app_commands.describe(version="되돌릴 버전 (`/인증기록`에서 확인)")
+    @observe_interaction("command", "인증되돌리기")
+    async def revert_scrum(self, interaction: Interaction, version: app_commands.Range[int, 0]):
+        try:
+            # 최근 인증과 옛 버전 조회가 함께 모달 응답 한도를 나눠 씁니다.
+            deadline = asyncio.get_running_loop().time() + MODAL_PREFETCH_TIMEOUT
+            found = await self._find_editable_scrum(interaction, deadline)
+            if found is None:
                 return
+            channel, latest = found
 
-            # 최근 봇이 보낸 메시지 중 해당 유저 태그가 있는 메시지 찾기
-            async for msg in channel.history(limit=200):
-                if (
-                    msg.author.bot
-                    and f"<@{user_id}>" in msg.content
-                    and "님의 인증입니다" in msg.content
-                ):
-                    latest_msg = msg
-                    break
-
-            if not latest_msg:
+            target = await fetch(
+                "scrum_version",
+                lambda: get_scrum_version(str(latest.message_id), version),
+                max(deadline - asyncio.get_running_loop().time(), 0),
+                lambda: None,
+            )
+            if target.value is None:
                 await interaction.response.send_message(
-                    "❌ 수정할 인증 메시지를 찾을 수 없습니다.", ephemeral=True
+                    "⏳ 수정 기록을 불러오는 데 시간이 걸리고 있습니다. 잠시 후 다시 시도해주세요."
+                    if target.degraded
+                    else f"❌ v{version} 기록이 없습니다. `/인증기록`으로 버전을 확인해주세요.",
+                    ephemeral=True,
                 )
                 return
 
-            yesterday_section = extract_section(
-                latest_msg.content,
-                "🧐 어제 무엇을 했나요?",
-                "🫣 오늘 무엇을 할 계획인가요?",
-            )
-            today_section = extract_section(
-                latest_msg.content,
-                "🫣 오늘 무엇을 할 계획인가요?",
-                "😉 하고 싶은 말",
-            )
-            comment_section = extract_section(
-                latest_msg.content, "😉 하고 싶은 말", ""
-            )
-
+            # 옛 버전 내용을 채운 수정 모달을 열어, 확인하고 제출하면 새 버전으로 기록합니다. (이력은 지우지 않습니다)
             modal = ScrumEditModal(
-                message_to_edit=latest_msg,
-                yesterday=yesterday_section or "",
-                today=today_section or "",
-                comment=comment_section or "",
-                user_id=user_id,
+                message_to_edit=channel.get_partial_message(latest.message_id),
+                yesterday=target.value.content["yesterday_work"],
+                today=target.value.content["today_plan"],
+                comment=target.value.content["comment"],
+                user_id=interaction.user.id,
+                previous=latest,
             )
             await interaction.response.send_modal(modal)
 
         except Exception as e:
-            logger.error(f"Error in edit_scrum command: {e}")
+            logger.error(f"Error in revert_scrum command: {e}")
+            mark_interaction_error()
             if not interaction.response.is_done():
                 await interaction.response.send_message(
                     "❌ 명령어 실행 중 오류가 발생했습니다.", ephemeral=True
                 )
 
+    @app_commands.command(name="인증현황", description="나의 연속 인증 기록과 채널 순위를 확인합니다.")
+    @observe_interaction("command", "인증현황")
+    async def scrum_status(self, interaction: Interaction):
+        async with InteractionReply(interaction) as reply:
+            try:
+                # 인증 채널에서 실행하면 그 채널, 아니면 이 길드의 인증 채널 현황을 보여줍니다.
+                config = guild_configs.for_scrum_channel(interaction.channel_id) or guild_configs.get(interaction.guild_id)
+                if config is None:
+                    await reply.send("❌ 이 서버에는 인증 채널이 설정되지 않았습니다.")
+                    return
+
+                channel_id = config.scrum_channel_id
+                # 처음 한 번은 로컬 DB에서 집계를 읽으므로 늦어지면 defer 됩니다.
+                await streak_store.load()
+                today = streak_store.today()
+                mine = streak_store.get(channel_id, interaction.user.id)
+                if mine:
+                    days = mine.streak_on(today)
+                    lines = [
+                        f"📊  {interaction.user.display_name}님의 인증 현황\n",
+                        f"🔥 연속 인증 {days}일 {streak_badge(days)}".rstrip() + f" (최장 {mine.longest_streak}일)",
+                        f"📝 총 인증 {mine.total_posts}회",
+                        f"📅 마지막 인증 {mine.last_post_date.isoformat() if mine.last_post_date else '(없음)'}",
+                    ]
+                else:
+                    lines = ["📊  아직 인증 기록이 없습니다. `/인증복사`로 첫 인증을 남겨보세요!"]
+
+                ranking = [(streak, days) for streak, days in streak_store.leaderboard(channel_id, top=5) if days > 0]
+                if ranking:
+                    lines.append("\n🏅  연속 인증 순위")
+                    for rank, (streak, days) in enumerate(ranking, start=1):
+                        lines.append(f"{rank}. <@{streak.user_id}> {days}일 {streak_badge(days)}".rstrip())
+
+                await reply.send("\n".join(lines))
+            except Exception as e:
+                logger.error(f"Error in scrum_status command: {e}")
+                mark_interaction_error()
+                await reply.send_error("❌ 명령어 실행 중 오류가 발생했습니다.")
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(ScrumCog(bot))
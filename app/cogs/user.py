@@ -1,9 +1,13 @@
 import discord
 from discord import app_commands, Interaction, ui
 from discord.ext import commands
+from app.config import PROFILE_FETCH_TIMEOUT
 from app.log import logger
+from app.metrics import mark_interaction_error, observe_interaction
+from app.utils.interaction import InteractionReply, fetch
 
-from app.repositories.user_profiles import get_user_profile, upsert_user_profile
+from app.repositories.resilience import RepositoryTimeout, RepositoryUnavailable
+from app.repositories.user_profiles import get_user_profile, profile_cache, upsert_user_profile
 
 
 class MonthlyGoalSetModal(ui.Modal, title="🎯 월간 목표 설정"):
@@ -19,17 +23,21 @@ class MonthlyGoalSetModal(ui.Modal, title="🎯 월간 목표 설정"):
         )
         self.add_item(self.monthly_goal_input)
 
+    @observe_interaction("modal", "MonthlyGoalSetModal")
     async def on_submit(self, interaction: Interaction):
-        try:
-            await upsert_user_profile(interaction.user.id, monthly_goal=self.monthly_goal_input.value)
-            await interaction.response.send_message(
-                f"🎯 월간 목표가 설정되었습니다.", ephemeral=True
-            )
-        except Exception as e:
-            logger.error(f"Error in monthly goal set modal submit: {e}")
-            await interaction.response.send_message(
-                f"❌ 월간 목표 설정에 실패했습니다. 관리자에게 문의해주세요.", ephemeral=True
-            )
+        # DB 저장이 늦어지면 먼저 defer 합니다.
+        async with InteractionReply(interaction) as reply:
+            try:
+                await upsert_user_profile(interaction.user.id, monthly_goal=self.monthly_goal_input.value)
+                await reply.send("🎯 월간 목표가 설정되었습니다.")
+            except (RepositoryTimeout, RepositoryUnavailable) as e:
+                logger.warning(f"Repository unavailable in monthly goal set modal submit: {e}")
+                mark_interaction_error()
+                await reply.send_error("⏳ 지금은 저장소가 응답하지 않아 월간 목표를 저장하지 못했습니다. 잠시 후 다시 시도해주세요.")
+            except Exception as e:
+                logger.error(f"Error in monthly goal set modal submit: {e}")
+                mark_interaction_error()
+                await reply.send_error("❌ 월간 목표 설정에 실패했습니다. 관리자에게 문의해주세요.")
 
 
 class WeeklyGoalSetModal(ui.Modal, title="🎯 주간 목표 설정"):
@@ -45,17 +53,21 @@ class WeeklyGoalSetModal(ui.Modal, title="🎯 주간 목표 설정"):
         )
         self.add_item(self.weekly_goal_input)
         
+    @observe_interaction("modal", "WeeklyGoalSetModal")
     async def on_submit(self, interaction: Interaction):
-        try:
-            await upsert_user_profile(interaction.user.id, weekly_goal=self.weekly_goal_input.value)
-            await interaction.response.send_message(
-                f"🎯 주간 목표가 설정되었습니다.", ephemeral=True
-            )
-        except Exception as e:
-            logger.error(f"Error in weekly goal set modal submit: {e}")
-            await interaction.response.send_message(
-                f"❌ 주간 목표 설정에 실패했습니다. 관리자에게 문의해주세요.", ephemeral=True
-            )
+        # DB 저장이 늦어지면 먼저 defer 합니다.
+        async with InteractionReply(interaction) as reply:
+            try:
+                await upsert_user_profile(interaction.user.id, weekly_goal=self.weekly_goal_input.value)
+                await reply.send("🎯 주간 목표가 설정되었습니다.")
+            except (RepositoryTimeout, RepositoryUnavailable) as e:
+                logger.warning(f"Repository unavailable in weekly goal set modal submit: {e}")
+                mark_interaction_error()
+                await reply.send_error("⏳ 지금은 저장소가 응답하지 않아 주간 목표를 저장하지 못했습니다. 잠시 후 다시 시도해주세요.")
+            except Exception as e:
+                logger.error(f"Error in weekly goal set modal submit: {e}")
+                mark_interaction_error()
+                await reply.send_error("❌ 주간 목표 설정에 실패했습니다. 관리자에게 문의해주세요.")
 
 
 class RoutineSetModal(ui.Modal, title="🎯 루틴 설정"):
@@ -71,17 +83,21 @@ class RoutineSetModal(ui.Modal, title="🎯 루틴 설정"):
         )
         self.add_item(self.routine_input)
         
+    @observe_interaction("modal", "RoutineSetModal")
     async def on_submit(self, interaction: Interaction):
-        try:
-            await upsert_user_profile(interaction.user.id, routine=self.routine_input.value)
-            await interaction.response.send_message(
-                f"🎯 루틴이 설정되었습니다.", ephemeral=True
-            )
-        except Exception as e:
-            logger.error(f"Error in routine set modal submit: {e}")
-            await interaction.response.send_message(
-                f"❌ 루틴 설정에 실패했습니다. 관리자에게 문의해주세요.", ephemeral=True
-            )
+        # DB 저장이 늦어지면 먼저 defer 합니다.
+        async with InteractionReply(interaction) as reply:
+            try:
+                await upsert_user_profile(interaction.user.id, routine=self.routine_input.value)
+                await reply.send("🎯 루틴이 설정되었습니다.")
+            except (RepositoryTimeout, RepositoryUnavailable) as e:
+                logger.warning(f"Repository unavailable in routine set modal submit: {e}")
+                mark_interaction_error()
+                await reply.send_error("⏳ 지금은 저장소가 응답하지 않아 루틴을 저장하지 못했습니다. 잠시 후 다시 시도해주세요.")
+            except Exception as e:
+                logger.error(f"Error in routine set modal submit: {e}")
+                mark_interaction_error()
+                await reply.send_error("❌ 루틴 설정에 실패했습니다. 관리자에게 문의해주세요.")
 
 
 class UserCog(commands.Cog, name="User"):
@@ -89,53 +105,68 @@ class UserCog(commands.Cog, name="User"):
         self.bot = bot
 
     @app_commands.command(name="내프로필조회", description="유저 프로필을 조회합니다.")
+    @observe_interaction("command", "내프로필조회")
     async def view_profile(self, interaction: Interaction):
-
-        user_id = interaction.user.id
-        profile = await get_user_profile(user_id)
-
-        if not profile:
-            await interaction.response.send_message(
-                f"🥲 유저 프로필을 찾을 수 없습니다. 관리자에게 문의해주세요.", ephemeral=True
-            )
-            return
-        
-        await interaction.response.send_message(
-            f"👤 {interaction.user.display_name}님의 프로필\n\n"
-            f"🎯 월간 목표\n\t{profile.get('monthly_goal', '없음')}\n\n"
-            f"🎯 주간 목표\n\t{profile.get('weekly_goal', '없음')}\n\n"
-            f"🎯 루틴\n\t{profile.get('routine', '없음')}", 
-            ephemeral=True
-        )       
+        async with InteractionReply(interaction) as reply:
+            try:
+                user_id = interaction.user.id
+                if str(user_id) not in profile_cache:
+                    await reply.defer()
+                profile = await fetch("user_profile", lambda: get_user_profile(user_id), PROFILE_FETCH_TIMEOUT, lambda: None)
+
+                if profile.degraded:
+                    await reply.send("⏳ 지금은 프로필을 불러올 수 없습니다. 잠시 후 다시 시도해주세요.")
+                    return
+
+                if not profile.value:
+                    await reply.send("🥲 유저 프로필을 찾을 수 없습니다. 관리자에게 문의해주세요.")
+                    return
+
+                await reply.send(
+                    f"👤 {interaction.user.display_name}님의 프로필\n\n"
+                    f"🎯 월간 목표\n\t{profile.value.get('monthly_goal', '없음')}\n\n"
+                    f"🎯 주간 목표\n\t{profile.value.get('weekly_goal', '없음')}\n\n"
+                    f"🎯 루틴\n\t{profile.value.get('routine', '없음')}"
+                )
+            except Exception as e:
+                logger.error(f"Error in view_profile command: {e}")
+                mark_interaction_error()
+                await reply.send_error("❌ 명령어 실행 중 오류가 발생했습니다.")
 
     @app_commands.command(name="월간목표설정", description="월간 목표를 설정합니다.")
+    @observe_interaction("command", "월간목표설정")
     async def set_monthly_goal(self, interaction: Interaction):
         try:
             await interaction.response.send_modal(MonthlyGoalSetModal())
         except Exception as e:
             logger.error(f"Error in set_monthly_goal command: {e}")
+            mark_interaction_error()
             await interaction.response.send_message(
                 f"❌ 월간 목표 설정 모달을 열 수 없습니다. 관리자에게 문의해주세요.", 
                 ephemeral=True
             )
 
     @app_commands.command(name="주간목표설정", description="주간 목표를 설정합니다.")
+    @observe_interaction("command", "주간목표설정")
     async def set_weekly_goal(self, interaction: Interaction):
         try:
             await interaction.response.send_modal(WeeklyGoalSetModal())
         except Exception as e:
             logger.error(f"Error in set_weekly_goal command: {e}")
+            mark_interaction_error()
             await interaction.response.send_message(
                 f"❌ 주간 목표 설정 모달을 열 수 없습니다. 관리자에게 문의해주세요.", 
                 ephemeral=True
             )
 
     @app_commands.command(name="루틴설정", description="루틴을 설정합니다.")
+    @observe_interaction("command", "루틴설정")
     async def set_routine(self, interaction: Interaction):
         try:
             await interaction.response.send_modal(RoutineSetModal())
         except Exception as e:
             logger.error(f"Error in set_routine command: {e}")
+            mark_interaction_error()
             await interaction.response.send_message(
                 f"❌ 루틴 설정 모달을 열 수 없습니다. 관리자에게 문의해주세요.", 
                 ephemeral=True
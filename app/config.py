@@ -14,7 +14,109 @@ CHANNEL_ID = int(os.getenv("CHANNEL_ID", 0))
 GUILD_ID = int(os.getenv("GUILD_ID", 0))
 ADMIN_CHANNEL_ID = int(os.getenv("ADMIN_CHANNEL_ID", 1396068768798478386)) # 관리자 채널
 
-if not DISCORD_TOKEN or not CHANNEL_ID:
-    logger.error("DISCORD_TOKEN과 CHANNEL_ID 환경변수를 모두 설정하세요.")
-    raise ValueError("DISCORD_TOKEN과 CHANNEL_ID 환경변수를 모두 설정하세요.")
+# 저장소 환경변수
+REPOSITORY_BACKEND = os.getenv("REPOSITORY_BACKEND", "supabase")  # supabase | memory | sqlite
+SQLITE_DB_PATH = os.getenv("SQLITE_DB_PATH", "data/scrum.db")  # REPOSITORY_BACKEND=sqlite 일 때 사용할 파일
+
+# HTTP 커넥션 풀 환경변수
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", 100))  # 전체 최대 연결 수
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", 20))  # 호스트당 최대 연결 수
+HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", 30))  # 유휴 연결 유지 시간(초)
+HTTP_DNS_CACHE_TTL = int(os.getenv("HTTP_DNS_CACHE_TTL", 300))  # DNS 캐시 유지 시간(초)
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 10))  # 아웃바운드 요청 타임아웃(초)
+
+# 캐시 환경변수
+PROFILE_CACHE_TTL = float(os.getenv("PROFILE_CACHE_TTL", 600))  # 유저 프로필 캐시 유지 시간(초)
+PROFILE_CACHE_MAXSIZE = int(os.getenv("PROFILE_CACHE_MAXSIZE", 1000))  # 유저 프로필 캐시 최대 항목 수
+SCRUM_INDEX_TOMBSTONES = int(os.getenv("SCRUM_INDEX_TOMBSTONES", 10000))  # 최근 인증 인덱스가 기억할 삭제된 메시지 수 (오래된 것부터 잊음)
+
+# 저장소 호출 보호 환경변수
+REPOSITORY_TIMEOUT = float(os.getenv("REPOSITORY_TIMEOUT", 2.0))  # 저장소 호출 한 번의 시간 한도(초)
+REPOSITORY_DEADLINE = float(os.getenv("REPOSITORY_DEADLINE", 4.0))  # 재시도를 포함한 전체 시간 한도(초)
+REPOSITORY_BULK_TIMEOUT = float(os.getenv("REPOSITORY_BULK_TIMEOUT", 30.0))  # 많은 행을 읽고 쓰는 호출(백필, 재계산 등)의 시간 한도(초)
+REPOSITORY_RETRIES = int(os.getenv("REPOSITORY_RETRIES", 2))  # 멱등 호출의 최대 재시도 횟수
+REPOSITORY_RETRY_BASE_DELAY = float(os.getenv("REPOSITORY_RETRY_BASE_DELAY", 0.1))  # 재시도 백오프 기준 시간(초), 0~기준*2^n 사이에서 무작위로 기다림
+REPOSITORY_BREAKER_THRESHOLD = int(os.getenv("REPOSITORY_BREAKER_THRESHOLD", 5))  # 이만큼 연속 실패하면 회로를 엶 (0이면 끔)
+REPOSITORY_BREAKER_RESET = float(os.getenv("REPOSITORY_BREAKER_RESET", 30))  # 회로를 연 뒤 시험 호출까지 기다리는 시간(초)
+REPOSITORY_READ_HEDGE_AFTER = float(os.getenv("REPOSITORY_READ_HEDGE_AFTER", 0.3))  # 유저 프로필 조회가 이 시간(초) 안에 끝나지 않으면 한 번 더 요청 (0이면 끔)
+
+# 스크럼 인증 write-behind 큐 환경변수
+SCRUM_WRITE_BATCH_SIZE = int(os.getenv("SCRUM_WRITE_BATCH_SIZE", 20))  # 한 번에 insert 할 최대 건수
+SCRUM_WRITE_FLUSH_INTERVAL = float(os.getenv("SCRUM_WRITE_FLUSH_INTERVAL", 2))  # 배치를 모으는 최대 시간(초)
+SCRUM_WRITE_MAX_RETRIES = int(os.getenv("SCRUM_WRITE_MAX_RETRIES", 3))  # 배치 insert 재시도 횟수
+
+# 로컬 저장소(SQLite) 환경변수
+LOCAL_DB_PATH = os.getenv("LOCAL_DB_PATH", "data/local.db")  # outbox 등 로컬 상태를 보관할 파일
+OUTBOX_REPLAY_BATCH_SIZE = int(os.getenv("OUTBOX_REPLAY_BATCH_SIZE", 50))  # 한 번에 재전송할 최대 작업 수
+OUTBOX_MAX_BACKOFF = float(os.getenv("OUTBOX_MAX_BACKOFF", 300))  # 재전송 백오프 최대 시간(초)
+
+# 히스토리 백필 환경변수
+BACKFILL_PAGE_SIZE = int(os.getenv("BACKFILL_PAGE_SIZE", 100))  # 한 번에 읽을 메시지 수 (디스코드 최대 100)
+BACKFILL_REQUESTS_PER_SECOND = float(os.getenv("BACKFILL_REQUESTS_PER_SECOND", 2))  # 백필이 쓸 수 있는 REST 호출 예산
+BACKFILL_REPORT_EVERY = int(os.getenv("BACKFILL_REPORT_EVERY", 20))  # 진행 상황을 보고할 페이지 간격
+
+# 인증 현황(연속 인증) 환경변수
+SCRUM_TIMEZONE = os.getenv("SCRUM_TIMEZONE", "Asia/Seoul")  # 인증 날짜를 나누는 기준 시간대
+STREAK_REBUILD_PAGE_SIZE = int(os.getenv("STREAK_REBUILD_PAGE_SIZE", 1000))  # 재계산 시 한 번에 읽을 인증 수
+
+# 인증 수정 이력 환경변수
+SCRUM_HISTORY_SNAPSHOT_EVERY = int(os.getenv("SCRUM_HISTORY_SNAPSHOT_EVERY", 8))  # 이 버전 간격마다 델타 대신 전체 내용을 저장 (복원 시 읽는 최대 행 수)
+SCRUM_HISTORY_LIST_LIMIT = int(os.getenv("SCRUM_HISTORY_LIST_LIMIT", 10))  # /인증기록 에 보여줄 최근 버전 수
+
+# 인증 내보내기 환경변수
+EXPORT_PAGE_SIZE = int(os.getenv("EXPORT_PAGE_SIZE", 1000))  # 내보낼 때 한 번에 읽을 인증 수
+EXPORT_DIR = os.getenv("EXPORT_DIR", "data/exports")  # 내보낸 파일을 저장할 디렉터리
+EXPORT_MAX_UPLOAD_BYTES = int(os.getenv("EXPORT_MAX_UPLOAD_BYTES", 8 * 2**20))  # 이 크기 이하면 관리자 채널에 첨부, 넘으면 디스크에만 남김
+
+# 인증 알림(DM) 환경변수
+REMINDER_ENABLED = os.getenv("REMINDER_ENABLED", "1") == "1"  # 오늘 인증하지 않은 유저에게 설정한 시각에 DM 알림을 보낼지
+REMINDER_DM_RATE = float(os.getenv("REMINDER_DM_RATE", 5))  # 초당 보낼 DM 수 (디스코드 전역 한도 50회/초 안에서 다른 요청 몫을 남김)
+REMINDER_DM_BURST = int(os.getenv("REMINDER_DM_BURST", 5))  # 한 번에 몰아 보낼 수 있는 DM 수
+REMINDER_LATE_GRACE = float(os.getenv("REMINDER_LATE_GRACE", 600))  # 재시작 등으로 지난 알림도 이 시간(초) 안이면 보냄
+
+# 트레이싱/프로파일링 환경변수
+TRACE_SLOW_THRESHOLD = float(os.getenv("TRACE_SLOW_THRESHOLD", 1.0))  # 이 시간(초) 이상 걸린 인터랙션은 span 트리를 로그로 남김 (0이면 끔)
+PROFILE_MAX_SECONDS = int(os.getenv("PROFILE_MAX_SECONDS", 300))  # /프로파일링 최대 측정 시간(초)
+
+# 채널 메시지 스케줄러 환경변수
+OUTBOUND_CHANNEL_RATE = float(os.getenv("OUTBOUND_CHANNEL_RATE", 1))  # 채널당 초당 전송(수정) 수 (디스코드 채널 버킷 5회/5초, 0이면 응답 헤더로만 조절)
+OUTBOUND_CHANNEL_BURST = int(os.getenv("OUTBOUND_CHANNEL_BURST", 5))  # 채널당 한 번에 몰아 보낼 수 있는 수
+OUTBOUND_ACK_TIMEOUT = float(os.getenv("OUTBOUND_ACK_TIMEOUT", 1.0))  # 게시 결과를 기다렸다 응답할 최대 시간(초), 넘으면 먼저 응답하고 나중에 고침
+
+# 샤딩/클러스터 환경변수 (클러스터 런처 app/cluster.py 가 워커마다 SHARD_*/CLUSTER_ID/CLUSTER_SIZE 를 설정합니다)
+SHARDING = os.getenv("SHARDING", "0") == "1"  # AutoShardedBot 으로 실행
+SHARD_COUNT = int(os.getenv("SHARD_COUNT", 0))  # 전체 샤드 수 (0이면 디스코드 권장값)
+SHARD_IDS = [int(shard_id) for shard_id in os.getenv("SHARD_IDS", "").split(",") if shard_id.strip()]  # 이 프로세스가 맡을 샤드 (비우면 전체)
+CLUSTER_WORKERS = int(os.getenv("CLUSTER_WORKERS", 0))  # 런처가 띄울 워커 프로세스 수 (0이면 CPU 코어 수)
+CLUSTER_ID = int(os.getenv("CLUSTER_ID", 0))  # 워커 번호 (0번 워커가 커맨드 동기화와 outbox 재전송을 맡음)
+CLUSTER_SIZE = int(os.getenv("CLUSTER_SIZE", 1))  # 전체 워커 수
+CLUSTER_STATE_DIR = os.getenv("CLUSTER_STATE_DIR", "data/cluster")  # 워커가 상태/지표 스냅샷을 남기는 디렉터리
+CLUSTER_REPORT_INTERVAL = float(os.getenv("CLUSTER_REPORT_INTERVAL", 5))  # 워커 상태/지표 스냅샷 주기(초)
+CACHE_BUS_POLL_INTERVAL = float(os.getenv("CACHE_BUS_POLL_INTERVAL", 1))  # 다른 워커의 캐시 무효화를 확인하는 주기(초)
+
+# 헬스체크/지표 서버 환경변수
+WEB_SERVER_ENABLED = os.getenv("WEB_SERVER_ENABLED", "1") == "1"  # 이 프로세스에서 헬스체크/지표 서버를 띄울지 (클러스터 워커는 끔)
+WEB_SERVER_PORT = int(os.getenv("WEB_SERVER_PORT", 8000))  # 헬스체크/지표 서버 포트
+
+# 길드 설정 환경변수
+GUILD_CONFIG_REFRESH_INTERVAL = float(os.getenv("GUILD_CONFIG_REFRESH_INTERVAL", 300))  # DB의 길드별 채널 설정을 다시 읽는 주기(초)
+
+# 인터랙션 응답 환경변수 (디스코드는 3초 안에 첫 응답이 없으면 인터랙션 실패로 처리)
+INTERACTION_DEFER_AFTER = float(os.getenv("INTERACTION_DEFER_AFTER", 1.5))  # 응답이 이 시간(초)을 넘기면 defer 로 먼저 응답
+PROFILE_FETCH_TIMEOUT = float(os.getenv("PROFILE_FETCH_TIMEOUT", 2.5))  # 유저 프로필 조회를 기다리는 최대 시간(초), 넘으면 목표 없이 진행
+LATEST_SCRUM_FETCH_TIMEOUT = float(os.getenv("LATEST_SCRUM_FETCH_TIMEOUT", 2.5))  # 최근 인증 조회를 기다리는 최대 시간(초), 넘으면 캐시/빈 값으로 진행
+MODAL_PREFETCH_TIMEOUT = float(os.getenv("MODAL_PREFETCH_TIMEOUT", 2.0))  # 모달을 여는 커맨드의 조회 시간 한도(초) (모달은 defer 할 수 없음)
+
+# 디스코드 캐시 정책 환경변수
+DISCORD_MAX_MESSAGES = int(os.getenv("DISCORD_MAX_MESSAGES", 0))  # 메시지 캐시 크기 (0이면 끔, 봇은 raw 이벤트만 사용)
+DISCORD_MESSAGE_CACHE_SCOPE = os.getenv("DISCORD_MESSAGE_CACHE_SCOPE", "scrum")  # scrum(인증 채널 메시지만 보관) | all
+DISCORD_MEMBER_CACHE = os.getenv("DISCORD_MEMBER_CACHE", "0") == "1"  # 멤버 인텐트와 멤버 캐시 사용 (특권 인텐트)
+DISCORD_CHUNK_GUILDS = os.getenv("DISCORD_CHUNK_GUILDS", "0") == "1"  # 시작할 때 길드 멤버 목록을 모두 받아올지 (멤버 캐시를 켤 때만)
+
+if not DISCORD_TOKEN:
+    logger.error("DISCORD_TOKEN 환경변수를 설정하세요.")
+    raise ValueError("DISCORD_TOKEN 환경변수를 설정하세요.")
+if not CHANNEL_ID:
+    # 길드별 인증 채널은 /채널설정 으로 지정하며, CHANNEL_ID는 GUILD_ID 길드의 기본 인증 채널로만 쓰입니다.
+    logger.warning("CHANNEL_ID가 설정되지 않았습니다. /채널설정 으로 길드별 인증 채널을 지정하세요.")
 
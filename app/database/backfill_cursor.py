@@ -0,0 +1,61 @@
+import time
+from dataclasses import dataclass
+
+from app.database.local import LocalDatabase, local_db
+
+
+BACKFILL_CURSOR_SCHEMA = """
+CREATE TABLE IF NOT EXISTS backfill_cursors (
+    channel_id TEXT PRIMARY KEY,
+    last_message_id TEXT NOT NULL,
+    scanned INTEGER NOT NULL DEFAULT 0,
+    imported INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class BackfillCursor:
+    channel_id: str
+    last_message_id: int
+    scanned: int
+    imported: int
+
+
+class BackfillCursorStore:
+    """채널 히스토리 백필이 어디까지 진행됐는지 로컬 DB에 저장합니다."""
+
+    def __init__(self, db: LocalDatabase):
+        self.db = db
+        self._ready = False
+
+    async def _ensure_schema(self) -> None:
+        if not self._ready:
+            await self.db.executescript(BACKFILL_CURSOR_SCHEMA)
+            self._ready = True
+
+    async def get(self, channel_id: str) -> BackfillCursor | None:
+        await self._ensure_schema()
+        row = await self.db.fetchone(
+            "SELECT channel_id, last_message_id, scanned, imported FROM backfill_cursors WHERE channel_id = ?",
+            (str(channel_id),),
+        )
+        if row is None:
+            return None
+        return BackfillCursor(row["channel_id"], int(row["last_message_id"]), row["scanned"], row["imported"])
+
+    async def save(self, cursor: BackfillCursor) -> None:
+        await self._ensure_schema()
+        await self.db.execute(
+            "INSERT OR REPLACE INTO backfill_cursors (channel_id, last_message_id, scanned, imported, updated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (cursor.channel_id, str(cursor.last_message_id), cursor.scanned, cursor.imported, time.time()),
+        )
+
+    async def reset(self, channel_id: str) -> None:
+        await self._ensure_schema()
+        await self.db.execute("DELETE FROM backfill_cursors WHERE channel_id = ?", (str(channel_id),))
+
+
+backfill_cursors = BackfillCursorStore(local_db)
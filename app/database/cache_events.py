@@ -0,0 +1,116 @@
+import asyncio
+import inspect
+import os
+import time
+from typing import Awaitable, Callable
+
+from app.config import CACHE_BUS_POLL_INTERVAL, CLUSTER_ID, CLUSTER_SIZE
+from app.database.local import LocalDatabase, local_db
+from app.log import logger
+
+
+CACHE_EVENTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cache TEXT NOT NULL,
+    key TEXT NOT NULL,
+    origin TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+# 이보다 오래된 무효화 이벤트는 지웁니다. (모든 워커가 이미 읽었을 시간)
+CACHE_EVENT_RETENTION = 3600
+
+
+class CacheInvalidationBus:
+    """클러스터 워커끼리 메모리 캐시 무효화를 전달하는 로컬 DB 기반 이벤트 버스입니다.
+
+    워커들은 같은 로컬 DB 파일(WAL)을 공유하므로, 한 워커가 남긴 무효화 이벤트를
+    다른 워커가 주기적으로 읽어 자기 캐시에서 해당 키를 지웁니다.
+    워커가 하나뿐이면(클러스터가 아니면) 아무 일도 하지 않습니다.
+    """
+
+    def __init__(self, db: LocalDatabase, enabled: bool, origin: str):
+        self.db = db
+        self.enabled = enabled
+        self.origin = origin
+        self._ready = False
+        self._last_id = 0
+        self._handlers: dict[str, list[Callable[[str], Awaitable[None] | None]]] = {}
+
+    async def _ensure_schema(self) -> None:
+        if not self._ready:
+            await self.db.executescript(CACHE_EVENTS_SCHEMA)
+            # 시작 전에 쌓인 이벤트는 이미 DB에 반영된 것이므로 건너뜁니다.
+            row = await self.db.fetchone("SELECT COALESCE(MAX(id), 0) AS last_id FROM cache_events")
+            self._last_id = row["last_id"] if row else 0
+            self._ready = True
+
+    def subscribe(self, cache: str, handler: Callable[[str], Awaitable[None] | None]) -> None:
+        """다른 워커에서 cache 의 키가 무효화되면 handler(key)를 호출합니다."""
+        self._handlers.setdefault(cache, []).append(handler)
+
+    async def publish(self, cache: str, key: str) -> None:
+        """이 워커에서 바뀐 키를 다른 워커에 알립니다.
+
+        실패해도 예외를 올리지 않습니다. 다른 워커의 캐시는 TTL 이 지나면 어차피 다시 읽힙니다.
+        """
+        if not self.enabled:
+            return
+        try:
+            await self._ensure_schema()
+            await self.db.execute(
+                "INSERT INTO cache_events (cache, key, origin, created_at) VALUES (?, ?, ?, ?)",
+                (cache, str(key), self.origin, time.time()),
+            )
+        except Exception as e:
+            logger.warning(f"캐시 무효화 이벤트 기록 실패 ({cache}:{key}): {e}")
+
+    async def poll(self) -> int:
+        """새 이벤트를 읽어 구독자에게 전달하고, 처리한 (다른 워커의) 이벤트 수를 반환합니다."""
+        await self._ensure_schema()
+        rows = await self.db.fetchall(
+            "SELECT id, cache, key, origin FROM cache_events WHERE id > ? ORDER BY id",
+            (self._last_id,),
+        )
+        handled = 0
+        for row in rows:
+            self._last_id = row["id"]
+            if row["origin"] == self.origin:
+                continue
+            handled += 1
+            for handler in self._handlers.get(row["cache"], []):
+                try:
+                    result = handler(row["key"])
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    logger.warning(f"캐시 무효화 처리 실패 ({row['cache']}:{row['key']}): {e}")
+        return handled
+
+    async def prune(self) -> None:
+        await self._ensure_schema()
+        await self.db.execute(
+            "DELETE FROM cache_events WHERE created_at < ?", (time.time() - CACHE_EVENT_RETENTION,)
+        )
+
+    async def run(self, is_closed: Callable[[], bool], interval: float = CACHE_BUS_POLL_INTERVAL) -> None:
+        """is_closed()가 참이 될 때까지 주기적으로 이벤트를 읽습니다."""
+        if not self.enabled:
+            return
+        # 시작 시점의 마지막 이벤트 위치를 먼저 잡아 둡니다.
+        await self._ensure_schema()
+        last_prune = time.monotonic()
+        while not is_closed():
+            await asyncio.sleep(interval)
+            try:
+                await self.poll()
+                if CLUSTER_ID == 0 and time.monotonic() - last_prune > CACHE_EVENT_RETENTION:
+                    await self.prune()
+                    last_prune = time.monotonic()
+            except Exception as e:
+                logger.warning(f"캐시 무효화 이벤트 조회 실패: {e}")
+
+
+cache_bus = CacheInvalidationBus(local_db, enabled=CLUSTER_SIZE > 1, origin=f"{CLUSTER_ID}:{os.getpid()}")
@@ -0,0 +1,40 @@
+import time
+
+from app.database.local import LocalDatabase, local_db
+
+
+COMMAND_SYNC_SCHEMA = """
+CREATE TABLE IF NOT EXISTS command_sync_state (
+    scope TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+class CommandSyncStore:
+    """슬래시 커맨드를 마지막으로 동기화했을 때의 커맨드 트리 해시를 범위(길드/전역)별로 저장합니다."""
+
+    def __init__(self, db: LocalDatabase):
+        self.db = db
+        self._ready = False
+
+    async def _ensure_schema(self) -> None:
+        if not self._ready:
+            await self.db.executescript(COMMAND_SYNC_SCHEMA)
+            self._ready = True
+
+    async def get(self, scope: str) -> str | None:
+        await self._ensure_schema()
+        row = await self.db.fetchone("SELECT fingerprint FROM command_sync_state WHERE scope = ?", (scope,))
+        return row["fingerprint"] if row else None
+
+    async def save(self, scope: str, fingerprint: str) -> None:
+        await self._ensure_schema()
+        await self.db.execute(
+            "INSERT OR REPLACE INTO command_sync_state (scope, fingerprint, synced_at) VALUES (?, ?, ?)",
+            (scope, fingerprint, time.time()),
+        )
+
+
+command_sync_state = CommandSyncStore(local_db)
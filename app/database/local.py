@@ -0,0 +1,65 @@
+import asyncio
+import os
+import sqlite3
+import threading
+from typing import Any, Callable
+
+from app.config import LOCAL_DB_PATH
+
+
+class LocalDatabase:
+    """봇 프로세스 전용 로컬 SQLite(WAL) 저장소입니다.
+
+    sqlite3 호출은 블로킹이므로 모두 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            dirname = os.path.dirname(self.path)
+            if dirname:
+                os.makedirs(dirname, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+        return self._conn
+
+    def _call(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                return fn(conn)
+
+    async def run(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        """fn(conn)을 하나의 트랜잭션으로 스레드에서 실행합니다."""
+        return await asyncio.to_thread(self._call, fn)
+
+    async def execute(self, sql: str, params: tuple | dict = ()) -> int:
+        return await self.run(lambda conn: conn.execute(sql, params).rowcount)
+
+    async def executemany(self, sql: str, params: list) -> int:
+        return await self.run(lambda conn: conn.executemany(sql, params).rowcount)
+
+    async def executescript(self, script: str) -> None:
+        await self.run(lambda conn: conn.executescript(script))
+
+    async def fetchall(self, sql: str, params: tuple | dict = ()) -> list[sqlite3.Row]:
+        return await self.run(lambda conn: conn.execute(sql, params).fetchall())
+
+    async def fetchone(self, sql: str, params: tuple | dict = ()) -> sqlite3.Row | None:
+        return await self.run(lambda conn: conn.execute(sql, params).fetchone())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+local_db = LocalDatabase(LOCAL_DB_PATH)
@@ -0,0 +1,3 @@
+-- message_id 기준 멱등 upsert(outbox 재전송, 백필)를 위해 유니크 인덱스로 교체합니다.
+DROP INDEX IF EXISTS idx_scrum_entries_message_id;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_scrum_entries_message_id ON scrum_entries(message_id);
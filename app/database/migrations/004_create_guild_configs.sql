@@ -0,0 +1,40 @@
+-- Create guild configs table
+-- 길드(디스코드 서버)마다 인증 채널과 관리자 채널을 지정합니다. 봇 하나가 여러 서버를 함께 운영합니다.
+CREATE TABLE IF NOT EXISTS guild_configs (
+    guild_id TEXT PRIMARY KEY,
+    scrum_channel_id TEXT NOT NULL UNIQUE,
+    admin_channel_id TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ
+);
+
+-- Add table comment
+COMMENT ON TABLE guild_configs IS '길드별 인증/관리자 채널 설정';
+
+-- 채널 단위 조회(최근 인증, 채널 인증 목록)를 위한 인덱스
+CREATE INDEX IF NOT EXISTS idx_scrum_entries_user_channel_created_at ON scrum_entries(user_id, channel_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_scrum_entries_channel_created_at ON scrum_entries(channel_id, created_at DESC);
+
+-- RLS 정책 설정
+
+-- Enable RLS
+ALTER TABLE IF EXISTS guild_configs ENABLE ROW LEVEL SECURITY;
+
+-- 읽기 정책
+CREATE POLICY "anon_read_policy" ON guild_configs
+    FOR SELECT
+    TO anon
+    USING (true);
+
+-- 생성 정책
+CREATE POLICY "anon_insert_policy" ON guild_configs
+    FOR INSERT
+    TO anon
+    WITH CHECK (true);
+
+-- 수정 정책
+CREATE POLICY "anon_update_policy" ON guild_configs
+    FOR UPDATE
+    TO anon
+    USING (true)
+    WITH CHECK (true);
@@ -0,0 +1,34 @@
+-- Create scrum entry edits table
+-- 인증 수정 이력을 추가 전용(append-only)으로 보관합니다.
+-- version 0 은 수정 전 원본이며, 이후 버전은 직전 버전에 대한 텍스트 델타(kind = 'delta')로 저장하고
+-- 일정 간격마다 전체 내용(kind = 'snapshot')을 저장해 어느 버전이든 몇 행만 읽어 복원할 수 있게 합니다.
+CREATE TABLE IF NOT EXISTS scrum_entry_edits (
+    id BIGSERIAL PRIMARY KEY,
+    message_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    kind TEXT NOT NULL CHECK (kind IN ('snapshot', 'delta')),
+    payload JSONB NOT NULL,
+    edited_by TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    UNIQUE (message_id, version)
+);
+
+-- Add table comment
+COMMENT ON TABLE scrum_entry_edits IS '스크럼 인증 수정 이력 (델타 + 주기적 스냅샷)';
+
+-- RLS 정책 설정
+
+-- Enable RLS
+ALTER TABLE IF EXISTS scrum_entry_edits ENABLE ROW LEVEL SECURITY;
+
+-- 읽기 정책
+CREATE POLICY "anon_read_policy" ON scrum_entry_edits
+    FOR SELECT
+    TO anon
+    USING (true);
+
+-- 생성 정책 (이력은 수정/삭제하지 않으므로 UPDATE/DELETE 정책은 두지 않습니다)
+CREATE POLICY "anon_insert_policy" ON scrum_entry_edits
+    FOR INSERT
+    TO anon
+    WITH CHECK (true);
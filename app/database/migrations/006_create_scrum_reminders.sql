@@ -0,0 +1,38 @@
+-- Create scrum reminders table
+-- 길드마다 유저가 원하는 인증 알림 시각(설정한 시간대 기준 HH:MM)을 저장합니다.
+-- 봇은 하루에 한 번 길드별로 알림을 읽어 메모리의 스케줄러에 올립니다. (remind_at 이 NULL 이면 알림을 끈 것)
+CREATE TABLE IF NOT EXISTS scrum_reminders (
+    guild_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    remind_at TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ,
+    PRIMARY KEY (guild_id, user_id)
+);
+
+-- Add table comment
+COMMENT ON TABLE scrum_reminders IS '길드별 유저 인증 알림 시각';
+
+-- RLS 정책 설정
+
+-- Enable RLS
+ALTER TABLE IF EXISTS scrum_reminders ENABLE ROW LEVEL SECURITY;
+
+-- 읽기 정책
+CREATE POLICY "anon_read_policy" ON scrum_reminders
+    FOR SELECT
+    TO anon
+    USING (true);
+
+-- 생성 정책
+CREATE POLICY "anon_insert_policy" ON scrum_reminders
+    FOR INSERT
+    TO anon
+    WITH CHECK (true);
+
+-- 수정 정책
+CREATE POLICY "anon_update_policy" ON scrum_reminders
+    FOR UPDATE
+    TO anon
+    USING (true)
+    WITH CHECK (true);
@@ -0,0 +1,161 @@
+import json
+import random
+import sqlite3
+import time
+from dataclasses import dataclass
+
+from app.database.local import LocalDatabase, local_db
+
+
+OUTBOX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scrum_outbox (
+    message_id TEXT NOT NULL,
+    op TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    next_attempt_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (message_id, op)
+);
+CREATE INDEX IF NOT EXISTS idx_scrum_outbox_next_attempt_at ON scrum_outbox(next_attempt_at);
+"""
+
+OP_CREATE = "create"
+OP_UPDATE = "update"
+
+# 생성 작업 payload 에 빠져 있을 수 있는 scrum_entries 컬럼의 기본값
+# 재전송 배치 upsert 는 모든 행의 키를 합친 컬럼으로 보내므로, 행마다 같은 컬럼을 채워 NULL 이 들어가지 않게 합니다.
+CREATE_PAYLOAD_DEFAULTS = {"comment": "", "updated_at": None, "is_edited": False}
+
+
+def _create_payload(payload: dict) -> dict:
+    return {**CREATE_PAYLOAD_DEFAULTS, **payload}
+
+
+@dataclass
+class OutboxItem:
+    message_id: str
+    op: str
+    payload: dict
+    attempts: int
+
+
+class ScrumOutbox:
+    """Supabase에 아직 반영되지 않은 스크럼 인증 생성/수정을 보관하는 로컬 outbox입니다.
+
+    message_id와 작업 종류(create/update)로 키를 잡으므로 같은 메시지의 작업은 하나로 합쳐집니다.
+    """
+
+    def __init__(self, db: LocalDatabase):
+        self.db = db
+        self._ready = False
+
+    async def _ensure_schema(self) -> None:
+        if not self._ready:
+            await self.db.executescript(OUTBOX_SCHEMA)
+            self._ready = True
+
+    async def put_create(self, entry: dict, delay: float = 0) -> None:
+        """생성 작업을 기록합니다. delay 초 동안은 재전송 대상에서 제외됩니다."""
+        await self._ensure_schema()
+        now = time.time()
+        await self.db.execute(
+            "INSERT OR REPLACE INTO scrum_outbox (message_id, op, payload, next_attempt_at, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (entry["message_id"], OP_CREATE, json.dumps(entry, ensure_ascii=False), now + delay, now),
+        )
+
+    async def put_update(self, message_id: str, data: dict) -> bool:
+        """수정 작업을 기록합니다.
+
+        대기 중인 생성 작업이 있으면 그 내용에 합치고 False를, 별도의 수정 작업으로 기록했으면 True를 반환합니다.
+        """
+        await self._ensure_schema()
+
+        def _put(conn: sqlite3.Connection) -> bool:
+            row = conn.execute(
+                "SELECT payload FROM scrum_outbox WHERE message_id = ? AND op = ?",
+                (message_id, OP_CREATE),
+            ).fetchone()
+            if row is not None:
+                payload = _create_payload({**json.loads(row["payload"]), **data})
+                conn.execute(
+                    "UPDATE scrum_outbox SET payload = ? WHERE message_id = ? AND op = ?",
+                    (json.dumps(payload, ensure_ascii=False), message_id, OP_CREATE),
+                )
+                return False
+
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO scrum_outbox (message_id, op, payload, next_attempt_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (message_id, OP_UPDATE, json.dumps(data, ensure_ascii=False), now, now),
+            )
+            return True
+
+        return await self.db.run(_put)
+
+    async def delete(self, op: str, message_ids: list[str]) -> None:
+        if not message_ids:
+            return
+        await self._ensure_schema()
+        await self.db.executemany(
+            "DELETE FROM scrum_outbox WHERE message_id = ? AND op = ?",
+            [(message_id, op) for message_id in message_ids],
+        )
+
+    async def make_due(self, message_ids: list[str] | None = None, created_before: float | None = None) -> None:
+        """지정한 메시지(없으면 created_before 이전에 쌓인 전체)의 작업을 즉시 재전송 대상으로 만듭니다."""
+        await self._ensure_schema()
+        if message_ids is None:
+            await self.db.execute(
+                "UPDATE scrum_outbox SET next_attempt_at = 0 WHERE created_at < ?",
+                (time.time() if created_before is None else created_before,),
+            )
+            return
+        await self.db.executemany(
+            "UPDATE scrum_outbox SET next_attempt_at = 0 WHERE message_id = ?",
+            [(message_id,) for message_id in message_ids],
+        )
+
+    async def due(self, limit: int) -> list[OutboxItem]:
+        """재전송할 때가 된 작업을 오래된 순으로 가져옵니다."""
+        await self._ensure_schema()
+        rows = await self.db.fetchall(
+            "SELECT message_id, op, payload, attempts FROM scrum_outbox "
+            "WHERE next_attempt_at <= ? ORDER BY created_at LIMIT ?",
+            (time.time(), limit),
+        )
+        items = []
+        for row in rows:
+            payload = json.loads(row["payload"])
+            if row["op"] == OP_CREATE:
+                # 수정 컬럼이 없던 때 쌓인 생성 작업도 다른 행과 같은 컬럼으로 보냅니다.
+                payload = _create_payload(payload)
+            items.append(OutboxItem(row["message_id"], row["op"], payload, row["attempts"]))
+        return items
+
+    async def reschedule(self, items: list[OutboxItem], error: str, base_backoff: float, max_backoff: float) -> None:
+        """실패한 작업의 시도 횟수를 늘리고 지수 백오프(지터 포함) 후로 미룹니다."""
+        if not items:
+            return
+        await self._ensure_schema()
+        now = time.time()
+        params = []
+        for item in items:
+            backoff = min(max_backoff, base_backoff * 2 ** item.attempts)
+            params.append((error[:500], now + backoff * random.uniform(0.5, 1.0), item.message_id, item.op))
+        await self.db.executemany(
+            "UPDATE scrum_outbox SET attempts = attempts + 1, last_error = ?, next_attempt_at = ? "
+            "WHERE message_id = ? AND op = ?",
+            params,
+        )
+
+    async def count(self) -> int:
+        await self._ensure_schema()
+        row = await self.db.fetchone("SELECT COUNT(*) AS backlog FROM scrum_outbox")
+        return row["backlog"] if row else 0
+
+
+scrum_outbox = ScrumOutbox(local_db)
@@ -0,0 +1,204 @@
+import asyncio
+import sqlite3
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, tzinfo
+from typing import AsyncIterable
+from zoneinfo import ZoneInfo
+
+from app.config import SCRUM_TIMEZONE
+from app.database.local import LocalDatabase, local_db
+
+
+STREAK_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scrum_streaks (
+    channel_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    current_streak INTEGER NOT NULL,
+    longest_streak INTEGER NOT NULL,
+    total_posts INTEGER NOT NULL,
+    last_post_date TEXT,
+    PRIMARY KEY (channel_id, user_id)
+);
+"""
+
+UPSERT_STREAK_SQL = (
+    "INSERT OR REPLACE INTO scrum_streaks "
+    "(channel_id, user_id, current_streak, longest_streak, total_posts, last_post_date) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+@dataclass
+class UserStreak:
+    channel_id: str
+    user_id: str
+    current_streak: int = 0
+    longest_streak: int = 0
+    total_posts: int = 0
+    last_post_date: date | None = None
+
+    def apply(self, day: date) -> None:
+        """day(설정한 시간대 기준 날짜)에 올린 인증 하나를 반영합니다."""
+        self.total_posts += 1
+        if self.last_post_date is not None and day <= self.last_post_date:
+            # 같은 날 추가 인증이거나 순서가 뒤바뀐 과거 인증은 총 인증 수만 늘립니다. (연속 기록은 재계산으로 바로잡습니다)
+            return
+        if self.last_post_date is not None and day - self.last_post_date == timedelta(days=1):
+            self.current_streak += 1
+        else:
+            self.current_streak = 1
+        self.last_post_date = day
+        self.longest_streak = max(self.longest_streak, self.current_streak)
+
+    def streak_on(self, today: date) -> int:
+        """today 기준으로 이어지고 있는 연속 인증 일수를 반환합니다. 어제까지 인증했으면 아직 끊기지 않은 것으로 봅니다."""
+        if self.last_post_date is None or today - self.last_post_date > timedelta(days=1):
+            return 0
+        return self.current_streak
+
+
+class StreakStore:
+    """유저별 연속 인증/총 인증 수를 메모리에 두고 로컬 DB에 함께 저장하는 집계 저장소입니다.
+
+    인증이 생성될 때마다 증분으로 갱신하므로 조회는 인증 기록 양과 관계없이 O(1)입니다.
+    삭제된 인증이나 순서가 뒤바뀐 인증은 rebuild()로 전체 기록에서 다시 계산해 바로잡습니다.
+    """
+
+    def __init__(self, db: LocalDatabase, tz: tzinfo):
+        self.db = db
+        self.tz = tz
+        self._streaks: dict[tuple[str, str], UserStreak] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        # 재계산 중인 채널 -> 재계산 동안 들어온 인증 {message_id: (user_id, 날짜)}
+        self._rebuilding: dict[str, dict[str, tuple[str, date]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._streaks)
+
+    def local_date(self, moment: datetime) -> date:
+        return moment.astimezone(self.tz).date()
+
+    def today(self) -> date:
+        return datetime.now(self.tz).date()
+
+    async def load(self) -> None:
+        """로컬 DB에 저장된 집계를 메모리로 읽어 옵니다. 한 번만 읽습니다."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            await self.db.executescript(STREAK_SCHEMA)
+            rows = await self.db.fetchall("SELECT * FROM scrum_streaks")
+            for row in rows:
+                streak = UserStreak(
+                    row["channel_id"],
+                    row["user_id"],
+                    row["current_streak"],
+                    row["longest_streak"],
+                    row["total_posts"],
+                    date.fromisoformat(row["last_post_date"]) if row["last_post_date"] else None,
+                )
+                self._streaks[(streak.channel_id, streak.user_id)] = streak
+            self._loaded = True
+
+    def get(self, channel_id: str, user_id: str) -> UserStreak | None:
+        return self._streaks.get((str(channel_id), str(user_id)))
+
+    def has_channel(self, channel_id: str) -> bool:
+        return any(key[0] == str(channel_id) for key in self._streaks)
+
+    def leaderboard(self, channel_id: str, top: int = 10) -> list[tuple[UserStreak, int]]:
+        """채널에서 지금 이어지고 있는 연속 인증이 긴 순서(같으면 총 인증 수 순)로 (집계, 연속 일수)를 반환합니다."""
+        today = self.today()
+        ranked = [
+            (streak, streak.streak_on(today))
+            for (streak_channel_id, _), streak in self._streaks.items()
+            if streak_channel_id == str(channel_id)
+        ]
+        ranked.sort(key=lambda item: (item[1], item[0].total_posts), reverse=True)
+        return ranked[:top]
+
+    @staticmethod
+    def _row(streak: UserStreak) -> tuple:
+        return (
+            streak.channel_id,
+            streak.user_id,
+            streak.current_streak,
+            streak.longest_streak,
+            streak.total_posts,
+            streak.last_post_date.isoformat() if streak.last_post_date else None,
+        )
+
+    async def _save(self, streak: UserStreak) -> None:
+        await self.db.execute(UPSERT_STREAK_SQL, self._row(streak))
+
+    async def record_post(self, channel_id: str, user_id: str, message_id: str, posted_at: datetime) -> UserStreak:
+        """새 인증 하나를 집계에 반영하고 갱신된 집계를 반환합니다."""
+        await self.load()
+        channel_id, user_id = str(channel_id), str(user_id)
+        day = self.local_date(posted_at)
+
+        buffered = self._rebuilding.get(channel_id)
+        if buffered is not None:
+            buffered[str(message_id)] = (user_id, day)
+
+        key = (channel_id, user_id)
+        streak = self._streaks.get(key)
+        if streak is None:
+            streak = self._streaks[key] = UserStreak(channel_id, user_id)
+        streak.apply(day)
+        await self._save(streak)
+        return streak
+
+    async def rebuild(self, channel_id: str, pages: AsyncIterable[list[dict]]) -> int:
+        """채널의 집계를 전체 인증 기록에서 처음부터 다시 계산하고 반영한 인증 수를 반환합니다.
+
+        pages 는 (created_at, id) 오름차순 scrum_entries 페이지여야 합니다.
+        재계산하는 동안 새로 들어온 인증은 따로 모아 두었다가, 기록에서 찾지 못한 것만 마지막에 더합니다.
+        """
+        await self.load()
+        channel_id = str(channel_id)
+        buffered = self._rebuilding[channel_id] = {}
+        try:
+            rebuilt: dict[tuple[str, str], UserStreak] = {}
+            seen: set[str] = set()
+            count = 0
+            async for page in pages:
+                for row in page:
+                    user_id = str(row["user_id"])
+                    streak = rebuilt.get((channel_id, user_id))
+                    if streak is None:
+                        streak = rebuilt[(channel_id, user_id)] = UserStreak(channel_id, user_id)
+                    streak.apply(self.local_date(datetime.fromisoformat(row["created_at"])))
+                    if str(row["message_id"]) in buffered:
+                        seen.add(str(row["message_id"]))
+                    count += 1
+
+            # 아직 DB에 저장되지 않은(write-behind 큐에 있는) 인증을 더합니다.
+            for message_id, (user_id, day) in buffered.items():
+                if message_id not in seen:
+                    streak = rebuilt.get((channel_id, user_id))
+                    if streak is None:
+                        streak = rebuilt[(channel_id, user_id)] = UserStreak(channel_id, user_id)
+                    streak.apply(day)
+        finally:
+            self._rebuilding.pop(channel_id, None)
+
+        # 모아 둔 인증을 더한 뒤 await 없이 바로 교체해야 그 사이에 들어온 인증을 놓치지 않습니다.
+        for key in [key for key in self._streaks if key[0] == channel_id]:
+            del self._streaks[key]
+        self._streaks.update(rebuilt)
+        await self._replace_channel(channel_id, list(rebuilt.values()))
+        return count
+
+    async def _replace_channel(self, channel_id: str, streaks: list[UserStreak]) -> None:
+        rows = [self._row(streak) for streak in streaks]
+
+        def _replace(conn: sqlite3.Connection) -> None:
+            conn.execute("DELETE FROM scrum_streaks WHERE channel_id = ?", (channel_id,))
+            conn.executemany(UPSERT_STREAK_SQL, rows)
+
+        await self.db.run(_replace)
+
+
+streak_store = StreakStore(local_db, ZoneInfo(SCRUM_TIMEZONE))
@@ -1,21 +1,36 @@
-from supabase.client import AsyncClient
+from typing import TYPE_CHECKING
 
 from app.config import SUPABASE_ANON_KEY, SUPABASE_URL
 
+if TYPE_CHECKING:
+    from postgrest import AsyncPostgrestClient
 
 
 class SupabaseClient:
     _instance = None
 
     @classmethod
-    def get_instance(cls) -> AsyncClient:
-        """싱글톤 패턴으로 Supabase 클라이언트 인스턴스를 반환합니다."""
+    def get_instance(cls) -> "AsyncPostgrestClient":
+        """싱글톤 패턴으로 Supabase(PostgREST) 클라이언트 인스턴스를 반환합니다.
+
+        처음 사용할 때 만들어지며, 쓰지 않는 realtime/storage/functions/auth 클라이언트는 import 하지 않습니다.
+        """
         if cls._instance is None:
-            cls._instance = AsyncClient(
-                supabase_url=SUPABASE_URL,
-                supabase_key=SUPABASE_ANON_KEY,
+            from postgrest import AsyncPostgrestClient
+
+            from app.http_pool import http_pool
+
+            cls._instance = AsyncPostgrestClient(
+                base_url=f"{SUPABASE_URL.rstrip('/')}/rest/v1",
+                headers={
+                    "apiKey": SUPABASE_ANON_KEY,
+                    "Authorization": f"Bearer {SUPABASE_ANON_KEY}",
+                },
+                # 공유 커넥션 풀의 httpx 클라이언트를 사용합니다.
+                http_client=http_pool.httpx_client,
             )
         return cls._instance
 
 
-supabase = SupabaseClient.get_instance()
+def get_supabase() -> "AsyncPostgrestClient":
+    return SupabaseClient.get_instance()
@@ -1,4 +1,7 @@
+import hashlib
+import json
 import os
+import signal
 import sys
 import aiohttp
 import asyncio
@@ -9,21 +12,67 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from app.config import ADMIN_CHANNEL_ID, CHANNEL_ID, DISCORD_TOKEN, GUILD_ID, logger
+from app import startup_profile
+from app.cache.guild_config import guild_configs
+from app.cluster import report_worker_state
+from app.config import (
+    ADMIN_CHANNEL_ID,
+    CLUSTER_ID,
+    CLUSTER_SIZE,
+    DISCORD_TOKEN,
+    GUILD_CONFIG_REFRESH_INTERVAL,
+    GUILD_ID,
+    SHARD_COUNT,
+    SHARD_IDS,
+    SHARDING,
+    WEB_SERVER_ENABLED,
+    WEB_SERVER_PORT,
+    logger,
+)
+from app.database.cache_events import cache_bus
+from app.database.command_sync import command_sync_state
+from app.database.outbox import scrum_outbox
+from app.http_pool import http_pool
+from app.memory import build_intents, cache_options, memory_report, scope_message_cache
+from app.metrics import GATEWAY_LATENCY, discord_http_trace, monitor_event_loop_lag, register_stats, render_latest
+from app.reminders import reminder_scheduler
+from app.repositories.resilience import repository_breaker
+from app.repositories.scrum_entries import scrum_entry_queue
+from app.repositories.user_profiles import profile_cache
+from app.utils.outbound import outbound
 
 
 
 
 ## 1. Discord Bot 정의
-intents = discord.Intents.default()
-intents.message_content = True  # message.content 읽기 위해 필요
-intents.guilds = True
-intents.messages = True
+# 인텐트와 메시지/멤버 캐시 정책은 app/memory.py 에서 환경변수(DISCORD_*)로 정합니다.
+intents = build_intents()
 
 # 봇 클라이언트 생성
-bot = commands.Bot(command_prefix="!", intents=intents)
-setattr(bot, "channel_id", CHANNEL_ID)
-setattr(bot, "guild_id", GUILD_ID)
+# 길드별 인증/관리자 채널은 guild_configs(app/cache/guild_config.py)에서 조회합니다.
+if SHARDING:
+    # 클러스터 워커는 런처가 정해 준 샤드만, 단독 실행이면 디스코드 권장 수만큼의 샤드를 모두 맡습니다.
+    bot = commands.AutoShardedBot(
+        command_prefix="!",
+        http_trace=discord_http_trace(),
+        shard_count=SHARD_COUNT or None,
+        shard_ids=SHARD_IDS or None,
+        **cache_options(intents),
+    )
+else:
+    bot = commands.Bot(command_prefix="!", http_trace=discord_http_trace(), **cache_options(intents))
+
+# 메시지 캐시를 켠 경우에도 인증 채널 메시지만 보관합니다.
+scope_message_cache(bot, guild_configs.is_scrum_channel)
+
+# 스크레이프 시점에 읽는 지표 (평소에는 비용이 없습니다)
+GATEWAY_LATENCY.set_function(lambda: bot.latency)
+register_stats("scrumbot_profile_cache", profile_cache.stats, "유저 프로필 캐시")
+register_stats("scrumbot_scrum_write_queue", scrum_entry_queue.stats, "스크럼 인증 write-behind 큐")
+register_stats("scrumbot_outbound", outbound.stats, "채널 메시지 스케줄러")
+register_stats("scrumbot_repository_breaker", repository_breaker.stats, "저장소 회로 차단기")
+register_stats("scrumbot_memory", lambda: memory_report(bot), "프로세스 메모리와 캐시 항목 수")
+register_stats("scrumbot_reminders", reminder_scheduler.stats, "인증 알림 스케줄러")
 
 
 async def ping_self_loop():
@@ -36,19 +85,53 @@ async def ping_self_loop():
 
     while not bot.is_closed():
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=5) as res:
-                    logger.info(f"✅ Self-ping 성공: {res.status} (URL: {url})")
+            async with http_pool.session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as res:
+                logger.info(f"✅ Self-ping 성공: {res.status} (URL: {url})", extra={"sample_key": "self_ping"})
         except Exception as e:
             logger.warning(f"❌ Self-ping 실패: {type(e).__name__}: {e} (URL: {url})")
 
         await asyncio.sleep(300)  # 5분 간격
 
 
+def command_tree_fingerprint(guild: discord.abc.Snowflake | None = None) -> str:
+    """커맨드 트리를 디스코드에 보내는 형태 그대로 직렬화해 안정적인 해시를 만듭니다."""
+    payload = [command.to_dict() for command in bot.tree.get_commands(guild=guild)]
+    payload.sort(key=lambda command: (command.get("type", 1), command["name"]))
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+async def sync_commands_if_changed(guild: discord.abc.Snowflake | None = None) -> bool:
+    """커맨드 트리가 마지막 동기화 이후 바뀌었을 때만 sync를 호출합니다."""
+    scope = str(guild.id) if guild else "global"
+    fingerprint = command_tree_fingerprint(guild)
+    if await command_sync_state.get(scope) == fingerprint:
+        logger.info(f"커맨드 트리 변경 없음, 동기화 생략 ({scope})")
+        return False
+
+    synced = await bot.tree.sync(guild=guild)
+    await command_sync_state.save(scope, fingerprint)
+    logger.info(f"동기화 완료 ({scope}): {len(synced)}개")
+    return True
+
+
+# 재연결 때마다 on_ready가 다시 호출되므로 준비 완료 메시지는 프로세스당 한 번만 보냅니다.
+_ready_announced = False
+
+
 @bot.event
 async def on_ready():
+    global _ready_announced
     logger.info(f"🤖 Logged in as {bot.user}")
-    logger.info(f"Connected to {len(bot.guilds)} guilds")
+    logger.info(f"Connected to {len(bot.guilds)} guilds" + (f" (shards {SHARD_IDS or 'all'})" if SHARDING else ""))
+    startup_profile.report_ready()
+    if CLUSTER_ID != 0:
+        # 커맨드 동기화는 0번 워커만 합니다. (준비 완료 메시지는 관리자 채널이 속한 샤드의 워커만 보낼 수 있습니다)
+        channel = bot.get_channel(ADMIN_CHANNEL_ID)
+        if channel and not _ready_announced:
+            _ready_announced = True
+            await channel.send(f"🤖 워커 {CLUSTER_ID} 준비 완료 (샤드 {SHARD_IDS})")
+        return
     try:
         if GUILD_ID:
             # 길드 동기화
@@ -58,20 +141,20 @@ async def on_ready():
             # commands.Cog를 사용하면서 명령어가 전역으로 사용됨
             # 명령어를 길드(디스코드 서버)에 복사해야 표시됨
             bot.tree.copy_global_to(guild=guild_ref)
-            synced = await bot.tree.sync(guild=guild_ref)
+            await sync_commands_if_changed(guild_ref)
 
-            logger.info(f"길드 동기화 완료: {len(synced)}개")
             logger.info(f"등록된 커맨드: {[cmd.name for cmd in bot.tree.get_commands(guild=guild_ref)]}")
 
             # 준비 완료 메시지 전송
             channel = bot.get_channel(ADMIN_CHANNEL_ID)
-            guild_obj = bot.get_guild(GUILD_ID)
-            guild_name = guild_obj.name if guild_obj else str(GUILD_ID)
-            await channel.send(f"🤖 봇이 준비되었습니다! 길드: {guild_name} {bot.user.name} 봇 준비 완료")
+            if channel and not _ready_announced:
+                _ready_announced = True
+                guild_obj = bot.get_guild(GUILD_ID)
+                guild_name = guild_obj.name if guild_obj else str(GUILD_ID)
+                await channel.send(f"🤖 봇이 준비되었습니다! 길드: {guild_name} {bot.user.name} 봇 준비 완료")
         else:
             # 전역 동기화
-            synced = await bot.tree.sync()
-            logger.info(f"전역 동기화 완료: {len(synced)}개")
+            await sync_commands_if_changed()
             logger.info(f"등록된 커맨드: {[cmd.name for cmd in bot.tree.get_commands()]}")
     except Exception as e:
         logger.error(f"슬래시 커맨드 동기화 실패: {e}")
@@ -84,40 +167,73 @@ async def on_error(event, *args, **kwargs):
 
 ## 2. aiohttp 헬스체크 서버 정의
 async def health_check(request):
-    logger.info("Health check requested")
-    return web.Response(text="OK", status=200)
+    # 헬스체크는 몇 초마다 들어오므로 LOG_SAMPLE_INTERVAL 에 한 번만 남깁니다.
+    logger.info("Health check requested", extra={"sample_key": "health_check"})
+    try:
+        outbox_backlog = await scrum_outbox.count()
+    except Exception as e:
+        logger.warning(f"outbox 상태 조회 실패: {e}")
+        outbox_backlog = None
+    return web.json_response({"status": "OK", "outbox_backlog": outbox_backlog}, status=200)
+
+async def metrics(request):
+    body, content_type = render_latest()
+    return web.Response(body=body, headers={"Content-Type": content_type})
 
 async def start_web_server():
     app = web.Application()
     app.router.add_get('/health', health_check)
+    app.router.add_get('/metrics', metrics)
     app.router.add_get('/', health_check)  # 루트 경로도 추가
     runner = web.AppRunner(app)
     await runner.setup()
 
-    site = web.TCPSite(runner, '0.0.0.0', 8000)
+    site = web.TCPSite(runner, '0.0.0.0', WEB_SERVER_PORT)
     await site.start()
-    logger.info(f"🌐 Health check server running on port 8000")
+    logger.info(f"🌐 Health check server running on port {WEB_SERVER_PORT}")
 
 ## 3. Discord bot + aiohttp 병렬 실행
 async def main():
     logger.info("Starting Discord bot and web server...")
+    await http_pool.start()
     try:
         # 확장 로드 (도메인 별로 추가)
         await bot.load_extension("app.cogs.scrum")
 
         # TODO: 추후 유저 커맨드를 적용할 때 주석 해제해주세요.
         await bot.load_extension("app.cogs.user") 
+        await bot.load_extension("app.cogs.admin")
+        await bot.load_extension("app.cogs.reminder")
         
-        # aiohttp 웹서버와 디스코드 봇을 동시에 실행
-        await asyncio.gather(
-            start_web_server(),
-            bot.start(DISCORD_TOKEN),
-            ping_self_loop(),
-            return_exceptions=True
-        )
+        # SIGTERM(클러스터 런처 종료, 컨테이너 중지)을 받으면 코그를 언로드하며 큐에 남은 인증을 저장하고 종료합니다.
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGTERM, lambda: asyncio.create_task(bot.close()))
+
+        # 헬스체크/지표 서버와 self-ping 은 프로세스 하나만 맡습니다. (클러스터에서는 런처)
+        loops = [
+            monitor_event_loop_lag(bot.is_closed),
+            guild_configs.refresh_loop(bot.is_closed, GUILD_CONFIG_REFRESH_INTERVAL),
+            cache_bus.run(bot.is_closed),
+        ]
+        if WEB_SERVER_ENABLED:
+            loops += [start_web_server(), ping_self_loop()]
+        if CLUSTER_SIZE > 1:
+            loops.append(report_worker_state(bot))
+
+        # 보조 루프는 백그라운드에서 돌리고, 봇이 끝나면(오류 포함) 함께 정리합니다.
+        # 봇 오류가 프로세스 종료로 이어져야 런처/플랫폼이 다시 띄울 수 있습니다.
+        background = [asyncio.create_task(coro) for coro in loops]
+        try:
+            await bot.start(DISCORD_TOKEN)
+        finally:
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
     except Exception as e:
         logger.error(f"Error in main: {e}")
         raise
+    finally:
+        await http_pool.close()
 
 if __name__ == "__main__":
     try: 
@@ -0,0 +1,133 @@
+## 인증 내보내기
+# scrum_entries 를 (created_at, id) keyset 페이지로 읽어 gzip 으로 압축한 CSV/JSONL 파일에 한 페이지씩 이어 씁니다.
+# 메모리에는 한 페이지만 두고 페이지마다 따로 조회하므로, 인증이 몇 개든 메모리 사용량과 쿼리 하나의 길이가 일정합니다.
+# 디스코드 명령어(/인증내보내기)와 CLI(export.py)가 함께 사용합니다.
+import asyncio
+import contextlib
+import csv
+import gzip
+import json
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+
+from app.config import EXPORT_PAGE_SIZE
+from app.log import logger
+from app.repositories.scrum_entries import iter_scrum_entry_pages
+
+
+EXPORT_FORMATS = ("csv", "jsonl")
+
+# 내보내는 scrum_entries 컬럼 (CSV 헤더 순서)
+EXPORT_COLUMNS = (
+    "id",
+    "message_id",
+    "channel_id",
+    "user_id",
+    "yesterday_work",
+    "today_plan",
+    "comment",
+    "created_at",
+    "updated_at",
+    "is_edited",
+)
+
+
+@dataclass
+class ExportResult:
+    path: str
+    rows: int
+    size: int  # 압축된 파일 크기(바이트)
+
+
+def parse_export_date(text: str | None) -> date | None:
+    """YYYY-MM-DD 를 날짜로 바꿉니다. 비어 있으면 None, 형식이 틀리면 ValueError 입니다."""
+    if not text or not text.strip():
+        return None
+    try:
+        return date.fromisoformat(text.strip())
+    except ValueError:
+        raise ValueError(f"날짜는 YYYY-MM-DD 형식으로 입력해주세요: {text}")
+
+
+def date_bounds(start: date | None, end: date | None, tz: tzinfo) -> tuple[str | None, str | None]:
+    """tz 기준 start 일 0시부터 end 다음 날 0시 전까지를 created_at 과 비교할 UTC ISO 문자열로 바꿉니다."""
+
+    def _utc(day: date) -> str:
+        return datetime.combine(day, time.min, tzinfo=tz).astimezone(timezone.utc).isoformat()
+
+    return (
+        _utc(start) if start else None,
+        _utc(end + timedelta(days=1)) if end else None,
+    )
+
+
+def export_filename(channel_id: str | int | None, start: date | None, end: date | None, fmt: str) -> str:
+    scope = f"channel-{channel_id}" if channel_id else "all"
+    period = f"{start or 'begin'}_{end or 'now'}"
+    return f"scrum-entries-{scope}-{period}.{fmt}.gz"
+
+
+class _GzipWriter:
+    """CSV/JSONL 행을 gzip 파일에 이어 씁니다. 모든 메서드는 스레드에서 호출됩니다."""
+
+    def __init__(self, path: str, fmt: str):
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+        self.fmt = fmt
+        # CSV 는 엑셀에서 한글이 깨지지 않도록 BOM 을 붙입니다.
+        encoding = "utf-8-sig" if fmt == "csv" else "utf-8"
+        self._file = gzip.open(path, "wt", encoding=encoding, newline="")
+        if fmt == "csv":
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(EXPORT_COLUMNS)
+
+    def write(self, rows: list[dict]) -> None:
+        if self.fmt == "csv":
+            self._csv.writerows([row.get(column) for column in EXPORT_COLUMNS] for row in rows)
+        else:
+            self._file.writelines(
+                json.dumps({column: row.get(column) for column in EXPORT_COLUMNS}, ensure_ascii=False) + "\n"
+                for row in rows
+            )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+async def export_scrum_entries(
+    path: str,
+    fmt: str,
+    channel_id: str | int | None,
+    start: date | None,
+    end: date | None,
+    tz: tzinfo,
+    page_size: int = EXPORT_PAGE_SIZE,
+) -> ExportResult:
+    """채널(None 이면 전체)의 start~end 일(tz 기준, 양 끝 포함) 인증을 path 에 gzip 으로 내보냅니다.
+
+    다 쓰기 전에는 path.part 에 쓰므로, 실패하거나 취소되면 path 에는 아무것도 남지 않습니다.
+    """
+    since, until = date_bounds(start, end, tz)
+    partial = f"{path}.part"
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    writer = await asyncio.to_thread(_GzipWriter, partial, fmt)
+    rows = 0
+    try:
+        async for page in iter_scrum_entry_pages(
+            str(channel_id) if channel_id else None, page_size, since, until
+        ):
+            # 압축과 디스크 쓰기는 이벤트 루프를 막지 않도록 스레드에서 합니다.
+            await asyncio.to_thread(writer.write, page)
+            rows += len(page)
+        await asyncio.to_thread(writer.close)
+    except BaseException:
+        with contextlib.suppress(Exception):
+            writer.close()
+        with contextlib.suppress(OSError):
+            os.remove(partial)
+        raise
+    os.replace(partial, path)
+    size = os.path.getsize(path)
+    logger.info(f"인증 내보내기 완료: {path} (인증 {rows}개, {size}바이트)")
+    return ExportResult(path, rows, size)
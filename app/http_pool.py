@@ -0,0 +1,84 @@
+import aiohttp
+import httpx
+
+from app.config import (
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_POOL_LIMIT,
+    HTTP_POOL_LIMIT_PER_HOST,
+    HTTP_TIMEOUT,
+)
+from app.log import logger
+
+
+class HttpPool:
+    """프로세스 전체가 함께 쓰는 아웃바운드 HTTP 커넥션 풀입니다.
+
+    aiohttp 세션은 self-ping, 웹훅 등 일반 HTTP 호출에, httpx 클라이언트는 Supabase(PostgREST)에 사용합니다.
+    연결을 재사용하므로 호출마다 TCP/TLS 연결을 새로 맺지 않습니다.
+    """
+
+    def __init__(self, limit: int, limit_per_host: int, keepalive_timeout: float, dns_cache_ttl: int, timeout: float):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = timeout
+        self._session: aiohttp.ClientSession | None = None
+        self._httpx_client: httpx.AsyncClient | None = None
+
+    async def start(self) -> None:
+        """이벤트 루프 안에서 aiohttp 세션을 만듭니다. main()에서 한 번 호출합니다."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            raise RuntimeError("HttpPool.start()가 호출되지 않았습니다.")
+        return self._session
+
+    @property
+    def httpx_client(self) -> httpx.AsyncClient:
+        """Supabase 클라이언트가 사용할 httpx 클라이언트입니다.
+
+        PostgREST 클라이언트가 base_url과 헤더를 이 클라이언트에 직접 설정하므로 다른 용도로 쓰지 않습니다.
+        """
+        if self._httpx_client is None or self._httpx_client.is_closed:
+            self._httpx_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.limit,
+                    max_keepalive_connections=self.limit_per_host,
+                    keepalive_expiry=self.keepalive_timeout,
+                ),
+                timeout=httpx.Timeout(self.timeout),
+                follow_redirects=True,
+                http2=True,
+            )
+        return self._httpx_client
+
+    async def close(self) -> None:
+        """종료 시 열린 연결을 모두 닫습니다."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        if self._httpx_client is not None and not self._httpx_client.is_closed:
+            await self._httpx_client.aclose()
+        logger.info("HTTP 커넥션 풀 종료")
+
+
+http_pool = HttpPool(
+    limit=HTTP_POOL_LIMIT,
+    limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+    dns_cache_ttl=HTTP_DNS_CACHE_TTL,
+    timeout=HTTP_TIMEOUT,
+)
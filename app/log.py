@@ -1,12 +1,122 @@
 # 로깅 설정 (서버 로그에 출력되도록)
+# 로그 레코드는 QueueHandler 로 큐에 넣기만 하고, 실제 stdout 쓰기는 QueueListener 스레드가 합니다.
+# (느린 stdout 파이프가 디스코드 인터랙션을 처리하는 이벤트 루프를 막지 않도록)
+import atexit
+import json
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
-logger = logging.getLogger(__name__)
\ No newline at end of file
+
+# app.config 가 logger 를 import 하므로 로깅 환경변수는 여기서 읽습니다.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()  # 로그 레벨
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")  # text | json (json 이면 한 줄에 하나의 JSON 객체)
+LOG_SAMPLE_INTERVAL = float(os.getenv("LOG_SAMPLE_INTERVAL", 300))  # 반복 로그(헬스체크, self-ping 성공)를 남기는 최소 간격(초)
+
+TEXT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# 현재 처리 중인 인터랙션의 로그 문맥 (interaction, user, guild, command 등)
+_log_context: ContextVar[dict | None] = ContextVar("log_context", default=None)
+
+
+@contextmanager
+def log_context(**fields):
+    """블록 안에서 남기는 로그에 fields 를 문맥으로 붙입니다. (None 인 값은 뺍니다)"""
+    fields = {key: value for key, value in fields.items() if value is not None}
+    token = _log_context.set({**(_log_context.get() or {}), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """로그를 남기는 시점의 문맥을 레코드에 담습니다. (리스너 스레드에서는 문맥을 읽을 수 없습니다)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.context = _log_context.get() or {}
+        return True
+
+
+class SampleFilter(logging.Filter):
+    """extra={"sample_key": ...} 가 붙은 반복 로그를 키마다 interval 초에 한 번만 남깁니다.
+
+    생략한 건수는 다음에 남기는 줄에 덧붙입니다.
+    """
+
+    def __init__(self, interval: float):
+        super().__init__()
+        self.interval = interval
+        self._last: dict[str, float] = {}
+        self._suppressed: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = getattr(record, "sample_key", None)
+        if key is None or self.interval <= 0:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            last = self._last.get(key)
+            if last is not None and now - last < self.interval:
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                return False
+            self._last[key] = now
+            suppressed = self._suppressed.pop(key, 0)
+
+        if suppressed:
+            record.msg = f"{record.msg} (지난 {self.interval:.0f}초 동안 같은 로그 {suppressed}건 생략)"
+        return True
+
+
+class TextFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        context = getattr(record, "context", None)
+        if context:
+            text += " [" + " ".join(f"{key}={value}" for key, value in context.items()) + "]"
+        return text
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **(getattr(record, "context", None) or {}),
+        }
+        # 예외 트레이스백은 QueueHandler 가 큐에 넣을 때 message 에 합쳐 둡니다.
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+def _setup() -> logging.handlers.QueueListener:
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else TextFormatter(TEXT_FORMAT))
+
+    # 필터는 로그를 남기는 쪽(QueueHandler)에서 실행해야 문맥을 읽고, 버릴 로그는 큐에 넣지도 않습니다.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.handlers.QueueHandler(log_queue)
+    # 큐에는 메시지(+트레이스백)만 담고, 시각/레벨 등은 리스너 쪽 포매터가 붙입니다.
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    handler.addFilter(ContextFilter())
+    handler.addFilter(SampleFilter(LOG_SAMPLE_INTERVAL))
+
+    logging.basicConfig(level=LOG_LEVEL, handlers=[handler], force=True)
+    listener = logging.handlers.QueueListener(log_queue, stream, respect_handler_level=True)
+    listener.start()
+    # 종료 시 큐에 남은 로그를 모두 쓰고 끝냅니다.
+    atexit.register(listener.stop)
+    return listener
+
+
+_listener = _setup()
+logger = logging.getLogger(__name__)
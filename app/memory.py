@@ -0,0 +1,103 @@
+import resource
+import sys
+from typing import Callable
+
+import discord
+from discord.ext import commands
+
+from app.cache.guild_config import guild_configs
+from app.cache.scrum_index import scrum_index
+from app.config import (
+    DISCORD_CHUNK_GUILDS,
+    DISCORD_MAX_MESSAGES,
+    DISCORD_MEMBER_CACHE,
+    DISCORD_MESSAGE_CACHE_SCOPE,
+)
+from app.database.streaks import streak_store
+from app.repositories.user_profiles import profile_cache
+
+
+def build_intents() -> discord.Intents:
+    """봇이 실제로 쓰는 이벤트만 받도록 인텐트를 만듭니다. (받지 않는 이벤트는 캐시도 쌓이지 않습니다)"""
+    intents = discord.Intents.default()
+    intents.message_content = True  # message.content 읽기 위해 필요
+    intents.guilds = True
+    intents.messages = True
+    intents.members = DISCORD_MEMBER_CACHE
+    # 타이핑/음성 상태는 쓰지 않으므로 받지 않습니다. (음성 채널 멤버 캐시도 쌓이지 않습니다)
+    intents.typing = False
+    intents.voice_states = False
+    return intents
+
+
+def cache_options(intents: discord.Intents) -> dict:
+    """discord.py 클라이언트에 넘길 캐시 옵션입니다."""
+    return {
+        "intents": intents,
+        # 인증 메시지는 raw 이벤트와 DB 로 처리하므로 메시지 캐시는 기본으로 끕니다. (None 이면 캐시 없음)
+        "max_messages": DISCORD_MAX_MESSAGES or None,
+        "member_cache_flags": (
+            discord.MemberCacheFlags.from_intents(intents) if DISCORD_MEMBER_CACHE else discord.MemberCacheFlags.none()
+        ),
+        "chunk_guilds_at_startup": DISCORD_MEMBER_CACHE and DISCORD_CHUNK_GUILDS,
+    }
+
+
+def scope_message_cache(bot: commands.Bot, keep: Callable[[int], bool]) -> None:
+    """메시지 캐시를 켠 경우 keep(channel_id) 가 참인 채널의 메시지만 남깁니다.
+
+    discord.py 는 모든 채널의 메시지를 캐시에 넣은 뒤 on_message 를 호출하므로,
+    그 자리에서 범위 밖 메시지를 바로 꺼냅니다. (보통 방금 넣은 맨 끝 항목이라 O(1)입니다)
+    """
+    if DISCORD_MAX_MESSAGES <= 0 or DISCORD_MESSAGE_CACHE_SCOPE == "all":
+        return
+
+    async def on_message(message: discord.Message):
+        if keep(message.channel.id):
+            return
+        cached = bot._connection._messages
+        if not cached:
+            return
+        if cached[-1] is message:
+            cached.pop()
+            return
+        try:
+            cached.remove(message)
+        except ValueError:
+            pass
+
+    bot.add_listener(on_message)
+
+
+def rss_bytes() -> int | None:
+    """현재 프로세스의 RSS(실제 사용 중인 메모리)를 반환합니다. 리눅스가 아니면 None 입니다."""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * resource.getpagesize()
+
+
+def peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS 는 바이트, 리눅스는 KB 단위입니다.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def memory_report(bot: commands.Bot) -> dict:
+    """프로세스 메모리와 내부 캐시별 항목 수를 반환합니다."""
+    guilds = bot.guilds
+    return {
+        "rss_bytes": rss_bytes() or 0,
+        "peak_rss_bytes": peak_rss_bytes(),
+        "guilds": len(guilds),
+        "channels": sum(len(guild.channels) for guild in guilds),
+        "members": sum(len(guild.members) for guild in guilds),
+        "users": len(bot.users),
+        "messages": len(bot.cached_messages),
+        "profile_cache": len(profile_cache),
+        "scrum_index": len(scrum_index),
+        "streaks": len(streak_store),
+        "guild_configs": len(guild_configs),
+    }
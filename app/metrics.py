@@ -0,0 +1,262 @@
+## Prometheus 지표 정의
+# 모든 지표는 프로세스 메모리의 카운터/히스토그램이며, /metrics 로 노출됩니다.
+import asyncio
+import functools
+import re
+import time
+from contextvars import ContextVar
+from typing import Callable
+
+import aiohttp
+import discord
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from app.config import TRACE_SLOW_THRESHOLD
+from app.log import log_context, logger
+from app.tracing import record_span, span, trace_root
+
+
+INTERACTION_LATENCY = Histogram(
+    "scrumbot_interaction_seconds",
+    "슬래시 커맨드/모달/버튼 처리 시간",
+    ["kind", "name"],
+)
+INTERACTION_ERRORS = Counter(
+    "scrumbot_interaction_errors_total",
+    "슬래시 커맨드/모달/버튼 처리 중 발생한 오류 수",
+    ["kind", "name"],
+)
+REPOSITORY_LATENCY = Histogram(
+    "scrumbot_repository_seconds",
+    "repositories 함수 호출 시간",
+    ["function"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REPOSITORY_ERRORS = Counter(
+    "scrumbot_repository_errors_total",
+    "repositories 함수에서 발생한 오류 수",
+    ["function"],
+)
+REPOSITORY_RETRIES = Counter(
+    "scrumbot_repository_retries_total",
+    "저장소 호출 재시도 수",
+    ["operation"],
+)
+REPOSITORY_HEDGES = Counter(
+    "scrumbot_repository_hedges_total",
+    "느린 조회에 같은 요청을 한 번 더 보낸 수",
+    ["operation"],
+)
+DISCORD_REST_REQUESTS = Counter(
+    "scrumbot_discord_rest_requests_total",
+    "디스코드 REST 호출 수",
+    ["method", "status"],
+)
+DISCORD_RATE_LIMITS = Counter(
+    "scrumbot_discord_rate_limits_total",
+    "디스코드 REST 429 응답 수",
+)
+GATEWAY_LATENCY = Gauge(
+    "scrumbot_gateway_latency_seconds",
+    "디스코드 게이트웨이 heartbeat 지연 (bot.latency)",
+)
+EVENT_LOOP_LAG = Histogram(
+    "scrumbot_event_loop_lag_seconds",
+    "이벤트 루프 지연 (예약한 깨움 시각 대비 실제 깨움 시각)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+OUTBOUND_QUEUE_DEPTH = Gauge(
+    "scrumbot_outbound_queue_depth",
+    "채널 메시지 스케줄러에서 대기 중인 전송/수정 수",
+    ["kind"],
+)
+OUTBOUND_WAIT = Histogram(
+    "scrumbot_outbound_wait_seconds",
+    "채널 메시지 전송/수정이 스케줄러 큐에서 기다린 시간",
+    ["kind"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+OUTBOUND_COALESCED = Counter(
+    "scrumbot_outbound_coalesced_total",
+    "같은 메시지의 대기 중인 수정에 합쳐진 수정 수",
+)
+INTERACTION_DEFERRED = Counter(
+    "scrumbot_interaction_deferred_total",
+    "응답 예산을 넘길 것 같아 먼저 defer 한 인터랙션 수",
+    ["kind", "name"],
+)
+DEPENDENCY_DEGRADED = Counter(
+    "scrumbot_dependency_degraded_total",
+    "인터랙션 의존성(프로필, 최근 인증 등)이 시간 초과/오류로 대체값을 쓴 횟수",
+    ["dependency", "reason"],
+)
+
+
+# 현재 처리 중인 인터랙션의 (kind, name) 라벨
+_current_interaction: ContextVar[tuple[str, str] | None] = ContextVar("current_interaction", default=None)
+
+
+def observe_interaction(kind: str, name: str) -> Callable:
+    """커맨드/모달/버튼 콜백의 처리 시간과 오류 수를 기록하는 데코레이터입니다."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            token = _current_interaction.set((kind, name))
+            started = time.perf_counter()
+            interaction = next((arg for arg in args if isinstance(arg, discord.Interaction)), None)
+            try:
+                with trace_root(f"{kind}:{name}", TRACE_SLOW_THRESHOLD), _interaction_log_context(kind, name, interaction):
+                    return await func(*args, **kwargs)
+            except Exception:
+                INTERACTION_ERRORS.labels(kind, name).inc()
+                raise
+            finally:
+                INTERACTION_LATENCY.labels(kind, name).observe(time.perf_counter() - started)
+                _current_interaction.reset(token)
+        return wrapper
+    return decorator
+
+
+def _interaction_log_context(kind: str, name: str, interaction: discord.Interaction | None):
+    """콜백 안에서 남기는 로그에 인터랙션/유저/길드/커맨드를 붙입니다."""
+    if interaction is None:
+        return log_context(command=f"{kind}:{name}")
+    return log_context(
+        command=f"{kind}:{name}",
+        interaction=interaction.id,
+        user=interaction.user.id,
+        guild=interaction.guild_id,
+        channel=interaction.channel_id,
+    )
+
+
+def mark_interaction_error() -> None:
+    """콜백 안에서 직접 처리한(다시 던지지 않는) 오류를 현재 인터랙션의 오류로 기록합니다."""
+    labels = _current_interaction.get()
+    if labels is not None:
+        INTERACTION_ERRORS.labels(*labels).inc()
+
+
+def mark_interaction_deferred() -> None:
+    labels = _current_interaction.get()
+    if labels is not None:
+        INTERACTION_DEFERRED.labels(*labels).inc()
+
+
+def observe_repository(func):
+    """repositories 함수의 호출 시간과 오류 수를 기록하는 데코레이터입니다."""
+    name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            with span(f"repository:{name}"):
+                return await func(*args, **kwargs)
+        except Exception:
+            REPOSITORY_ERRORS.labels(name).inc()
+            raise
+        finally:
+            REPOSITORY_LATENCY.labels(name).observe(time.perf_counter() - started)
+    return wrapper
+
+
+def _discord_route(path: str) -> str:
+    # span 이름에 ID나 인터랙션 토큰이 남지 않도록 경로를 라우트 형태로 바꿉니다.
+    segments = []
+    for segment in path.split("/"):
+        if not segment or segment == "api" or re.fullmatch(r"v\d+", segment):
+            continue
+        if segment.isdigit():
+            segment = ":id"
+        elif len(segment) > 32:
+            segment = ":token"
+        segments.append(segment)
+    return "/" + "/".join(segments)
+
+
+# 디스코드 REST 응답을 받을 때마다 호출할 함수 (method, path, status, headers)
+_response_listeners: list[Callable[[str, str, int, dict], None]] = []
+
+
+def add_response_listener(listener: Callable[[str, str, int, dict], None]) -> None:
+    """디스코드 REST 응답(레이트 리밋 헤더 등)을 받아 볼 함수를 등록합니다."""
+    _response_listeners.append(listener)
+
+
+def discord_http_trace() -> aiohttp.TraceConfig:
+    """디스코드 REST 호출 수와 429 응답을 세고, 진행 중인 트레이스에 REST 호출 span을 남기는 aiohttp TraceConfig를 만듭니다."""
+    async def on_request_start(session, context, params: aiohttp.TraceRequestStartParams):
+        context.started = time.perf_counter()
+
+    async def on_request_end(session, context, params: aiohttp.TraceRequestEndParams):
+        status = params.response.status
+        DISCORD_REST_REQUESTS.labels(params.method, str(status)).inc()
+        if status == 429:
+            DISCORD_RATE_LIMITS.inc()
+        record_span(
+            f"discord:{params.method} {_discord_route(params.url.path)}",
+            context.started,
+            error=str(status) if status >= 400 else None,
+        )
+        for listener in _response_listeners:
+            try:
+                listener(params.method, params.url.path, status, params.response.headers)
+            except Exception as e:
+                logger.warning(f"디스코드 응답 처리 실패: {e}")
+
+    async def on_request_exception(session, context, params: aiohttp.TraceRequestExceptionParams):
+        record_span(
+            f"discord:{params.method} {_discord_route(params.url.path)}",
+            context.started,
+            error=type(params.exception).__name__,
+        )
+
+    trace = aiohttp.TraceConfig()
+    trace.on_request_start.append(on_request_start)
+    trace.on_request_end.append(on_request_end)
+    trace.on_request_exception.append(on_request_exception)
+    return trace
+
+
+class StatsCollector:
+    """stats() 딕셔너리를 스크레이프 시점에 노출하는 수집기입니다.
+
+    이름이 _total 로 끝나는 값은 누적 카운터로, 나머지는 게이지로 내보냅니다.
+    """
+
+    def __init__(self, prefix: str, stats: Callable[[], dict], documentation: str):
+        self.prefix = prefix
+        self.stats = stats
+        self.documentation = documentation
+
+    def collect(self):
+        for key, value in self.stats().items():
+            name, documentation = f"{self.prefix}_{key}", f"{self.documentation} ({key})"
+            if key.endswith("_total"):
+                # rate()/increase() 가 재시작 리셋을 처리할 수 있도록 counter 타입으로 알립니다.
+                yield CounterMetricFamily(name, documentation, value=value)
+            else:
+                yield GaugeMetricFamily(name, documentation, value=value)
+
+
+def register_stats(prefix: str, stats: Callable[[], dict], documentation: str) -> None:
+    REGISTRY.register(StatsCollector(prefix, stats, documentation))
+
+
+async def monitor_event_loop_lag(is_closed: Callable[[], bool], interval: float = 1.0) -> None:
+    """주기적으로 잠들었다 깨어나며 이벤트 루프가 얼마나 늦게 깨웠는지 기록합니다. is_closed()가 참이 되면 멈춥니다."""
+    loop = asyncio.get_running_loop()
+    while not is_closed():
+        scheduled = loop.time() + interval
+        await asyncio.sleep(interval)
+        lag = loop.time() - scheduled
+        EVENT_LOOP_LAG.observe(max(0.0, lag))
+        if lag > 1.0:
+            logger.warning(f"이벤트 루프 지연 감지: {lag:.3f}s")
+
+
+def render_latest() -> tuple[bytes, str]:
+    """/metrics 응답 본문과 Content-Type을 반환합니다."""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,73 @@
+## 실행 중 프로파일링
+# 관리자 명령어(/프로파일링)로 운영 중인 봇을 잠깐 동안 프로파일링합니다.
+# - cProfile: 이벤트 루프 스레드에서 실행된 모든 함수 호출을 측정합니다. (켜져 있는 동안 느려집니다)
+# - asyncio 태스크 샘플링: 주기적으로 모든 태스크가 어디서 기다리고 있는지 기록합니다.
+import asyncio
+import cProfile
+import io
+import os
+import pstats
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+
+# 태스크 샘플링 주기(초)
+TASK_SAMPLE_INTERVAL = 0.05
+
+
+def _task_location(task: asyncio.Task) -> str:
+    """태스크의 코루틴 이름과 현재 멈춰 있는 가장 안쪽 위치를 반환합니다."""
+    coro = task.get_coro()
+    name = getattr(coro, "__qualname__", repr(coro))
+    frames = task.get_stack()
+    if not frames:
+        return f"{name} (실행 중)"
+    frame = frames[-1]
+    return f"{name} @ {os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno} {frame.f_code.co_name}"
+
+
+async def profile(seconds: float, cpu: bool = True, top: int = 40) -> tuple[str, str]:
+    """seconds 동안 프로파일링하고 (요약 한 줄, 전체 보고서)를 반환합니다."""
+    profiler = cProfile.Profile() if cpu else None
+    samples: Counter[str] = Counter()
+    sample_count = 0
+    task_total = 0
+    current = asyncio.current_task()
+
+    started = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    try:
+        while time.perf_counter() - started < seconds:
+            await asyncio.sleep(TASK_SAMPLE_INTERVAL)
+            tasks = [task for task in asyncio.all_tasks() if task is not current]
+            sample_count += 1
+            task_total += len(tasks)
+            samples.update(_task_location(task) for task in tasks)
+    finally:
+        if profiler:
+            profiler.disable()
+    elapsed = time.perf_counter() - started
+
+    average_tasks = task_total / sample_count if sample_count else 0.0
+    lines = [
+        f"# 프로파일링 보고서 ({datetime.now(timezone.utc).isoformat()})",
+        f"측정 시간 {elapsed:.1f}s, 태스크 샘플 {sample_count}회 ({TASK_SAMPLE_INTERVAL * 1000:.0f}ms 간격), 평균 태스크 {average_tasks:.1f}개",
+        "",
+        "## asyncio 태스크 대기 위치 (샘플 비율)",
+    ]
+    for location, count in samples.most_common(top):
+        lines.append(f"{count / sample_count * 100:6.1f}%  {location}")
+
+    if profiler:
+        stream = io.StringIO()
+        stats = pstats.Stats(profiler, stream=stream).strip_dirs()
+        stream.write("\n## cProfile (누적 시간순)\n")
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+        stream.write("\n## cProfile (자체 시간순)\n")
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+        lines.append(stream.getvalue())
+
+    summary = f"{elapsed:.0f}초, 태스크 샘플 {sample_count}회, 평균 태스크 {average_tasks:.1f}개" + (", cProfile 포함" if cpu else "")
+    return summary, "\n".join(lines)
@@ -0,0 +1,315 @@
+## 인증 알림 스케줄러
+# 설정한 시각까지 오늘 인증하지 않은 유저에게 DM 으로 알림을 보냅니다.
+#   - 날짜가 바뀔 때(또는 길드를 처음 맡을 때) 길드별로 알림 설정을 한 번만 읽습니다.
+#   - 오늘의 알림은 (알림 시각, 길드, 유저) 힙에 넣고, 가장 이른 알림 시각이나 자정까지 잠들어 있습니다. (폴링하지 않음)
+#   - 오늘 인증한 유저는 메모리의 집합(인증할 때 mark_posted)으로 거르므로 알림 시각에 DB 를 읽지 않습니다.
+#   - 같은 시각에 몰린 알림은 한 번에 꺼내 토큰 버킷으로 속도를 맞춰 보냅니다.
+import asyncio
+import heapq
+import re
+import time
+from datetime import date, datetime, timedelta, tzinfo
+
+import discord
+from discord.ext import commands
+
+from app.cache.guild_config import guild_configs
+from app.config import REMINDER_DM_BURST, REMINDER_DM_RATE, REMINDER_LATE_GRACE
+from app.database.streaks import streak_store
+from app.log import logger
+from app.repositories.scrum_reminders import list_scrum_reminders
+from app.utils.rate_limiter import AsyncTokenBucket
+
+
+REMIND_AT_PATTERN = re.compile(r"(\d{1,2}):(\d{2})")
+# 알림 설정을 읽지 못한 길드는 이 시간(초) 뒤에 다시 읽습니다.
+GUILD_RELOAD_DELAY = 60
+
+Key = tuple[int, int]  # (guild_id, user_id)
+
+
+def guild_scrum_channel_id(guild: discord.Guild) -> int | None:
+    """길드의 인증 채널을 찾습니다.
+
+    환경변수 기본 설정은 GUILD_ID 없이 CHANNEL_ID 만 있을 수 있으므로, 길드 설정이 없으면 길드 안의 인증 채널을 찾습니다.
+    """
+    config = guild_configs.get(guild.id)
+    if config is not None:
+        return config.scrum_channel_id
+    return next(
+        (channel_id for channel_id in guild_configs.scrum_channel_ids() if guild.get_channel(channel_id) is not None),
+        None,
+    )
+
+
+def parse_remind_at(text: str | None) -> str | None:
+    """"21:00", "9:05" 같은 입력을 "HH:MM" 으로 바꿉니다. 올바른 시각이 아니면 None 입니다."""
+    match = REMIND_AT_PATTERN.fullmatch((text or "").strip())
+    if match is None:
+        return None
+    hour, minute = int(match[1]), int(match[2])
+    if hour > 23 or minute > 59:
+        return None
+    return f"{hour:02d}:{minute:02d}"
+
+
+def reminder_message(channel_id: int | None) -> str:
+    where = f"<#{channel_id}> 에서 " if channel_id else ""
+    return (
+        "⏰ 오늘 아직 인증을 남기지 않았어요!\n"
+        f"{where}`/인증복사`로 오늘의 인증을 남겨보세요.\n\n"
+        "(알림을 끄려면 `/알림해제`)"
+    )
+
+
+class ReminderScheduler:
+    """오늘 인증하지 않은 유저에게 각자 설정한 시각에 DM 을 보내는 스케줄러입니다.
+
+    알림은 힙에 넣어 두고 다음 알림 시각까지 잠들므로, 유저 수와 관계없이 한가할 때는 거의 깨어나지 않습니다.
+    알림 시각을 바꾸면 새 항목을 넣고, 힙에 남은 옛 항목은 꺼낼 때 버립니다.
+    """
+
+    def __init__(self, tz: tzinfo, dm_rate: float, dm_burst: int, late_grace: float):
+        self.tz = tz
+        self.late_grace = late_grace
+        self._bucket = AsyncTokenBucket(dm_rate, dm_burst)
+        self._bot: commands.Bot | None = None
+
+        self._heap: list[tuple[float, int, int, str]] = []  # (알림 시각 timestamp, guild_id, user_id, "HH:MM")
+        self._remind_at: dict[Key, str] = {}  # 유저별 현재 알림 시각
+        self._posted: set[Key] = set()  # 오늘 인증한 유저
+        self._reminded: set[Key] = set()  # 오늘 알림을 보낸 유저
+        self._loaded_guilds: set[int] = set()  # 오늘 알림 설정을 읽은(읽는 중인) 길드
+        self._channels: dict[int, int] = {}  # 이 워커가 맡은 길드 ID -> 인증 채널 ID
+        self._day: date | None = None
+
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+        self._sending: set[asyncio.Task] = set()
+
+        self.sent_total = 0
+        self.forbidden_total = 0
+        self.failed_total = 0
+        self.skipped_total = 0
+        self.wakeups_total = 0
+
+    def today(self) -> date:
+        return datetime.now(self.tz).date()
+
+    def start(self, bot: commands.Bot) -> None:
+        self._bot = bot
+        if self._task is None or self._task.done():
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            # wake() 직후에 취소하면 wait_for 가 취소를 삼킬 수 있으므로 플래그로도 멈춥니다.
+            self._stopping = True
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for task in self._sending:
+            task.cancel()
+        if self._sending:
+            await asyncio.gather(*self._sending, return_exceptions=True)
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    def _roll_day(self) -> None:
+        """날짜가 바뀌었으면 어제의 일정과 기록을 비웁니다. (길드 알림 설정은 다음 루프에서 다시 읽습니다)"""
+        today = self.today()
+        if today == self._day:
+            return
+        self._day = today
+        self._heap.clear()
+        self._remind_at.clear()
+        self._posted.clear()
+        self._reminded.clear()
+        self._loaded_guilds.clear()
+
+    def mark_posted(self, guild_id: int, user_id: int) -> None:
+        """오늘 인증한 유저를 기록합니다. 인증을 올릴 때 호출합니다."""
+        if self._day is None:
+            # 스케줄러가 시작되지 않았습니다. (시작하면 인증 현황 집계로 오늘 인증한 유저를 채웁니다)
+            return
+        if self.today() != self._day:
+            # 자정 직후의 인증이 어제 기록과 함께 지워지지 않도록 먼저 날짜를 넘깁니다.
+            self._roll_day()
+            self.wake()
+        self._posted.add((guild_id, user_id))
+
+    def set_remind_at(self, guild_id: int, user_id: int, remind_at: str | None) -> None:
+        """바뀐 알림 시각(None 이면 끔)을 오늘 일정에 바로 반영합니다."""
+        if guild_id not in self._loaded_guilds:
+            # 아직 읽지 않은 길드는 읽을 때 DB 에 저장된 시각으로 반영됩니다.
+            return
+        key = (guild_id, user_id)
+        if remind_at is None:
+            self._remind_at.pop(key, None)
+        else:
+            self._remind_at[key] = remind_at
+            self._schedule(key, remind_at, time.time())
+        self.wake()
+
+    def _due_at(self, remind_at: str) -> float:
+        hour, minute = map(int, remind_at.split(":"))
+        return datetime(self._day.year, self._day.month, self._day.day, hour, minute, tzinfo=self.tz).timestamp()
+
+    def _next_midnight(self) -> float:
+        tomorrow = self._day + timedelta(days=1)
+        return datetime(tomorrow.year, tomorrow.month, tomorrow.day, tzinfo=self.tz).timestamp()
+
+    def _schedule(self, key: Key, remind_at: str, now: float) -> None:
+        due = self._due_at(remind_at)
+        # 이미 지난 시각은 재시작 등으로 놓친 경우만 late_grace 안에서 보냅니다.
+        if due >= now - self.late_grace:
+            heapq.heappush(self._heap, (due, key[0], key[1], remind_at))
+
+    def _scrum_channels(self) -> dict[int, int]:
+        """이 워커가 볼 수 있는 인증 채널을 채널이 속한 길드 ID 별로 반환합니다.
+
+        클러스터에서는 이 워커가 맡은 길드(샤드)의 채널만 보입니다. 설정의 guild_id 가 아니라 채널의 길드로 묶으므로
+        GUILD_ID 없이 CHANNEL_ID 만 지정한 기본 설정도 /알림설정 을 한 길드 ID 와 맞습니다.
+        """
+        channels = {}
+        for channel_id in guild_configs.scrum_channel_ids():
+            guild = getattr(self._bot.get_channel(channel_id), "guild", None)
+            if guild is not None:
+                channels[guild.id] = channel_id
+        return channels
+
+    async def _load_guilds(self) -> None:
+        self._channels = self._scrum_channels()
+        new_guild_ids = [guild_id for guild_id in self._channels if guild_id not in self._loaded_guilds]
+        if not new_guild_ids:
+            return
+        self._loaded_guilds.update(new_guild_ids)
+        await streak_store.load()
+        await asyncio.gather(*(self._load_guild(guild_id) for guild_id in new_guild_ids))
+
+    async def _load_guild(self, guild_id: int) -> None:
+        day = self._day
+        try:
+            rows = await list_scrum_reminders(str(guild_id))
+        except Exception as e:
+            logger.warning(f"인증 알림 설정 조회 실패 (guild_id={guild_id}), {GUILD_RELOAD_DELAY}초 뒤 다시 읽습니다: {e}")
+            asyncio.get_running_loop().call_later(GUILD_RELOAD_DELAY, self._reload_guild, guild_id, day)
+            return
+        if day != self._day:
+            # 읽는 사이에 날짜가 바뀌었으면 새 날짜로 다시 읽습니다.
+            return
+
+        channel_id = self._channels.get(guild_id)
+        now = time.time()
+        for row in rows:
+            remind_at = parse_remind_at(row["remind_at"])
+            if remind_at is None:
+                continue
+            key = (guild_id, int(row["user_id"]))
+            self._remind_at[key] = remind_at
+            # 재시작 전에 이미 인증했으면 인증 현황 집계로 알 수 있습니다.
+            streak = streak_store.get(str(channel_id), row["user_id"]) if channel_id else None
+            if streak is not None and streak.last_post_date == day:
+                self._posted.add(key)
+            self._schedule(key, remind_at, now)
+        logger.info(f"인증 알림 {len(rows)}개 예약 (guild_id={guild_id})")
+
+    def _reload_guild(self, guild_id: int, day: date) -> None:
+        if day == self._day:
+            self._loaded_guilds.discard(guild_id)
+            self.wake()
+
+    def _pop_due(self, now: float) -> list[Key]:
+        """알림 시각이 된 유저 중 오늘 아직 인증하지도, 알림을 받지도 않은 유저를 꺼냅니다."""
+        batch = []
+        while self._heap and self._heap[0][0] <= now:
+            _, guild_id, user_id, remind_at = heapq.heappop(self._heap)
+            key = (guild_id, user_id)
+            if self._remind_at.get(key) != remind_at:
+                # 시각을 바꾸거나 끈 알림의 옛 항목입니다.
+                continue
+            if key in self._posted or key in self._reminded:
+                self.skipped_total += 1
+                continue
+            self._reminded.add(key)
+            batch.append(key)
+        return batch
+
+    def _dispatch(self, batch: list[Key]) -> None:
+        # 보내는 동안에도 다음 알림 시각과 시각 변경을 처리하도록 백그라운드에서 보냅니다.
+        task = asyncio.create_task(self._send_batch(batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send_batch(self, batch: list[Key]) -> None:
+        await asyncio.gather(*(self._send(key) for key in batch))
+        logger.info(f"인증 알림 {len(batch)}건 처리 (누적 전송 {self.sent_total}건)")
+
+    async def _send(self, key: Key) -> None:
+        await self._bucket.acquire()
+        if key in self._posted:
+            # 차례를 기다리는 사이에 인증했습니다.
+            self.skipped_total += 1
+            return
+        guild_id, user_id = key
+        try:
+            channel = await self._bot.create_dm(discord.Object(id=user_id))
+            await channel.send(reminder_message(self._channels.get(guild_id)))
+            self.sent_total += 1
+        except discord.Forbidden:
+            # DM 을 막아 둔 유저입니다.
+            self.forbidden_total += 1
+        except Exception as e:
+            self.failed_total += 1
+            logger.warning(f"인증 알림 전송 실패 (user_id={user_id}): {e}")
+
+    async def _run(self) -> None:
+        await self._bot.wait_until_ready()
+        while not self._stopping:
+            self._roll_day()
+            try:
+                await self._load_guilds()
+            except Exception as e:
+                logger.error(f"인증 알림 설정 로드 중 오류 발생: {e}")
+
+            now = time.time()
+            batch = self._pop_due(now)
+            if batch:
+                self._dispatch(batch)
+
+            next_at = min(self._heap[0][0], self._next_midnight()) if self._heap else self._next_midnight()
+            self.wakeups_total += 1
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(next_at - time.time(), 0))
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def stats(self) -> dict:
+        """예약된 알림 수와 오늘의 전송 지표를 반환합니다."""
+        return {
+            "scheduled": len(self._heap),
+            "users": len(self._remind_at),
+            "posted_today": len(self._posted),
+            "reminded_today": len(self._reminded),
+            "sent_total": self.sent_total,
+            "forbidden_total": self.forbidden_total,
+            "failed_total": self.failed_total,
+            "skipped_total": self.skipped_total,
+            "wakeups_total": self.wakeups_total,
+        }
+
+
+# 인증 날짜와 같은 시간대(SCRUM_TIMEZONE)로 알림 시각을 해석합니다.
+reminder_scheduler = ReminderScheduler(
+    streak_store.tz,
+    dm_rate=REMINDER_DM_RATE,
+    dm_burst=REMINDER_DM_BURST,
+    late_grace=REMINDER_LATE_GRACE,
+)
@@ -0,0 +1,33 @@
+from app.config import REPOSITORY_BACKEND, SQLITE_DB_PATH
+from app.repositories.backends.base import RepositoryBackend
+
+
+_backend: RepositoryBackend | None = None
+
+
+def create_backend(name: str) -> RepositoryBackend:
+    """이름(supabase/memory/sqlite)에 해당하는 저장소를 만듭니다. 선택한 구현만 import 합니다."""
+    if name == "supabase":
+        from app.repositories.backends.supabase import SupabaseBackend
+        return SupabaseBackend()
+    if name == "memory":
+        from app.repositories.backends.memory import MemoryBackend
+        return MemoryBackend()
+    if name == "sqlite":
+        from app.repositories.backends.sqlite import SqliteBackend
+        return SqliteBackend(SQLITE_DB_PATH)
+    raise ValueError(f"지원하지 않는 REPOSITORY_BACKEND 입니다: {name}")
+
+
+def get_backend() -> RepositoryBackend:
+    """설정(REPOSITORY_BACKEND)에 따라 선택된 저장소를 반환합니다."""
+    global _backend
+    if _backend is None:
+        _backend = create_backend(REPOSITORY_BACKEND)
+    return _backend
+
+
+def set_backend(backend: RepositoryBackend) -> None:
+    """저장소를 직접 지정합니다. 벤치마크와 오프라인 실행에서 사용합니다."""
+    global _backend
+    _backend = backend
@@ -0,0 +1,86 @@
+from abc import ABC, abstractmethod
+
+
+class RepositoryBackend(ABC):
+    """repositories 가 사용하는 저장소 인터페이스입니다.
+
+    모든 레코드는 Supabase(PostgREST)가 돌려주는 것과 같은 모양의 dict 로 주고받습니다.
+    """
+
+    # scrum_entries
+    @abstractmethod
+    async def insert_scrum_entry(self, entry: dict) -> dict:
+        """인증 하나를 생성하고 저장된 레코드를 반환합니다."""
+
+    @abstractmethod
+    async def upsert_scrum_entries(self, entries: list[dict]) -> list[dict]:
+        """message_id 기준으로 인증을 일괄 생성하거나, 이미 있으면 덮어씁니다."""
+
+    @abstractmethod
+    async def insert_missing_scrum_entries(self, entries: list[dict]) -> list[dict]:
+        """message_id 기준으로 아직 없는 인증만 일괄 생성합니다."""
+
+    @abstractmethod
+    async def update_scrum_entry(self, message_id: str, data: dict) -> dict:
+        """message_id 에 해당하는 인증을 수정하고, 없으면 빈 dict 를 반환합니다."""
+
+    @abstractmethod
+    async def get_latest_scrum_entry(self, user_id: str, channel_id: str) -> dict | None:
+        """유저의 채널 내 가장 최근 인증을 반환합니다."""
+
+    @abstractmethod
+    async def get_recent_scrum_entries(self, channel_id: str, limit: int) -> list[dict]:
+        """채널의 최근 인증을 최신순으로 반환합니다."""
+
+    @abstractmethod
+    async def get_scrum_entries_page(
+        self,
+        channel_id: str | None,
+        after: tuple[str, int] | None,
+        limit: int,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> list[dict]:
+        """(created_at, id) 순으로 after 다음부터 인증을 limit 개 반환합니다. channel_id 가 None 이면 전체 채널입니다.
+
+        since/until 을 주면 since <= created_at < until 인 인증만 반환합니다. (UTC ISO 문자열)
+        """
+
+    # scrum_entry_edits
+    @abstractmethod
+    async def insert_scrum_edit(self, edit: dict) -> dict:
+        """수정 이력 하나를 추가합니다. 같은 (message_id, version)이 이미 있으면 건드리지 않고 빈 dict 를 반환합니다."""
+
+    @abstractmethod
+    async def get_scrum_edits(self, message_id: str, up_to: int | None, limit: int) -> list[dict]:
+        """message_id 의 수정 이력 중 version 이 up_to 이하인 것을 최신순으로 limit 개 반환합니다. (None 이면 전체)"""
+
+    # user_profiles
+    @abstractmethod
+    async def upsert_user_profile(self, data: dict) -> dict:
+        """user_id 기준으로 프로필을 생성하거나, 전달된 필드만 수정합니다."""
+
+    @abstractmethod
+    async def get_user_profile(self, user_id: str) -> dict | None:
+        """유저 프로필을 반환합니다."""
+
+    # guild_configs
+    @abstractmethod
+    async def get_guild_configs(self) -> list[dict]:
+        """모든 길드 설정을 반환합니다."""
+
+    @abstractmethod
+    async def upsert_guild_config(self, data: dict) -> dict:
+        """guild_id 기준으로 길드 설정을 생성하거나 수정합니다."""
+
+    # scrum_reminders
+    @abstractmethod
+    async def get_scrum_reminders(self, guild_id: str) -> list[dict]:
+        """길드에서 켜져 있는(remind_at 이 있는) 인증 알림을 모두 반환합니다."""
+
+    @abstractmethod
+    async def upsert_scrum_reminder(self, data: dict) -> dict:
+        """(guild_id, user_id) 기준으로 인증 알림을 생성하거나 수정합니다."""
+
+    async def close(self) -> None:
+        """백엔드가 잡고 있는 자원을 정리합니다."""
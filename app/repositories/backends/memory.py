@@ -0,0 +1,152 @@
+import itertools
+from datetime import datetime, timezone
+
+from app.repositories.backends.base import RepositoryBackend
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class MemoryBackend(RepositoryBackend):
+    """프로세스 메모리에만 저장하는 저장소입니다. 오프라인 실행과 부하 테스트용입니다."""
+
+    def __init__(self):
+        self._ids = itertools.count(1)
+        self.scrum_entries: dict[str, dict] = {}  # message_id -> 레코드
+        self.user_profiles: dict[str, dict] = {}  # user_id -> 레코드
+        self._latest: dict[tuple[str, str], str] = {}  # (user_id, channel_id) -> message_id
+        self.guild_configs: dict[str, dict] = {}  # guild_id -> 레코드
+        self.scrum_edits: dict[str, dict[int, dict]] = {}  # message_id -> version -> 레코드
+        self.scrum_reminders: dict[tuple[str, str], dict] = {}  # (guild_id, user_id) -> 레코드
+
+    def _index_latest(self, row: dict) -> None:
+        key = (row["user_id"], row["channel_id"])
+        current = self.scrum_entries.get(self._latest.get(key, ""))
+        if current is None or current["created_at"] <= row["created_at"]:
+            self._latest[key] = row["message_id"]
+
+    def _insert(self, entry: dict) -> dict:
+        row = {"updated_at": None, "is_edited": False, **entry, "id": next(self._ids)}
+        row.setdefault("created_at", _now())
+        self.scrum_entries[row["message_id"]] = row
+        self._index_latest(row)
+        return dict(row)
+
+    async def insert_scrum_entry(self, entry: dict) -> dict:
+        if entry["message_id"] in self.scrum_entries:
+            raise ValueError(f"duplicate message_id: {entry['message_id']}")
+        return self._insert(entry)
+
+    async def upsert_scrum_entries(self, entries: list[dict]) -> list[dict]:
+        saved = []
+        for entry in entries:
+            row = self.scrum_entries.get(entry["message_id"])
+            if row is None:
+                saved.append(self._insert(entry))
+            else:
+                row.update(entry)
+                self._index_latest(row)
+                saved.append(dict(row))
+        return saved
+
+    async def insert_missing_scrum_entries(self, entries: list[dict]) -> list[dict]:
+        return [self._insert(entry) for entry in entries if entry["message_id"] not in self.scrum_entries]
+
+    async def update_scrum_entry(self, message_id: str, data: dict) -> dict:
+        row = self.scrum_entries.get(str(message_id))
+        if row is None:
+            return {}
+        row.update(data)
+        return dict(row)
+
+    async def get_latest_scrum_entry(self, user_id: str, channel_id: str) -> dict | None:
+        message_id = self._latest.get((str(user_id), str(channel_id)))
+        row = self.scrum_entries.get(message_id) if message_id else None
+        return dict(row) if row else None
+
+    async def get_recent_scrum_entries(self, channel_id: str, limit: int) -> list[dict]:
+        rows = [row for row in self.scrum_entries.values() if row["channel_id"] == str(channel_id)]
+        rows.sort(key=lambda row: row["created_at"], reverse=True)
+        return [dict(row) for row in rows[:limit]]
+
+    async def get_scrum_entries_page(
+        self,
+        channel_id: str | None,
+        after: tuple[str, int] | None,
+        limit: int,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> list[dict]:
+        rows = [
+            row for row in self.scrum_entries.values()
+            if (channel_id is None or row["channel_id"] == str(channel_id))
+            and (after is None or (row["created_at"], row["id"]) > after)
+            and (since is None or row["created_at"] >= since)
+            and (until is None or row["created_at"] < until)
+        ]
+        rows.sort(key=lambda row: (row["created_at"], row["id"]))
+        return [dict(row) for row in rows[:limit]]
+
+    async def insert_scrum_edit(self, edit: dict) -> dict:
+        versions = self.scrum_edits.setdefault(edit["message_id"], {})
+        if edit["version"] in versions:
+            return {}
+        row = {"edited_by": None, **edit, "id": next(self._ids)}
+        row.setdefault("created_at", _now())
+        versions[row["version"]] = row
+        return dict(row)
+
+    async def get_scrum_edits(self, message_id: str, up_to: int | None, limit: int) -> list[dict]:
+        versions = self.scrum_edits.get(str(message_id), {})
+        rows = sorted(
+            (row for version, row in versions.items() if up_to is None or version <= up_to),
+            key=lambda row: row["version"],
+            reverse=True,
+        )
+        return [dict(row) for row in rows[:limit]]
+
+    async def upsert_user_profile(self, data: dict) -> dict:
+        row = self.user_profiles.get(data["user_id"])
+        if row is None:
+            row = {
+                "id": next(self._ids),
+                "monthly_goal": None,
+                "weekly_goal": None,
+                "routine": None,
+                "created_at": _now(),
+                "updated_at": None,
+            }
+            self.user_profiles[data["user_id"]] = row
+        row.update(data)
+        return dict(row)
+
+    async def get_user_profile(self, user_id: str) -> dict | None:
+        row = self.user_profiles.get(str(user_id))
+        return dict(row) if row else None
+
+    async def get_guild_configs(self) -> list[dict]:
+        return [dict(row) for row in self.guild_configs.values()]
+
+    async def upsert_guild_config(self, data: dict) -> dict:
+        for row in self.guild_configs.values():
+            if row["guild_id"] != data["guild_id"] and row["scrum_channel_id"] == data.get("scrum_channel_id"):
+                raise ValueError(f"duplicate scrum_channel_id: {data['scrum_channel_id']}")
+        row = self.guild_configs.setdefault(
+            data["guild_id"], {"admin_channel_id": None, "created_at": _now(), "updated_at": None}
+        )
+        row.update(data)
+        return dict(row)
+
+    async def get_scrum_reminders(self, guild_id: str) -> list[dict]:
+        return [
+            dict(row) for (row_guild_id, _), row in self.scrum_reminders.items()
+            if row_guild_id == str(guild_id) and row["remind_at"]
+        ]
+
+    async def upsert_scrum_reminder(self, data: dict) -> dict:
+        row = self.scrum_reminders.setdefault(
+            (data["guild_id"], data["user_id"]), {"remind_at": None, "created_at": _now(), "updated_at": None}
+        )
+        row.update(data)
+        return dict(row)
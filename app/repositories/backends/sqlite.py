@@ -0,0 +1,294 @@
+import json
+import sqlite3
+
+from app.database.local import LocalDatabase
+from app.repositories.backends.base import RepositoryBackend
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scrum_entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    yesterday_work TEXT NOT NULL,
+    today_plan TEXT NOT NULL,
+    comment TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')),
+    updated_at TEXT,
+    message_id TEXT NOT NULL,
+    channel_id TEXT NOT NULL,
+    is_edited INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_scrum_entries_message_id ON scrum_entries(message_id);
+CREATE INDEX IF NOT EXISTS idx_scrum_entries_user_channel_created_at ON scrum_entries(user_id, channel_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_scrum_entries_channel_created_at ON scrum_entries(channel_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_scrum_entries_created_at ON scrum_entries(created_at);
+
+CREATE TABLE IF NOT EXISTS scrum_entry_edits (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    message_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    edited_by TEXT,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')),
+    UNIQUE (message_id, version)
+);
+
+CREATE TABLE IF NOT EXISTS user_profiles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL UNIQUE,
+    monthly_goal TEXT,
+    weekly_goal TEXT,
+    routine TEXT,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')),
+    updated_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS scrum_reminders (
+    guild_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    remind_at TEXT,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')),
+    updated_at TEXT,
+    PRIMARY KEY (guild_id, user_id)
+);
+
+CREATE TABLE IF NOT EXISTS guild_configs (
+    guild_id TEXT PRIMARY KEY,
+    scrum_channel_id TEXT NOT NULL UNIQUE,
+    admin_channel_id TEXT,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')),
+    updated_at TEXT
+);
+"""
+
+SCRUM_ENTRY_COLUMNS = frozenset(
+    ("user_id", "yesterday_work", "today_plan", "comment", "created_at", "updated_at", "message_id", "channel_id", "is_edited")
+)
+SCRUM_EDIT_COLUMNS = frozenset(("message_id", "version", "kind", "payload", "edited_by", "created_at"))
+USER_PROFILE_COLUMNS = frozenset(("user_id", "monthly_goal", "weekly_goal", "routine", "created_at", "updated_at"))
+GUILD_CONFIG_COLUMNS = frozenset(("guild_id", "scrum_channel_id", "admin_channel_id", "created_at", "updated_at"))
+SCRUM_REMINDER_COLUMNS = frozenset(("guild_id", "user_id", "remind_at", "created_at", "updated_at"))
+
+
+def _scrum_row(row: sqlite3.Row | None) -> dict | None:
+    if row is None:
+        return None
+    data = dict(row)
+    data["is_edited"] = bool(data["is_edited"])
+    return data
+
+
+def _edit_row(row: sqlite3.Row | None) -> dict | None:
+    if row is None:
+        return None
+    data = dict(row)
+    data["payload"] = json.loads(data["payload"])
+    return data
+
+
+def _columns(data: dict, allowed: frozenset) -> list[str]:
+    # 컬럼 이름은 SQL 에 직접 들어가므로 허용된 이름만 사용합니다.
+    unknown = set(data) - allowed
+    if unknown:
+        raise ValueError(f"unknown columns: {sorted(unknown)}")
+    return list(data)
+
+
+def _insert_sql(table: str, columns: list[str], conflict: str | None = None, on_conflict: str = "") -> str:
+    placeholders = ", ".join(f":{column}" for column in columns)
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+    if conflict:
+        sql += f" ON CONFLICT({conflict}) {on_conflict}"
+    return sql
+
+
+def _update_set(columns: list[str], key: str) -> str:
+    assignments = [f"{column} = excluded.{column}" for column in columns if column != key]
+    return "DO UPDATE SET " + ", ".join(assignments) if assignments else "DO NOTHING"
+
+
+class SqliteBackend(RepositoryBackend):
+    """로컬 SQLite 파일에 저장하는 저장소입니다. 원격 DB 없이 소규모로 운영하거나 오프라인 벤치마크에 사용합니다."""
+
+    def __init__(self, path: str):
+        self.db = LocalDatabase(path)
+        self._ready = False
+
+    async def _ensure_schema(self) -> None:
+        if not self._ready:
+            await self.db.executescript(SQLITE_SCHEMA)
+            self._ready = True
+
+    async def _write_scrum_entries(self, entries: list[dict], on_conflict: str) -> list[dict]:
+        await self._ensure_schema()
+
+        def _write(conn: sqlite3.Connection) -> list[dict]:
+            saved = []
+            for entry in entries:
+                columns = _columns(entry, SCRUM_ENTRY_COLUMNS)
+                clause = _update_set(columns, "message_id") if on_conflict == "update" else "DO NOTHING"
+                cursor = conn.execute(_insert_sql("scrum_entries", columns, "message_id", clause), entry)
+                if cursor.rowcount:
+                    row = conn.execute("SELECT * FROM scrum_entries WHERE message_id = ?", (entry["message_id"],)).fetchone()
+                    saved.append(_scrum_row(row))
+            return saved
+
+        return await self.db.run(_write)
+
+    async def insert_scrum_entry(self, entry: dict) -> dict:
+        await self._ensure_schema()
+
+        def _insert(conn: sqlite3.Connection) -> dict:
+            cursor = conn.execute(_insert_sql("scrum_entries", _columns(entry, SCRUM_ENTRY_COLUMNS)), entry)
+            row = conn.execute("SELECT * FROM scrum_entries WHERE id = ?", (cursor.lastrowid,)).fetchone()
+            return _scrum_row(row)
+
+        return await self.db.run(_insert)
+
+    async def upsert_scrum_entries(self, entries: list[dict]) -> list[dict]:
+        return await self._write_scrum_entries(entries, on_conflict="update")
+
+    async def insert_missing_scrum_entries(self, entries: list[dict]) -> list[dict]:
+        return await self._write_scrum_entries(entries, on_conflict="ignore")
+
+    async def update_scrum_entry(self, message_id: str, data: dict) -> dict:
+        await self._ensure_schema()
+        columns = _columns(data, SCRUM_ENTRY_COLUMNS)
+
+        def _update(conn: sqlite3.Connection) -> dict:
+            assignments = ", ".join(f"{column} = :{column}" for column in columns)
+            conn.execute(
+                f"UPDATE scrum_entries SET {assignments} WHERE message_id = :_message_id",
+                {**data, "_message_id": str(message_id)},
+            )
+            row = conn.execute("SELECT * FROM scrum_entries WHERE message_id = ?", (str(message_id),)).fetchone()
+            return _scrum_row(row) or {}
+
+        return await self.db.run(_update)
+
+    async def get_latest_scrum_entry(self, user_id: str, channel_id: str) -> dict | None:
+        await self._ensure_schema()
+        row = await self.db.fetchone(
+            "SELECT * FROM scrum_entries WHERE user_id = ? AND channel_id = ? ORDER BY created_at DESC LIMIT 1",
+            (str(user_id), str(channel_id)),
+        )
+        return _scrum_row(row)
+
+    async def get_recent_scrum_entries(self, channel_id: str, limit: int) -> list[dict]:
+        await self._ensure_schema()
+        rows = await self.db.fetchall(
+            "SELECT * FROM scrum_entries WHERE channel_id = ? ORDER BY created_at DESC LIMIT ?",
+            (str(channel_id), limit),
+        )
+        return [_scrum_row(row) for row in rows]
+
+    async def get_scrum_entries_page(
+        self,
+        channel_id: str | None,
+        after: tuple[str, int] | None,
+        limit: int,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> list[dict]:
+        await self._ensure_schema()
+        conditions, params = [], []
+        if channel_id is not None:
+            conditions.append("channel_id = ?")
+            params.append(str(channel_id))
+        if since is not None:
+            conditions.append("created_at >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("created_at < ?")
+            params.append(until)
+        if after is not None:
+            conditions.append("(created_at, id) > (?, ?)")
+            params.extend(after)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = await self.db.fetchall(
+            f"SELECT * FROM scrum_entries {where} ORDER BY created_at, id LIMIT ?",
+            (*params, limit),
+        )
+        return [_scrum_row(row) for row in rows]
+
+    async def insert_scrum_edit(self, edit: dict) -> dict:
+        await self._ensure_schema()
+        columns = _columns(edit, SCRUM_EDIT_COLUMNS)
+        # payload 는 JSON 문자열로 저장합니다. (Supabase 는 JSONB)
+        params = {**edit, "payload": json.dumps(edit["payload"], ensure_ascii=False)}
+
+        def _insert(conn: sqlite3.Connection) -> dict:
+            cursor = conn.execute(_insert_sql("scrum_entry_edits", columns, "message_id, version", "DO NOTHING"), params)
+            if not cursor.rowcount:
+                return {}
+            row = conn.execute("SELECT * FROM scrum_entry_edits WHERE id = ?", (cursor.lastrowid,)).fetchone()
+            return _edit_row(row)
+
+        return await self.db.run(_insert)
+
+    async def get_scrum_edits(self, message_id: str, up_to: int | None, limit: int) -> list[dict]:
+        await self._ensure_schema()
+        rows = await self.db.fetchall(
+            "SELECT * FROM scrum_entry_edits WHERE message_id = ? AND (? IS NULL OR version <= ?) "
+            "ORDER BY version DESC LIMIT ?",
+            (str(message_id), up_to, up_to, limit),
+        )
+        return [_edit_row(row) for row in rows]
+
+    async def upsert_user_profile(self, data: dict) -> dict:
+        await self._ensure_schema()
+        columns = _columns(data, USER_PROFILE_COLUMNS)
+
+        def _upsert(conn: sqlite3.Connection) -> dict:
+            conn.execute(_insert_sql("user_profiles", columns, "user_id", _update_set(columns, "user_id")), data)
+            row = conn.execute("SELECT * FROM user_profiles WHERE user_id = ?", (data["user_id"],)).fetchone()
+            return dict(row)
+
+        return await self.db.run(_upsert)
+
+    async def get_user_profile(self, user_id: str) -> dict | None:
+        await self._ensure_schema()
+        row = await self.db.fetchone("SELECT * FROM user_profiles WHERE user_id = ?", (str(user_id),))
+        return dict(row) if row else None
+
+    async def get_guild_configs(self) -> list[dict]:
+        await self._ensure_schema()
+        return [dict(row) for row in await self.db.fetchall("SELECT * FROM guild_configs")]
+
+    async def upsert_guild_config(self, data: dict) -> dict:
+        await self._ensure_schema()
+        columns = _columns(data, GUILD_CONFIG_COLUMNS)
+
+        def _upsert(conn: sqlite3.Connection) -> dict:
+            conn.execute(_insert_sql("guild_configs", columns, "guild_id", _update_set(columns, "guild_id")), data)
+            row = conn.execute("SELECT * FROM guild_configs WHERE guild_id = ?", (data["guild_id"],)).fetchone()
+            return dict(row)
+
+        return await self.db.run(_upsert)
+
+    async def get_scrum_reminders(self, guild_id: str) -> list[dict]:
+        await self._ensure_schema()
+        rows = await self.db.fetchall(
+            "SELECT * FROM scrum_reminders WHERE guild_id = ? AND remind_at IS NOT NULL", (str(guild_id),)
+        )
+        return [dict(row) for row in rows]
+
+    async def upsert_scrum_reminder(self, data: dict) -> dict:
+        await self._ensure_schema()
+        columns = _columns(data, SCRUM_REMINDER_COLUMNS)
+        clause = "DO UPDATE SET " + ", ".join(
+            f"{column} = excluded.{column}" for column in columns if column not in ("guild_id", "user_id")
+        )
+
+        def _upsert(conn: sqlite3.Connection) -> dict:
+            conn.execute(_insert_sql("scrum_reminders", columns, "guild_id, user_id", clause), data)
+            row = conn.execute(
+                "SELECT * FROM scrum_reminders WHERE guild_id = ? AND user_id = ?", (data["guild_id"], data["user_id"])
+            ).fetchone()
+            return dict(row)
+
+        return await self.db.run(_upsert)
+
+    async def close(self) -> None:
+        self.db.close()
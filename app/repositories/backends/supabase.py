@@ -0,0 +1,125 @@
+from app.database.supabase import get_supabase
+from app.repositories.backends.base import RepositoryBackend
+
+
+class SupabaseBackend(RepositoryBackend):
+    """Supabase(PostgREST) 저장소입니다."""
+
+    async def insert_scrum_entry(self, entry: dict) -> dict:
+        result = await get_supabase().table("scrum_entries").insert(entry).execute()
+        return result.data[0] if result.data else {}
+
+    async def upsert_scrum_entries(self, entries: list[dict]) -> list[dict]:
+        # 배치에 키가 다른 행이 섞여도 빠진 컬럼을 NULL 이 아니라 기본값으로 채우게 합니다.
+        result = await (
+            get_supabase().table("scrum_entries")
+            .upsert(entries, on_conflict="message_id", default_to_null=False)
+            .execute()
+        )
+        return result.data or []
+
+    async def insert_missing_scrum_entries(self, entries: list[dict]) -> list[dict]:
+        result = await (
+            get_supabase().table("scrum_entries")
+            .upsert(entries, on_conflict="message_id", ignore_duplicates=True, default_to_null=False)
+            .execute()
+        )
+        return result.data or []
+
+    async def update_scrum_entry(self, message_id: str, data: dict) -> dict:
+        result = await (
+            get_supabase().table("scrum_entries")
+            .update(data)
+            .eq("message_id", str(message_id))
+            .execute()
+        )
+        return result.data[0] if result.data else {}
+
+    async def get_latest_scrum_entry(self, user_id: str, channel_id: str) -> dict | None:
+        result = await (
+            get_supabase().table("scrum_entries")
+            .select("*")
+            .eq("user_id", str(user_id))
+            .eq("channel_id", str(channel_id))
+            .order("created_at", desc=True)
+            .limit(1)
+            .execute()
+        )
+        return result.data[0] if result.data else None
+
+    async def get_recent_scrum_entries(self, channel_id: str, limit: int) -> list[dict]:
+        result = await (
+            get_supabase().table("scrum_entries")
+            .select("user_id, message_id, channel_id, yesterday_work, today_plan, comment")
+            .eq("channel_id", str(channel_id))
+            .order("created_at", desc=True)
+            .limit(limit)
+            .execute()
+        )
+        return result.data or []
+
+    async def get_scrum_entries_page(
+        self,
+        channel_id: str | None,
+        after: tuple[str, int] | None,
+        limit: int,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> list[dict]:
+        query = get_supabase().table("scrum_entries").select("*")
+        if channel_id is not None:
+            query = query.eq("channel_id", str(channel_id))
+        if since is not None:
+            query = query.gte("created_at", since)
+        if until is not None:
+            query = query.lt("created_at", until)
+        if after is not None:
+            created_at, row_id = after
+            query = query.or_(f'created_at.gt."{created_at}",and(created_at.eq."{created_at}",id.gt.{int(row_id)})')
+        result = await query.order("created_at").order("id").limit(limit).execute()
+        return result.data or []
+
+    async def insert_scrum_edit(self, edit: dict) -> dict:
+        result = await (
+            get_supabase().table("scrum_entry_edits")
+            .upsert(edit, on_conflict="message_id,version", ignore_duplicates=True)
+            .execute()
+        )
+        return result.data[0] if result.data else {}
+
+    async def get_scrum_edits(self, message_id: str, up_to: int | None, limit: int) -> list[dict]:
+        query = get_supabase().table("scrum_entry_edits").select("*").eq("message_id", str(message_id))
+        if up_to is not None:
+            query = query.lte("version", up_to)
+        result = await query.order("version", desc=True).limit(limit).execute()
+        return result.data or []
+
+    async def upsert_user_profile(self, data: dict) -> dict:
+        result = await get_supabase().table("user_profiles").upsert(data, on_conflict="user_id").execute()
+        return result.data[0] if result.data else {}
+
+    async def get_user_profile(self, user_id: str) -> dict | None:
+        result = await get_supabase().table("user_profiles").select("*").filter("user_id", "eq", str(user_id)).maybe_single().execute()
+        return result.data if result else None
+
+    async def get_guild_configs(self) -> list[dict]:
+        result = await get_supabase().table("guild_configs").select("*").execute()
+        return result.data or []
+
+    async def upsert_guild_config(self, data: dict) -> dict:
+        result = await get_supabase().table("guild_configs").upsert(data, on_conflict="guild_id").execute()
+        return result.data[0] if result.data else {}
+
+    async def get_scrum_reminders(self, guild_id: str) -> list[dict]:
+        result = await (
+            get_supabase().table("scrum_reminders")
+            .select("*")
+            .eq("guild_id", str(guild_id))
+            .not_.is_("remind_at", "null")
+            .execute()
+        )
+        return result.data or []
+
+    async def upsert_scrum_reminder(self, data: dict) -> dict:
+        result = await get_supabase().table("scrum_reminders").upsert(data, on_conflict="guild_id,user_id").execute()
+        return result.data[0] if result.data else {}
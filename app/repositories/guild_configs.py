@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+
+from app.metrics import observe_repository
+from app.repositories.backends import get_backend
+from app.repositories.resilience import IDEMPOTENT_WRITE, READ, call
+
+
+@observe_repository
+async def list_guild_configs() -> list[dict]:
+    """모든 길드의 인증/관리자 채널 설정을 조회합니다."""
+    return await call("list_guild_configs", "길드 설정 조회", lambda: get_backend().get_guild_configs(), READ)
+
+
+@observe_repository
+async def upsert_guild_config(guild_id: str, scrum_channel_id: str, admin_channel_id: str | None) -> dict:
+    """길드의 인증/관리자 채널 설정을 생성 또는 업데이트 합니다."""
+    data = {
+        "guild_id": str(guild_id),
+        "scrum_channel_id": str(scrum_channel_id),
+        "admin_channel_id": str(admin_channel_id) if admin_channel_id else None,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }
+    return await call(
+        "upsert_guild_config",
+        "길드 설정 생성 또는 업데이트",
+        lambda: get_backend().upsert_guild_config(data),
+        IDEMPOTENT_WRITE,
+    )
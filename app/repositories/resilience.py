@@ -0,0 +1,199 @@
+## 저장소 호출 보호
+# repositories 함수는 저장소(Supabase 등) 호출을 call() 로 감싸 실행합니다.
+#   - 시도마다 시간 한도(timeout), 재시도까지 합친 전체 기한(deadline)
+#   - 멱등 호출만 지터를 섞은 지수 백오프로 재시도
+#   - 연속 실패가 쌓이면 회로를 열어 한동안 저장소를 부르지 않고 바로 실패 (RepositoryUnavailable)
+#   - 선택적으로 느린 조회에 같은 요청을 한 번 더 보내 먼저 온 응답을 사용 (hedged read)
+# 실패는 RepositoryError 계열로 올리므로 코그는 종류에 따라 캐시/대체값으로 진행할 수 있습니다.
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, TypeVar
+
+from app.config import (
+    REPOSITORY_BREAKER_RESET,
+    REPOSITORY_BREAKER_THRESHOLD,
+    REPOSITORY_BULK_TIMEOUT,
+    REPOSITORY_DEADLINE,
+    REPOSITORY_READ_HEDGE_AFTER,
+    REPOSITORY_RETRIES,
+    REPOSITORY_RETRY_BASE_DELAY,
+    REPOSITORY_TIMEOUT,
+)
+from app.log import logger
+from app.metrics import REPOSITORY_HEDGES, REPOSITORY_RETRIES as REPOSITORY_RETRY_COUNT
+
+
+T = TypeVar("T")
+
+
+class RepositoryError(Exception):
+    """저장소 호출 실패"""
+
+
+class RepositoryTimeout(RepositoryError):
+    """시간 한도 안에 저장소가 응답하지 않음"""
+
+
+class RepositoryUnavailable(RepositoryError):
+    """회로가 열려 있어 저장소를 호출하지 않음"""
+
+
+@dataclass(frozen=True)
+class CallPolicy:
+    timeout: float  # 시도 한 번의 시간 한도(초)
+    deadline: float  # 재시도를 포함한 전체 시간 한도(초)
+    retries: int = 0  # 멱등 호출만 재시도합니다.
+    hedge_after: float = 0.0  # 이 시간(초) 안에 응답이 없으면 같은 조회를 한 번 더 보냅니다. (0이면 끔)
+
+
+# 짧은 조회/멱등 쓰기
+READ = CallPolicy(REPOSITORY_TIMEOUT, REPOSITORY_DEADLINE, REPOSITORY_RETRIES)
+IDEMPOTENT_WRITE = CallPolicy(REPOSITORY_TIMEOUT, REPOSITORY_DEADLINE, REPOSITORY_RETRIES)
+# 다시 보내면 중복이 생길 수 있는 쓰기 (message_id 없는 insert)
+WRITE = CallPolicy(REPOSITORY_TIMEOUT, REPOSITORY_TIMEOUT)
+# 인터랙션 응답을 기다리게 하는 조회 (유저 프로필)
+HEDGED_READ = CallPolicy(REPOSITORY_TIMEOUT, REPOSITORY_DEADLINE, REPOSITORY_RETRIES, REPOSITORY_READ_HEDGE_AFTER)
+# 백필/재계산/내보내기처럼 한 번에 많은 행을 읽고 쓰는 호출
+BULK = CallPolicy(REPOSITORY_BULK_TIMEOUT, REPOSITORY_BULK_TIMEOUT * (REPOSITORY_RETRIES + 1), REPOSITORY_RETRIES)
+
+
+class CircuitBreaker:
+    """연속 실패가 threshold 번 쌓이면 reset_timeout 초 동안 호출을 막는 회로 차단기입니다.
+
+    reset_timeout 이 지나면 시험 호출 하나만 통과시키고(half-open), 성공하면 다시 닫습니다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, threshold: int, reset_timeout: float):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self.opened_total = 0
+        self.rejected_total = 0
+
+    def allow(self) -> bool:
+        if self.threshold <= 0 or self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.rejected_total += 1
+        return False
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            logger.info("저장소 회로를 닫습니다. (시험 호출 성공)")
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN or (self.state == self.CLOSED and self.failures >= self.threshold > 0):
+            if self.state == self.CLOSED:
+                logger.warning(f"저장소 호출이 연속 {self.failures}번 실패해 {self.reset_timeout:.0f}초 동안 회로를 엽니다.")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self.opened_total += 1
+        self._probing = False
+
+    def abandon(self) -> None:
+        """결과 없이 취소된 호출이 시험 호출 자리를 계속 차지하지 않게 합니다."""
+        self._probing = False
+
+    def stats(self) -> dict:
+        return {
+            "open": 1 if self.state == self.OPEN else 0,
+            "half_open": 1 if self.state == self.HALF_OPEN else 0,
+            "consecutive_failures": self.failures,
+            "opened_total": self.opened_total,
+            "rejected_total": self.rejected_total,
+        }
+
+
+# 저장소는 하나이므로 회로도 하나를 함께 씁니다.
+repository_breaker = CircuitBreaker(REPOSITORY_BREAKER_THRESHOLD, REPOSITORY_BREAKER_RESET)
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+async def _hedged(operation: str, func: Callable[[], Awaitable[T]], hedge_after: float) -> T:
+    """첫 요청이 hedge_after 초 안에 끝나지 않으면 같은 요청을 한 번 더 보내 먼저 성공한 결과를 씁니다."""
+    first = asyncio.ensure_future(func())
+    first.add_done_callback(_consume_exception)
+    done, _ = await asyncio.wait({first}, timeout=hedge_after)
+    if done:
+        return first.result()
+
+    REPOSITORY_HEDGES.labels(operation).inc()
+    second = asyncio.ensure_future(func())
+    second.add_done_callback(_consume_exception)
+    pending = {first, second}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+        # 둘 다 실패하면 첫 요청의 오류를 올립니다.
+        return first.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def call(operation: str, action: str, func: Callable[[], Awaitable[T]], policy: CallPolicy) -> T:
+    """저장소 호출 func() 를 policy 에 따라 실행합니다.
+
+    실패하면 f"{action} 중 오류 발생: ..." 메시지의 RepositoryError(시간 초과는 RepositoryTimeout,
+    회로가 열려 있으면 RepositoryUnavailable)를 올립니다.
+    """
+    deadline = time.monotonic() + policy.deadline
+    attempt = 0
+    while True:
+        if not repository_breaker.allow():
+            raise RepositoryUnavailable(f"{action} 중 오류 발생: 저장소 회로가 열려 있습니다.")
+
+        remaining = deadline - time.monotonic()
+        timeout = min(policy.timeout, remaining)
+        try:
+            if policy.hedge_after > 0:
+                result = await asyncio.wait_for(_hedged(operation, func, policy.hedge_after), timeout)
+            else:
+                result = await asyncio.wait_for(func(), timeout)
+        except asyncio.CancelledError:
+            repository_breaker.abandon()
+            raise
+        except Exception as e:
+            repository_breaker.record_failure()
+            cause = e
+            error = (
+                RepositoryTimeout(f"{action} 중 오류 발생: {timeout:.1f}초 안에 응답이 없습니다.")
+                if isinstance(e, asyncio.TimeoutError)
+                else RepositoryError(f"{action} 중 오류 발생: {str(e)}")
+            )
+        else:
+            repository_breaker.record_success()
+            return result
+
+        attempt += 1
+        # 지터를 섞은 지수 백오프 (여러 요청이 같은 순간에 몰려 재시도하지 않도록)
+        delay = random.uniform(0, REPOSITORY_RETRY_BASE_DELAY * 2 ** (attempt - 1))
+        if attempt > policy.retries or time.monotonic() + delay >= deadline:
+            raise error from cause
+        REPOSITORY_RETRY_COUNT.labels(operation).inc()
+        logger.warning(f"{operation} 재시도 ({attempt}/{policy.retries}): {error}")
+        await asyncio.sleep(delay)
@@ -1,8 +1,32 @@
+import asyncio
+import time
 from datetime import datetime, timezone
-from app.database.supabase import supabase
+from typing import AsyncIterator
 
+from app.config import (
+    OUTBOX_MAX_BACKOFF,
+    OUTBOX_REPLAY_BATCH_SIZE,
+    SCRUM_WRITE_BATCH_SIZE,
+    SCRUM_WRITE_FLUSH_INTERVAL,
+    SCRUM_WRITE_MAX_RETRIES,
+)
+from app.database.cache_events import cache_bus
+from app.database.outbox import OP_CREATE, OP_UPDATE, ScrumOutbox, scrum_outbox
+from app.database.streaks import UserStreak, streak_store
+from app.log import logger
+from app.metrics import observe_repository
+from app.repositories.backends import get_backend
+from app.repositories.resilience import BULK, IDEMPOTENT_WRITE, READ, RepositoryError, call
 
-async def create_scrum_entry(
+
+# write-behind 큐가 처리 중인 생성 작업은 이 시간(초) 동안 outbox 재전송 대상에서 제외합니다.
+OUTBOX_HANDOFF_DELAY = 60
+
+# 재전송을 맡지 않은 워커가 0번 워커의 재전송 작업을 깨울 때 쓰는 캐시 이벤트 이름
+OUTBOX_WAKE_EVENT = "scrum_outbox"
+
+
+def _build_scrum_entry(
     user_id: str,
     yesterday_work: str,
     today_plan: str,
@@ -10,32 +34,380 @@ async def create_scrum_entry(
     message_id: str,
     channel_id: str,
 ) -> dict:
-    """새로운 스크럼 인증을 생성합니다."""
+    return {
+        "user_id": str(user_id),
+        "yesterday_work": yesterday_work,
+        "today_plan": today_plan,
+        "comment": comment,
+        "message_id": str(message_id),
+        "channel_id": str(channel_id),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        # 배치 upsert 는 모든 행의 키를 합친 컬럼으로 보내므로, 수정 컬럼도 처음부터 채워 행마다 키를 같게 둡니다.
+        # (빠진 키는 NULL 로 보내져 is_edited NOT NULL 을 어깁니다)
+        "updated_at": None,
+        "is_edited": False,
+    }
+
+
+async def _record_streak(entry: dict) -> UserStreak | None:
+    # 집계 갱신 실패가 인증 등록을 막지 않도록 합니다. (/인증현황재계산 으로 바로잡을 수 있습니다)
     try:
-        data = {
-            "user_id": str(user_id),
-            "yesterday_work": yesterday_work,
-            "today_plan": today_plan,
-            "comment": comment,
-            "message_id": str(message_id),
-            "channel_id": str(channel_id),
-            "created_at": datetime.now(timezone.utc).isoformat(),
+        return await streak_store.record_post(
+            entry["channel_id"],
+            entry["user_id"],
+            entry["message_id"],
+            datetime.fromisoformat(entry["created_at"]),
+        )
+    except Exception as e:
+        logger.warning(f"인증 현황 갱신 실패 (message_id={entry['message_id']}): {e}")
+        return None
+
+
+@observe_repository
+async def create_scrum_entries(entries: list[dict]) -> list[dict]:
+    """여러 스크럼 인증을 한 번의 요청으로 생성합니다.
+
+    message_id 기준 upsert이므로 같은 배치를 다시 보내도 중복 생성되지 않습니다.
+    """
+    return await call(
+        "create_scrum_entries",
+        "스크럼 인증 일괄 생성",
+        lambda: get_backend().upsert_scrum_entries(entries),
+        IDEMPOTENT_WRITE,
+    )
+
+
+@observe_repository
+async def import_scrum_entries(entries: list[dict]) -> list[dict]:
+    """과거 인증을 일괄로 가져옵니다. 이미 저장된 message_id는 건드리지 않습니다."""
+    return await call(
+        "import_scrum_entries",
+        "스크럼 인증 가져오기",
+        lambda: get_backend().insert_missing_scrum_entries(entries),
+        BULK,
+    )
+
+
+@observe_repository
+async def _apply_scrum_update(message_id: str, data: dict) -> dict:
+    return await call(
+        "update_scrum_entry",
+        "스크럼 인증 수정",
+        lambda: get_backend().update_scrum_entry(str(message_id), data),
+        IDEMPOTENT_WRITE,
+    )
+
+
+class ScrumOutboxReplayer:
+    """로컬 outbox에 쌓인 생성/수정 작업을 저장소(Supabase 등)로 재전송하는 백그라운드 작업입니다.
+
+    생성은 한 번의 upsert로, 수정은 message_id 기준 update로 보내므로 몇 번을 재전송해도 결과가 같습니다.
+    실패한 작업은 지수 백오프 후 다시 시도하며, 성공하기 전에는 outbox에서 지우지 않습니다.
+    """
+
+    def __init__(
+        self,
+        outbox: ScrumOutbox,
+        batch_size: int,
+        max_backoff: float,
+        base_backoff: float = 1.0,
+        poll_interval: float = 30.0,
+    ):
+        self.outbox = outbox
+        self.batch_size = batch_size
+        self.max_backoff = max_backoff
+        self.base_backoff = base_backoff
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+        self._publishing: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._stopping = False
+            self._task = asyncio.create_task(self._run(started_at=time.time()))
+
+    async def stop(self) -> None:
+        if self._task:
+            # wake() 직후에 취소하면 wait_for 가 깨어난 결과를 돌려주며 취소를 삼킬 수 있으므로 플래그로도 멈춥니다.
+            self._stopping = True
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def wake(self) -> None:
+        """바로 재전송하게 합니다.
+
+        outbox 를 함께 쓰는 클러스터에서는 0번 워커만 재전송하므로, 재전송을 돌리지 않는 워커는
+        캐시 이벤트 버스로 0번 워커를 깨웁니다. (poll_interval 까지 기다리지 않도록)
+        """
+        if self._task is not None:
+            self._wakeup.set()
+            return
+        if cache_bus.enabled:
+            task = asyncio.create_task(cache_bus.publish(OUTBOX_WAKE_EVENT, "wake"))
+            self._publishing.add(task)
+            task.add_done_callback(self._publishing.discard)
+
+    def on_wake_event(self, key: str) -> None:
+        """다른 워커가 보낸 깨우기 이벤트입니다. 재전송을 돌리는 워커만 깨어납니다."""
+        if self._task is not None:
+            self._wakeup.set()
+
+    async def _run(self, started_at: float) -> None:
+        # 시작 전에 남아 있던 작업만 백오프와 관계없이 모두 재전송합니다.
+        # (시작 직후 큐에 들어온 생성 작업까지 앞당기면 같은 인증을 두 번 저장하게 됩니다)
+        try:
+            await self.outbox.make_due(created_before=started_at)
+        except Exception as e:
+            logger.error(f"outbox 초기화 실패: {e}")
+
+        while not self._stopping:
+            try:
+                replayed = await self.replay_once()
+            except Exception as e:
+                logger.error(f"outbox 재전송 중 오류 발생: {e}")
+                replayed = 0
+
+            if replayed >= self.batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def replay_once(self) -> int:
+        """재전송할 때가 된 작업을 한 배치 처리하고 처리한 건수를 반환합니다."""
+        items = await self.outbox.due(self.batch_size)
+        creates = [item for item in items if item.op == OP_CREATE]
+        updates = [item for item in items if item.op == OP_UPDATE]
+
+        if creates:
+            try:
+                await create_scrum_entries([item.payload for item in creates])
+                await self.outbox.delete(OP_CREATE, [item.message_id for item in creates])
+                logger.info(f"outbox 생성 {len(creates)}건 재전송 완료")
+            except Exception as e:
+                logger.warning(f"outbox 생성 {len(creates)}건 재전송 실패: {e}")
+                await self.outbox.reschedule(creates, str(e), self.base_backoff, self.max_backoff)
+
+        for item in updates:
+            try:
+                await _apply_scrum_update(item.message_id, item.payload)
+                await self.outbox.delete(OP_UPDATE, [item.message_id])
+            except Exception as e:
+                logger.warning(f"outbox 수정 재전송 실패 (message_id={item.message_id}): {e}")
+                await self.outbox.reschedule([item], str(e), self.base_backoff, self.max_backoff)
+
+        return len(items)
+
+
+class ScrumEntryWriteQueue:
+    """스크럼 인증 생성을 모아 다건 insert로 저장하는 write-behind 큐입니다.
+
+    배치 크기에 도달하거나 flush_interval이 지나면 한 번에 저장합니다.
+    실패한 배치는 max_retries 만큼 재시도한 뒤 outbox 재전송 작업에 넘깁니다.
+    """
+
+    def __init__(
+        self,
+        outbox: ScrumOutbox,
+        replayer: ScrumOutboxReplayer,
+        batch_size: int,
+        flush_interval: float,
+        max_retries: int,
+        retry_backoff: float = 0.5,
+    ):
+        self.outbox = outbox
+        self.replayer = replayer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        # message_id -> row (삽입 순서 유지)
+        self._pending: dict[str, dict] = {}
+        self._inflight: dict[str, dict] = {}
+        self._inflight_done: asyncio.Future | None = None
+        self._has_items = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+        self.flushed_total = 0
+        self.failed_total = 0
+        self.flush_count = 0
+        self.flush_seconds_total = 0.0
+        self.last_flush_seconds = 0.0
+        self.max_flush_seconds = 0.0
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending) + len(self._inflight)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 작업을 멈추고 남은 항목을 모두 저장합니다."""
+        if self._task:
+            # 저장 중인 배치를 중간에 취소하면 그 배치를 잃으므로, 저장이 끝난 뒤에 멈춥니다.
+            async with self._flush_lock:
+                self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def enqueue(self, entry: dict) -> None:
+        self._pending[entry["message_id"]] = entry
+        self._has_items.set()
+        if len(self._pending) >= self.batch_size:
+            self._batch_full.set()
+
+    async def merge_update(self, message_id: str, data: dict) -> dict | None:
+        """아직 저장되지 않은 항목이면 수정 내용을 합쳐 넣고 그 항목을 반환합니다.
+
+        저장 중인 항목이면 저장이 끝날 때까지 기다린 뒤 None을 반환합니다.
+        """
+        entry = self._pending.get(message_id)
+        if entry is not None:
+            entry.update(data)
+            return entry
+        if message_id in self._inflight and self._inflight_done is not None:
+            await asyncio.shield(self._inflight_done)
+        return None
+
+    async def _run(self) -> None:
+        while True:
+            await self._has_items.wait()
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            while self._pending:
+                keys = list(self._pending)[: self.batch_size]
+                self._inflight = {key: self._pending.pop(key) for key in keys}
+                self._inflight_done = asyncio.get_running_loop().create_future()
+                try:
+                    await self._write_batch(list(self._inflight.values()))
+                finally:
+                    self._inflight = {}
+                    self._inflight_done.set_result(None)
+                    self._inflight_done = None
+
+            self._has_items.clear()
+            self._batch_full.clear()
+
+    async def _write_batch(self, entries: list[dict]) -> None:
+        started = time.perf_counter()
+        message_ids = [entry["message_id"] for entry in entries]
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                await create_scrum_entries(entries)
+                self.flushed_total += len(entries)
+                await self._settle_outbox(message_ids)
+                break
+            except Exception as e:
+                logger.warning(f"스크럼 인증 배치 저장 실패 ({attempt}/{self.max_retries}): {e}")
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+        else:
+            self.failed_total += len(entries)
+            logger.error(f"스크럼 인증 {len(entries)}건 저장 실패, outbox 재전송으로 넘깁니다: {message_ids}")
+            await self._hand_off_to_outbox(message_ids)
+
+        elapsed = time.perf_counter() - started
+        self.flush_count += 1
+        self.flush_seconds_total += elapsed
+        self.last_flush_seconds = elapsed
+        self.max_flush_seconds = max(self.max_flush_seconds, elapsed)
+
+    async def _settle_outbox(self, message_ids: list[str]) -> None:
+        try:
+            await self.outbox.delete(OP_CREATE, message_ids)
+        except Exception as e:
+            # 남은 항목은 나중에 멱등 upsert로 한 번 더 전송될 뿐입니다.
+            logger.warning(f"outbox 정리 실패: {e}")
+
+    async def _hand_off_to_outbox(self, message_ids: list[str]) -> None:
+        try:
+            await self.outbox.make_due(message_ids)
+        except Exception as e:
+            logger.error(f"outbox 전달 실패: {e}")
+        self.replayer.wake()
+
+    def stats(self) -> dict:
+        """큐 깊이와 flush 지연 지표를 반환합니다."""
+        return {
+            "depth": self.depth,
+            "flushed_total": self.flushed_total,
+            "failed_total": self.failed_total,
+            "flush_count": self.flush_count,
+            "last_flush_seconds": self.last_flush_seconds,
+            "avg_flush_seconds": self.flush_seconds_total / self.flush_count if self.flush_count else 0.0,
+            "max_flush_seconds": self.max_flush_seconds,
         }
-        
-        result = await supabase.table("scrum_entries").insert(data).execute()
-        return result.data[0] if result.data else {}
-    
+
+
+outbox_replayer = ScrumOutboxReplayer(
+    scrum_outbox,
+    batch_size=OUTBOX_REPLAY_BATCH_SIZE,
+    max_backoff=OUTBOX_MAX_BACKOFF,
+)
+cache_bus.subscribe(OUTBOX_WAKE_EVENT, outbox_replayer.on_wake_event)
+
+scrum_entry_queue = ScrumEntryWriteQueue(
+    scrum_outbox,
+    outbox_replayer,
+    batch_size=SCRUM_WRITE_BATCH_SIZE,
+    flush_interval=SCRUM_WRITE_FLUSH_INTERVAL,
+    max_retries=SCRUM_WRITE_MAX_RETRIES,
+)
+
+
+@observe_repository
+async def enqueue_scrum_entry(
+    user_id: str,
+    yesterday_work: str,
+    today_plan: str,
+    comment: str,
+    message_id: str,
+    channel_id: str,
+) -> UserStreak | None:
+    """스크럼 인증 생성을 outbox에 기록하고 write-behind 큐에 넣습니다. 저장은 백그라운드에서 일괄 처리됩니다.
+
+    갱신된 인증 현황(연속 인증 등)을 반환합니다.
+    """
+    entry = _build_scrum_entry(user_id, yesterday_work, today_plan, comment, message_id, channel_id)
+    try:
+        await scrum_outbox.put_create(entry, delay=OUTBOX_HANDOFF_DELAY)
     except Exception as e:
-        raise Exception(f"스크럼 인증 생성 중 오류 발생: {str(e)}")
+        logger.error(f"outbox 기록 실패 (message_id={entry['message_id']}): {e}")
+    scrum_entry_queue.enqueue(entry)
+    return await _record_streak(entry)
 
 
+@observe_repository
 async def update_scrum_entry(
     message_id: str,
     yesterday_work: str,
     today_plan: str,
     comment: str,
 ) -> dict:
-    """기존 스크럼 인증을 수정합니다."""
+    """기존 스크럼 인증 수정을 outbox에 기록합니다. 실제 반영은 백그라운드에서 재전송합니다."""
     try:
         data = {
             "yesterday_work": yesterday_work,
@@ -44,32 +416,80 @@ async def update_scrum_entry(
             "updated_at": datetime.now(timezone.utc).isoformat(),
             "is_edited": True,
         }
-        
-        result = await (
-            supabase.table("scrum_entries")
-            .update(data)
-            .eq("message_id", str(message_id))
-            .execute()
-        )
-        return result.data[0] if result.data else {}
-    
+
+        # 아직 큐에서 저장되지 않은 인증이면 insert 내용에 합칩니다.
+        pending = await scrum_entry_queue.merge_update(str(message_id), data)
+
+        if await scrum_outbox.put_update(str(message_id), data):
+            outbox_replayer.wake()
+        return pending if pending is not None else data
+
+    except RepositoryError:
+        raise
     except Exception as e:
-        raise Exception(f"스크럼 인증 수정 중 오류 발생: {str(e)}")
-
-# TODO: 추후 적용하기
-# async def get_latest_scrum_entry(user_id: str, channel_id: str) -> dict | None:
-#     """사용자의 최근 스크럼 인증을 조회합니다."""
-#     try:
-#         result = await (
-#             supabase.table("scrum_entries")
-#             .select("*")
-#             .eq("user_id", str(user_id))
-#             .eq("channel_id", str(channel_id))
-#             .order("created_at", desc=True)
-#             .limit(1)
-#             .execute()
-#         )
-#         return result.data[0] if result.data else None
-    
-#     except Exception as e:
-#         raise Exception(f"스크럼 인증 조회 중 오류 발생: {str(e)}")
\ No newline at end of file
+        # outbox(로컬 DB) 기록 실패도 다른 저장소 실패와 같은 종류로 올립니다.
+        raise RepositoryError(f"스크럼 인증 수정 중 오류 발생: {str(e)}") from e
+
+@observe_repository
+async def get_latest_scrum_entry(user_id: str, channel_id: str) -> dict | None:
+    """사용자의 최근 스크럼 인증을 조회합니다."""
+    return await call(
+        "get_latest_scrum_entry",
+        "스크럼 인증 조회",
+        lambda: get_backend().get_latest_scrum_entry(str(user_id), str(channel_id)),
+        READ,
+    )
+
+
+@observe_repository
+async def get_recent_scrum_entries(channel_id: str, limit: int = 1000) -> list[dict]:
+    """채널의 최근 스크럼 인증 목록을 최신순으로 조회합니다."""
+    return await call(
+        "get_recent_scrum_entries",
+        "스크럼 인증 목록 조회",
+        lambda: get_backend().get_recent_scrum_entries(str(channel_id), limit),
+        BULK,
+    )
+
+
+@observe_repository
+async def get_scrum_entries_page(
+    channel_id: str | None,
+    after: tuple[str, int] | None,
+    limit: int,
+    since: str | None = None,
+    until: str | None = None,
+) -> list[dict]:
+    """(created_at, id) 순으로 after 다음 인증을 limit 개 조회합니다. (keyset 페이지네이션)
+
+    since/until(UTC ISO 문자열)을 주면 since <= created_at < until 인 인증만 조회합니다.
+    """
+    return await call(
+        "get_scrum_entries_page",
+        "스크럼 인증 페이지 조회",
+        lambda: get_backend().get_scrum_entries_page(
+            str(channel_id) if channel_id is not None else None, after, limit, since, until
+        ),
+        BULK,
+    )
+
+
+async def iter_scrum_entry_pages(
+    channel_id: str | None,
+    page_size: int,
+    since: str | None = None,
+    until: str | None = None,
+) -> AsyncIterator[list[dict]]:
+    """채널(None 이면 전체)의 인증을 오래된 순으로 페이지 단위로 돌려줍니다.
+
+    페이지마다 마지막 (created_at, id) 다음부터 따로 조회하므로 긴 쿼리를 열어 두지 않습니다.
+    """
+    after = None
+    while True:
+        page = await get_scrum_entries_page(channel_id, after, page_size, since, until)
+        if not page:
+            return
+        yield page
+        if len(page) < page_size:
+            return
+        after = (page[-1]["created_at"], page[-1]["id"])
@@ -0,0 +1,184 @@
+## 인증 수정 이력
+# scrum_entries 는 수정하면 이전 내용을 덮어쓰므로, 수정할 때마다 scrum_entry_edits 에 버전을 하나씩 추가합니다.
+#   - version 0 은 처음 수정하기 전의 원본입니다.
+#   - 이후 버전은 직전 버전과 달라진 항목만 텍스트 델타로 저장합니다. (app/utils/text_delta.py)
+#   - SCRUM_HISTORY_SNAPSHOT_EVERY 버전마다(또는 델타가 전체 내용보다 클 때) 전체 내용을 스냅샷으로 저장합니다.
+# 버전은 빈틈없이 이어지므로, 어느 버전이든 그 버전 이하 최신 SCRUM_HISTORY_SNAPSHOT_EVERY 행 안에 스냅샷이 있습니다.
+# 따라서 복원은 한 번의 조회와 최대 SCRUM_HISTORY_SNAPSHOT_EVERY 번의 델타 적용으로 끝납니다.
+import asyncio
+import json
+from dataclasses import dataclass
+
+from app.config import SCRUM_HISTORY_SNAPSHOT_EVERY
+from app.log import logger
+from app.metrics import observe_repository
+from app.repositories.backends import get_backend
+from app.repositories.resilience import IDEMPOTENT_WRITE, READ, call
+from app.utils.text_delta import apply_delta, make_delta
+
+
+# 이력으로 남기는 scrum_entries 컬럼
+HISTORY_FIELDS = ("yesterday_work", "today_plan", "comment")
+
+KIND_SNAPSHOT = "snapshot"
+KIND_DELTA = "delta"
+
+# 같은 인증의 수정이 겹쳐 같은 버전을 두 번 계산하지 않도록 기록은 하나씩 처리합니다. (수정은 드물어 충분합니다)
+_record_lock = asyncio.Lock()
+# 백그라운드로 기록 중인 작업 (종료 시 기다립니다)
+_pending_records: set[asyncio.Task] = set()
+
+
+@dataclass
+class ScrumVersion:
+    message_id: str
+    version: int
+    content: dict[str, str]  # HISTORY_FIELDS -> 그 버전의 내용
+    edited_by: str | None
+    created_at: str | None
+
+    def changed_fields(self, previous: "ScrumVersion | None") -> list[str]:
+        """직전 버전과 달라진 항목을 반환합니다."""
+        if previous is None:
+            return []
+        return [field for field in HISTORY_FIELDS if self.content[field] != previous.content[field]]
+
+
+def scrum_content(data: dict) -> dict[str, str]:
+    """scrum_entries 레코드(또는 같은 키의 dict)에서 이력으로 남길 내용만 꺼냅니다."""
+    return {field: data.get(field) or "" for field in HISTORY_FIELDS}
+
+
+def _encode(version: int, previous: dict[str, str], current: dict[str, str]) -> tuple[str, dict]:
+    if version % SCRUM_HISTORY_SNAPSHOT_EVERY == 0:
+        return KIND_SNAPSHOT, current
+    delta = {
+        field: make_delta(previous[field], current[field])
+        for field in HISTORY_FIELDS
+        if previous[field] != current[field]
+    }
+    # 대부분 다시 쓴 수정이면 델타가 오히려 크므로 전체 내용을 저장합니다.
+    if len(json.dumps(delta, ensure_ascii=False)) >= len(json.dumps(current, ensure_ascii=False)):
+        return KIND_SNAPSHOT, current
+    return KIND_DELTA, delta
+
+
+def _replay(rows: list[dict]) -> list[ScrumVersion]:
+    """최신순 이력 행에서 가장 오래된 스냅샷부터 델타를 적용해 버전들을 오래된 순으로 복원합니다.
+
+    그 스냅샷보다 오래된 행은 복원할 수 없으므로 무시합니다.
+    """
+    for index in range(len(rows) - 1, -1, -1):
+        if rows[index]["kind"] == KIND_SNAPSHOT:
+            chain = rows[index::-1]
+            break
+    else:
+        raise ValueError(f"스냅샷이 없는 수정 이력입니다 (message_id={rows[0]['message_id']})")
+
+    versions: list[ScrumVersion] = []
+    content: dict[str, str] = {}
+    for row in chain:
+        payload = row["payload"]
+        if row["kind"] == KIND_SNAPSHOT:
+            content = scrum_content(payload)
+        else:
+            content = {
+                field: apply_delta(content[field], payload[field]) if field in payload else content[field]
+                for field in HISTORY_FIELDS
+            }
+        versions.append(
+            ScrumVersion(
+                message_id=row["message_id"],
+                version=row["version"],
+                content=content,
+                edited_by=row.get("edited_by"),
+                created_at=row.get("created_at"),
+            )
+        )
+    return versions
+
+
+async def _fetch_edits(message_id: str, up_to: int | None, limit: int) -> list[dict]:
+    return await call(
+        "get_scrum_edits",
+        "인증 수정 이력 조회",
+        lambda: get_backend().get_scrum_edits(message_id, up_to, limit),
+        READ,
+    )
+
+
+async def _append(message_id: str, version: int, kind: str, payload: dict, edited_by: str | None) -> None:
+    edit = {"message_id": message_id, "version": version, "kind": kind, "payload": payload, "edited_by": edited_by}
+    # (message_id, version) 이 이미 있으면 아무것도 하지 않으므로 재시도해도 안전합니다.
+    saved = await call(
+        "insert_scrum_edit",
+        "인증 수정 이력 기록",
+        lambda: get_backend().insert_scrum_edit(edit),
+        IDEMPOTENT_WRITE,
+    )
+    if not saved:
+        logger.warning(f"이미 기록된 인증 수정 버전입니다 (message_id={message_id}, version={version})")
+
+
+@observe_repository
+async def get_scrum_version(message_id: str, version: int | None = None) -> ScrumVersion | None:
+    """인증의 특정 버전(None 이면 최신 버전)을 복원합니다. 이력이 없거나 없는 버전이면 None 입니다."""
+    rows = await _fetch_edits(str(message_id), version, SCRUM_HISTORY_SNAPSHOT_EVERY)
+    if not rows or (version is not None and rows[0]["version"] != version):
+        return None
+    return _replay(rows)[-1]
+
+
+@observe_repository
+async def list_scrum_versions(message_id: str, limit: int) -> list[ScrumVersion]:
+    """인증의 최근 버전을 최대 limit 개, 최신순으로 복원합니다."""
+    # 가장 오래된 버전까지 복원하려면 그 앞의 스냅샷까지 읽어야 합니다.
+    rows = await _fetch_edits(str(message_id), None, limit + SCRUM_HISTORY_SNAPSHOT_EVERY - 1)
+    if not rows:
+        return []
+    return _replay(rows)[::-1][:limit]
+
+
+@observe_repository
+async def record_scrum_edit(message_id: str, previous: dict, current: dict, edited_by: str | None) -> int:
+    """수정 내용을 다음 버전으로 기록하고 그 버전을 반환합니다.
+
+    이력이 아직 없으면 previous(수정 전 내용)를 version 0 으로 먼저 남깁니다.
+    내용이 최신 버전과 같으면 기록하지 않고 최신 버전을 반환합니다.
+    """
+    message_id = str(message_id)
+    current = scrum_content(current)
+    async with _record_lock:
+        latest = await get_scrum_version(message_id)
+        if latest is None:
+            base = scrum_content(previous)
+            await _append(message_id, 0, KIND_SNAPSHOT, base, None)
+            latest = ScrumVersion(message_id, 0, base, None, None)
+
+        if latest.content == current:
+            return latest.version
+        version = latest.version + 1
+        kind, payload = _encode(version, latest.content, current)
+        await _append(message_id, version, kind, payload, edited_by)
+        return version
+
+
+async def _record_quietly(message_id: str, previous: dict, current: dict, edited_by: str | None) -> None:
+    try:
+        await record_scrum_edit(message_id, previous, current, edited_by)
+    except Exception as e:
+        # 이력 기록 실패가 인증 수정을 막지 않도록 합니다. 다음 수정은 남아 있는 마지막 버전에 이어 기록됩니다.
+        logger.warning(f"인증 수정 이력 기록 실패 (message_id={message_id}): {e}")
+
+
+def record_scrum_edit_later(message_id: str, previous: dict, current: dict, edited_by: str | None) -> None:
+    """수정 응답을 늦추지 않도록 이력 기록을 백그라운드에서 실행합니다."""
+    task = asyncio.create_task(_record_quietly(str(message_id), previous, current, edited_by))
+    _pending_records.add(task)
+    task.add_done_callback(_pending_records.discard)
+
+
+async def wait_pending_records(timeout: float) -> None:
+    """백그라운드로 기록 중인 이력을 timeout 초까지 기다립니다."""
+    if _pending_records:
+        await asyncio.wait(set(_pending_records), timeout=timeout)
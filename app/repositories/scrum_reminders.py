@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+
+from app.metrics import observe_repository
+from app.repositories.backends import get_backend
+from app.repositories.resilience import IDEMPOTENT_WRITE, READ, call
+
+
+@observe_repository
+async def list_scrum_reminders(guild_id: str) -> list[dict]:
+    """길드에서 켜져 있는 인증 알림을 모두 조회합니다."""
+    return await call(
+        "list_scrum_reminders",
+        "인증 알림 조회",
+        lambda: get_backend().get_scrum_reminders(str(guild_id)),
+        READ,
+    )
+
+
+@observe_repository
+async def set_scrum_reminder(guild_id: str, user_id: str, remind_at: str | None) -> dict:
+    """유저의 인증 알림 시각(HH:MM)을 저장합니다. remind_at 이 None 이면 알림을 끕니다."""
+    data = {
+        "guild_id": str(guild_id),
+        "user_id": str(user_id),
+        "remind_at": remind_at,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }
+    return await call(
+        "upsert_scrum_reminder",
+        "인증 알림 설정",
+        lambda: get_backend().upsert_scrum_reminder(data),
+        IDEMPOTENT_WRITE,
+    )
@@ -1,7 +1,20 @@
 from datetime import datetime, timezone
-from app.database.supabase import supabase
+from app.cache.ttl_cache import TTLCache
+from app.config import PROFILE_CACHE_MAXSIZE, PROFILE_CACHE_TTL
+from app.database.cache_events import cache_bus
+from app.log import logger
+from app.metrics import observe_repository
+from app.repositories.backends import get_backend
+from app.repositories.resilience import HEDGED_READ, IDEMPOTENT_WRITE, RepositoryTimeout, RepositoryUnavailable, call
 
 
+# 유저 프로필 read-through 캐시 (user_id -> 프로필 또는 None)
+profile_cache = TTLCache(maxsize=PROFILE_CACHE_MAXSIZE, ttl=PROFILE_CACHE_TTL)
+# 다른 클러스터 워커에서 프로필을 바꾸면 이 워커의 캐시에서도 지웁니다.
+cache_bus.subscribe("user_profile", profile_cache.invalidate)
+
+
+@observe_repository
 async def upsert_user_profile(
     user_id: str,
     monthly_goal: str | None = None,
@@ -9,28 +22,54 @@ async def upsert_user_profile(
     routine: str | None = None,
 ) -> dict:
     """새로운 유저 프로필을 생성 또는 업데이트 합니다."""
-    try:
-        data = {
-            "user_id": str(user_id),
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-        }
-        if monthly_goal is not None:
-            data["monthly_goal"] = monthly_goal
-        if weekly_goal is not None:
-            data["weekly_goal"] = weekly_goal
-        if routine is not None:
-            data["routine"] = routine
-        
-        result = await supabase.table("user_profiles").upsert(data, on_conflict="user_id").execute()
-        return result.data[0] if result.data else {}
-    
-    except Exception as e:
-        raise Exception(f"유저 프로필 생성 또는 업데이트 중 오류 발생: {str(e)}")
+    data = {
+        "user_id": str(user_id),
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }
+    if monthly_goal is not None:
+        data["monthly_goal"] = monthly_goal
+    if weekly_goal is not None:
+        data["weekly_goal"] = weekly_goal
+    if routine is not None:
+        data["routine"] = routine
+
+    profile = await call(
+        "upsert_user_profile",
+        "유저 프로필 생성 또는 업데이트",
+        lambda: get_backend().upsert_user_profile(data),
+        IDEMPOTENT_WRITE,
+    )
 
+    # 캐시를 최신 프로필로 갱신합니다. (응답이 비어 있으면 다음 조회 때 다시 읽습니다)
+    if profile:
+        profile_cache.set(str(user_id), profile)
+    else:
+        profile_cache.invalidate(str(user_id))
+    await cache_bus.publish("user_profile", str(user_id))
+    return profile
+
+@observe_repository
 async def get_user_profile(user_id: int) -> dict | None:
-    """유저 프로필을 조회합니다."""
+    """유저 프로필을 조회합니다. 캐시에 있으면 DB를 조회하지 않습니다.
+
+    저장소가 응답하지 않거나 회로가 열려 있으면, 만료된 캐시 값이라도 남아 있을 때 그 값을 반환합니다.
+    """
+    key = str(user_id)
     try:
-        result = await supabase.table("user_profiles").select("*").filter("user_id", "eq", str(user_id)).maybe_single().execute()
-        return result.data if result else None
-    except Exception as e:
-        raise Exception(f"유저 프로필 조회 중 오류 발생: {str(e)}")
\ No newline at end of file
+        return await profile_cache.get_or_load(key, lambda: _fetch_user_profile(user_id))
+    except (RepositoryTimeout, RepositoryUnavailable) as e:
+        found, profile = profile_cache.get_stale(key)
+        if not found:
+            raise
+        logger.warning(f"유저 프로필을 캐시에 남은 값으로 반환합니다 (user_id={key}): {e}")
+        return profile
+
+@observe_repository
+async def _fetch_user_profile(user_id: int) -> dict | None:
+    # 인터랙션 응답을 기다리게 하는 조회라 느리면 같은 요청을 한 번 더 보냅니다.
+    return await call(
+        "get_user_profile",
+        "유저 프로필 조회",
+        lambda: get_backend().get_user_profile(str(user_id)),
+        HEDGED_READ,
+    )
@@ -0,0 +1,78 @@
+## 시작 시간 프로파일링
+# STARTUP_PROFILE=1 로 실행하면 모듈별 import 시간과 첫 on_ready 까지 걸린 시간을 로그로 남깁니다.
+# 이 모듈은 다른 app 모듈보다 먼저 import 되어야 하므로 app 내부 모듈을 import 하지 않습니다.
+import importlib.abc
+import logging
+import os
+import sys
+import time
+
+
+ENABLED = os.getenv("STARTUP_PROFILE", "").lower() in ("1", "true", "yes")
+
+_logger = logging.getLogger("app.startup_profile")
+_started_at = time.perf_counter()
+_import_times: dict[str, tuple[float, float]] = {}  # 모듈 이름 -> (자기 시간, 하위 import 포함 시간)
+_stack: list[float] = []  # 진행 중인 import 별로 하위 import 에 쓴 시간
+_ready_reported = False
+
+
+class _TimingLoader(importlib.abc.Loader):
+    def __init__(self, loader, name: str):
+        self._loader = loader
+        self._name = name
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        _stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - started
+            children = _stack.pop()
+            _import_times[self._name] = (elapsed - children, elapsed)
+            if _stack:
+                _stack[-1] += elapsed
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimingLoader(spec.loader, fullname)
+            return spec
+        return None
+
+
+def install() -> None:
+    """import 시간 측정을 시작합니다. STARTUP_PROFILE 이 꺼져 있으면 아무 일도 하지 않습니다."""
+    global _started_at
+    if ENABLED and not any(isinstance(finder, _TimingFinder) for finder in sys.meta_path):
+        _started_at = time.perf_counter()
+        sys.meta_path.insert(0, _TimingFinder())
+
+
+def report_ready(top: int = 25) -> None:
+    """첫 on_ready 시점에 한 번만 시작 시간 보고서를 로그로 남깁니다."""
+    global _ready_reported
+    if not ENABLED or _ready_reported:
+        return
+    _ready_reported = True
+
+    total_import = sum(self_time for self_time, _ in _import_times.values())
+    _logger.info(f"⏱️ 첫 on_ready 까지 {time.perf_counter() - _started_at:.3f}s (import {total_import:.3f}s)")
+
+    slowest = sorted(_import_times.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    for name, (self_time, cumulative) in slowest:
+        _logger.info(f"⏱️ import {name}: {self_time * 1000:.1f}ms (하위 포함 {cumulative * 1000:.1f}ms)")
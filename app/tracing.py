@@ -0,0 +1,117 @@
+## 인터랙션 트레이싱
+# 커맨드/모달/버튼 처리 안에서 일어난 repository 호출, 디스코드 REST 호출, 파싱을 중첩 span 으로 기록합니다.
+# 루트 span 은 metrics.observe_interaction 이 열고, 느린 인터랙션은 span 트리를 로그로 남깁니다.
+# 루트 span 밖(리스너, 백그라운드 작업)에서는 span 이 아무것도 기록하지 않습니다.
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+from app.log import logger
+
+
+# 한 span 아래에 기록할 자식 span 최대 개수 (배치 작업이 로그를 뒤덮지 않도록)
+MAX_CHILDREN = 50
+
+
+@dataclass
+class Span:
+    name: str
+    started: float
+    duration: float | None = None
+    error: str | None = None
+    children: list["Span"] = field(default_factory=list)
+    dropped: int = 0
+
+    def add_child(self, child: "Span") -> bool:
+        if len(self.children) >= MAX_CHILDREN:
+            self.dropped += 1
+            return False
+        self.children.append(child)
+        return True
+
+    def render(self, origin: float | None = None, depth: int = 0) -> list[str]:
+        """span 트리를 들여쓴 줄 목록으로 만듭니다. (+시작 오프셋 / 소요 시간)"""
+        origin = self.started if origin is None else origin
+        duration = f"{self.duration * 1000:.1f}ms" if self.duration is not None else "진행 중"
+        line = f"{'  ' * depth}{self.name} {duration} (+{(self.started - origin) * 1000:.1f}ms)"
+        if self.error:
+            line += f" ❌ {self.error}"
+        lines = [line]
+        for child in self.children:
+            lines.extend(child.render(origin, depth + 1))
+        if self.dropped:
+            lines.append(f"{'  ' * (depth + 1)}... span {self.dropped}개 생략")
+        return lines
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+@contextmanager
+def trace_root(name: str, slow_threshold: float) -> Iterator[Span]:
+    """인터랙션 하나의 루트 span 을 엽니다. slow_threshold 초 이상 걸리면 span 트리를 로그로 남깁니다. (0이면 끔)"""
+    root = Span(name, time.perf_counter())
+    token = _current_span.set(root)
+    try:
+        yield root
+    except BaseException as e:
+        root.error = type(e).__name__
+        raise
+    finally:
+        root.duration = time.perf_counter() - root.started
+        _current_span.reset(token)
+        if slow_threshold > 0 and root.duration >= slow_threshold:
+            logger.warning("🐢 느린 인터랙션\n" + "\n".join(root.render()))
+
+
+@contextmanager
+def span(name: str) -> Iterator[Span | None]:
+    """현재 span 아래에 자식 span 을 엽니다. 진행 중인 트레이스가 없으면 아무것도 하지 않습니다."""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+
+    child = Span(name, time.perf_counter())
+    if not parent.add_child(child):
+        yield None
+        return
+
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.error = type(e).__name__
+        raise
+    finally:
+        child.duration = time.perf_counter() - child.started
+        _current_span.reset(token)
+
+
+def record_span(name: str, started: float, error: str | None = None) -> None:
+    """이미 끝난 작업(예: aiohttp 트레이스 콜백으로 잰 REST 호출)을 현재 span 의 자식으로 기록합니다."""
+    parent = _current_span.get()
+    if parent is not None:
+        parent.add_child(Span(name, started, time.perf_counter() - started, error))
+
+
+def traced(name: str) -> Callable:
+    """함수 호출 전체를 span 하나로 기록하는 데코레이터입니다. 일반 함수와 코루틴 함수 모두 쓸 수 있습니다."""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
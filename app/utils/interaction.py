@@ -0,0 +1,117 @@
+## 인터랙션 응답 파이프라인
+# 디스코드는 3초 안에 첫 응답이 없으면 인터랙션 실패로 처리합니다.
+# 느린 의존성(DB 등) 하나 때문에 커맨드가 실패하지 않도록
+#   1) 캐시에 없어 기다려야 할 작업이 있으면 바로 defer 하고,
+#   2) 그렇지 않더라도 INTERACTION_DEFER_AFTER 가 지나도록 응답하지 못하면 defer 하며,
+#   3) 의존성은 동시에 조회하되 각자 시간 한도를 넘기면 대체값으로 진행합니다.
+# 모달을 여는 커맨드는 defer 할 수 없으므로 fetch 의 시간 한도만 적용합니다.
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, TypeVar
+
+import discord
+from discord.utils import MISSING
+
+from app.config import INTERACTION_DEFER_AFTER
+from app.log import logger
+from app.metrics import DEPENDENCY_DEGRADED, mark_interaction_deferred
+from app.repositories.resilience import RepositoryTimeout, RepositoryUnavailable
+from app.tracing import span
+
+
+T = TypeVar("T")
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    # 시간 초과로 기다리지 않게 된 조회의 예외가 "never retrieved" 경고로 남지 않게 합니다.
+    if not future.cancelled():
+        future.exception()
+
+
+@dataclass
+class Fetched(Generic[T]):
+    value: T
+    degraded: bool  # 시간 초과/오류로 대체값을 썼는지
+
+
+async def fetch(
+    name: str,
+    load: Callable[[], Awaitable[T]],
+    timeout: float,
+    fallback: Callable[[], T],
+) -> Fetched[T]:
+    """load()를 timeout 초까지 기다리고, 넘기거나 실패하면 fallback()으로 진행합니다.
+
+    시간 초과된 조회는 취소하지 않고 끝까지 실행해 캐시를 채우게 둡니다. (다음 요청은 캐시에서 바로 읽습니다)
+    """
+    task = asyncio.ensure_future(load())
+    task.add_done_callback(_consume_exception)
+    try:
+        with span(f"dependency:{name}"):
+            return Fetched(await asyncio.wait_for(asyncio.shield(task), timeout), False)
+    except (asyncio.TimeoutError, RepositoryTimeout):
+        reason = "timeout"
+        logger.warning(f"{name} 조회가 시간 한도를 넘겨 대체값으로 진행합니다.")
+    except RepositoryUnavailable:
+        # 저장소 회로가 열려 있으면 바로 대체값으로 진행합니다.
+        reason = "unavailable"
+    except Exception as e:
+        reason = "error"
+        logger.warning(f"{name} 조회 실패, 대체값으로 진행합니다: {e}")
+    DEPENDENCY_DEGRADED.labels(name, reason).inc()
+    return Fetched(fallback(), True)
+
+
+class InteractionReply:
+    """인터랙션의 첫 응답을 예산 안에 보장하는 응답 도우미입니다.
+
+    async with 블록 안에서 defer_after 초가 지나도록 send() 가 없으면 defer 하고,
+    이후의 send() 는 followup 으로 보냅니다. (defer 와 send 가 겹치지 않도록 잠금을 씁니다)
+    """
+
+    def __init__(self, interaction: discord.Interaction, defer_after: float = INTERACTION_DEFER_AFTER, ephemeral: bool = True):
+        self.interaction = interaction
+        self.defer_after = defer_after
+        self.ephemeral = ephemeral
+        self.sent = False
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "InteractionReply":
+        self._timer = asyncio.create_task(self._defer_later())
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+
+    async def _defer_later(self) -> None:
+        await asyncio.sleep(self.defer_after)
+        await self.defer()
+
+    async def defer(self) -> None:
+        """아직 응답하지 않았으면 "생각 중..." 으로 먼저 응답합니다."""
+        async with self._lock:
+            if not self.interaction.response.is_done():
+                await self.interaction.response.defer(ephemeral=self.ephemeral, thinking=True)
+                mark_interaction_deferred()
+
+    async def send(self, content: str, *, view: discord.ui.View = MISSING) -> None:
+        async with self._lock:
+            # 잠금을 얻은 뒤에 타이머를 멈춥니다. (진행 중인 defer 요청을 중간에 끊지 않도록)
+            if self._timer is not None:
+                self._timer.cancel()
+            if self.interaction.response.is_done():
+                await self.interaction.followup.send(content, view=view, ephemeral=self.ephemeral)
+            else:
+                await self.interaction.response.send_message(content, view=view, ephemeral=self.ephemeral)
+            self.sent = True
+
+    async def send_error(self, content: str) -> None:
+        """아직 결과를 보내지 않았을 때만 오류 문구를 보냅니다. (defer 만 한 경우 "생각 중..." 을 대체합니다)"""
+        if self.sent:
+            return
+        try:
+            await self.send(content)
+        except discord.HTTPException as e:
+            logger.warning(f"오류 응답 전송 실패: {e}")
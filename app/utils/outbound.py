@@ -0,0 +1,273 @@
+import asyncio
+import contextvars
+import re
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+import discord
+
+from app.config import OUTBOUND_ACK_TIMEOUT, OUTBOUND_CHANNEL_BURST, OUTBOUND_CHANNEL_RATE
+from app.log import logger
+from app.metrics import OUTBOUND_COALESCED, OUTBOUND_QUEUE_DEPTH, OUTBOUND_WAIT, add_response_listener
+from app.utils.rate_limiter import AsyncTokenBucket
+
+
+KIND_SEND = "send"
+KIND_EDIT = "edit"
+
+# 채널 메시지 전송(POST)/수정(PATCH) 라우트
+_MESSAGE_ROUTE = re.compile(r"/channels/(\d+)/messages(?:/(\d+))?$")
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    # 기다리는 쪽이 없어진 작업의 예외가 "never retrieved" 경고로 남지 않게 합니다.
+    if not future.cancelled():
+        future.exception()
+
+
+@dataclass
+class EditResult:
+    """수정 작업의 결과입니다."""
+
+    message: Any  # 수정된 메시지
+    # 아직 보내지 않은 동안 뒤에 들어온 수정에 합쳐져, 이 요청의 내용은 보내지 않았는지
+    superseded: bool
+
+
+@dataclass
+class OutboundJob:
+    kind: str
+    key: Hashable  # 공정하게 번갈아 보낼 단위 (보통 유저 ID)
+    run: Callable[[str], Awaitable[Any]]
+    content: str
+    message_id: int | None
+    enqueued_at: float
+    futures: list[asyncio.Future]
+
+
+class ChannelLane:
+    """한 채널의 전송 또는 수정 작업 큐입니다. 디스코드 버킷이 채널·작업 종류별이라 따로 둡니다."""
+
+    def __init__(self, channel_id: int, kind: str, bucket: AsyncTokenBucket | None):
+        self.channel_id = channel_id
+        self.kind = kind
+        self.bucket = bucket  # None 이면 응답 헤더로만 속도를 맞춥니다.
+        self.blocked_until = 0.0  # 응답 헤더가 알려 준 버킷 초기화 시각 (monotonic)
+        self.depth = 0
+        self.task: asyncio.Task | None = None
+        self.inflight: set[asyncio.Task] = set()
+        self.edit_tasks: dict[int, asyncio.Task] = {}  # 메시지별 마지막 수정 (같은 메시지 수정은 순서대로 보냅니다)
+        self._queues: OrderedDict[Hashable, deque[OutboundJob]] = OrderedDict()
+        self.pending_edits: dict[int, OutboundJob] = {}
+
+    def push(self, job: OutboundJob) -> None:
+        self._queues.setdefault(job.key, deque()).append(job)
+        self.depth += 1
+        if job.message_id is not None:
+            self.pending_edits[job.message_id] = job
+
+    def pop(self) -> OutboundJob:
+        """유저마다 하나씩 번갈아 꺼냅니다. (한 유저가 몰아서 보내도 다른 유저가 밀리지 않습니다)"""
+        key, jobs = next(iter(self._queues.items()))
+        job = jobs.popleft()
+        if jobs:
+            self._queues.move_to_end(key)
+        else:
+            del self._queues[key]
+        self.depth -= 1
+        if job.message_id is not None and self.pending_edits.get(job.message_id) is job:
+            del self.pending_edits[job.message_id]
+        return job
+
+    def drain_all(self) -> list[OutboundJob]:
+        jobs = [job for queue in self._queues.values() for job in queue]
+        self._queues.clear()
+        self.pending_edits.clear()
+        self.depth = 0
+        return jobs
+
+    def busy(self) -> bool:
+        """지금 작업을 넣으면 바로 보내지 못하고 기다려야 하는지 반환합니다."""
+        if self.blocked_until > time.monotonic():
+            return True
+        return self.bucket is not None and self.bucket.available < self.depth + 1
+
+
+class OutboundScheduler:
+    """채널 메시지 전송/수정을 채널 버킷 예산에 맞춰 내보내는 스케줄러입니다.
+
+    인터랙션 핸들러 안에서 discord.py 가 레이트 리밋으로 잠들지 않도록, 작업을 채널별 큐에 넣고
+    Future 로 결과를 돌려줍니다. 아직 보내지 않은 같은 메시지의 수정은 마지막 내용 하나로 합칩니다.
+    """
+
+    def __init__(self, rate: float, burst: int, ack_timeout: float):
+        self.rate = rate
+        self.burst = burst
+        self.ack_timeout = ack_timeout
+        self._lanes: dict[tuple[int, str], ChannelLane] = {}
+        self.sent = 0
+        self.edited = 0
+        self.coalesced = 0
+        self.failed = 0
+        self.rate_limited = 0
+
+    def _lane(self, channel_id: int, kind: str) -> ChannelLane:
+        lane = self._lanes.get((channel_id, kind))
+        if lane is None:
+            bucket = AsyncTokenBucket(rate=self.rate, capacity=self.burst) if self.rate > 0 else None
+            lane = self._lanes[(channel_id, kind)] = ChannelLane(channel_id, kind, bucket)
+        return lane
+
+    def send(self, channel: discord.abc.Messageable, content: str, key: Hashable) -> asyncio.Future:
+        """channel 에 content 를 보내는 작업을 넣고, 보낸 메시지를 결과로 갖는 Future 를 반환합니다."""
+        return self._submit(channel.id, KIND_SEND, key, content, None, lambda text: channel.send(text))
+
+    def edit(self, message: discord.Message | discord.PartialMessage, content: str, key: Hashable) -> asyncio.Future:
+        """message 를 content 로 수정하는 작업을 넣고, EditResult 를 결과로 갖는 Future 를 반환합니다.
+
+        아직 보내지 않은 수정이 있으면 그 내용을 바꾸고, 먼저 들어온 요청은 superseded 로 끝납니다.
+        """
+        lane = self._lane(message.channel.id, KIND_EDIT)
+        pending = lane.pending_edits.get(message.id)
+        if pending is not None:
+            pending.content = content
+            future = asyncio.get_running_loop().create_future()
+            future.add_done_callback(_consume_exception)
+            pending.futures.append(future)
+            self.coalesced += 1
+            OUTBOUND_COALESCED.inc()
+            return future
+        return self._submit(
+            message.channel.id, KIND_EDIT, key, content, message.id, lambda text: message.edit(content=text)
+        )
+
+    def _submit(
+        self,
+        channel_id: int,
+        kind: str,
+        key: Hashable,
+        content: str,
+        message_id: int | None,
+        run: Callable[[str], Awaitable[Any]],
+    ) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_consume_exception)
+        lane = self._lane(channel_id, kind)
+        lane.push(OutboundJob(kind, key, run, content, message_id, time.monotonic(), [future]))
+        OUTBOUND_QUEUE_DEPTH.labels(kind).inc()
+
+        if lane.task is None or lane.task.done():
+            # 큐를 비우는 태스크가 처음 작업을 넣은 인터랙션의 트레이스를 물려받지 않도록 빈 컨텍스트로 띄웁니다.
+            lane.task = asyncio.create_task(self._drain(lane), context=contextvars.Context())
+        return future
+
+    async def _drain(self, lane: ChannelLane) -> None:
+        while lane.depth:
+            blocked = lane.blocked_until - time.monotonic()
+            if blocked > 0:
+                await asyncio.sleep(blocked)
+            if lane.bucket is not None:
+                await lane.bucket.acquire()
+
+            job = lane.pop()
+            OUTBOUND_QUEUE_DEPTH.labels(job.kind).dec()
+            OUTBOUND_WAIT.labels(job.kind).observe(time.monotonic() - job.enqueued_at)
+            # 예산을 받은 작업은 바로 내보내고 다음 작업으로 넘어갑니다. (버킷 안에서는 동시에 보냅니다)
+            task = asyncio.create_task(self._run(lane, job))
+            lane.inflight.add(task)
+            task.add_done_callback(lane.inflight.discard)
+
+    async def _run(self, lane: ChannelLane, job: OutboundJob) -> None:
+        if job.message_id is not None:
+            # 같은 메시지의 이전 수정이 아직 진행 중이면 끝난 뒤에 보내야 마지막 내용이 남습니다.
+            previous = lane.edit_tasks.get(job.message_id)
+            current = asyncio.current_task()
+            lane.edit_tasks[job.message_id] = current
+            if previous is not None and not previous.done():
+                await asyncio.wait({previous})
+        try:
+            result = await job.run(job.content)
+        except Exception as e:
+            self.failed += 1
+            logger.warning(f"채널 메시지 {job.kind} 실패 (channel_id={lane.channel_id}): {e}")
+            for future in job.futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            if job.kind == KIND_SEND:
+                self.sent += 1
+            else:
+                self.edited += 1
+            for index, future in enumerate(job.futures):
+                if future.done():
+                    continue
+                if job.kind == KIND_EDIT:
+                    # 합쳐진 수정은 마지막에 들어온 요청의 내용만 보냈습니다.
+                    future.set_result(EditResult(result, superseded=index < len(job.futures) - 1))
+                else:
+                    future.set_result(result)
+        finally:
+            if job.message_id is not None and lane.edit_tasks.get(job.message_id) is asyncio.current_task():
+                del lane.edit_tasks[job.message_id]
+
+    def busy(self, channel_id: int, kind: str) -> bool:
+        lane = self._lanes.get((channel_id, kind))
+        return lane is not None and lane.busy()
+
+    def ack_timeout_for(self, channel_id: int, kind: str) -> float:
+        """채널이 밀려 있으면 0(바로 응답), 아니면 결과를 기다려 볼 최대 시간을 반환합니다."""
+        return 0.0 if self.busy(channel_id, kind) else self.ack_timeout
+
+    def observe_response(self, method: str, path: str, status: int, headers) -> None:
+        """디스코드 응답의 레이트 리밋 헤더로 채널 버킷이 언제 다시 열리는지 기록합니다."""
+        match = _MESSAGE_ROUTE.search(path)
+        if match is None:
+            return
+        kind = {"POST": KIND_SEND, "PATCH": KIND_EDIT}.get(method)
+        if kind is None:
+            return
+
+        remaining = headers.get("X-RateLimit-Remaining")
+        if status != 429 and remaining != "0":
+            return
+        reset_after = headers.get("X-RateLimit-Reset-After") or headers.get("Retry-After") or 1
+        lane = self._lane(int(match.group(1)), kind)
+        lane.blocked_until = max(lane.blocked_until, time.monotonic() + float(reset_after))
+        if status == 429:
+            self.rate_limited += 1
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """대기 중인 작업을 timeout 동안 마저 보내고, 남은 작업은 실패 처리합니다."""
+        tasks = [lane.task for lane in self._lanes.values() if lane.task and not lane.task.done()]
+        tasks += [task for lane in self._lanes.values() for task in lane.inflight]
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+
+        for lane in self._lanes.values():
+            for job in lane.drain_all():
+                OUTBOUND_QUEUE_DEPTH.labels(job.kind).dec()
+                for future in job.futures:
+                    if not future.done():
+                        future.set_exception(RuntimeError("봇 종료로 메시지를 보내지 못했습니다."))
+            lane.task = None
+
+    def stats(self) -> dict:
+        return {
+            "queued": sum(lane.depth for lane in self._lanes.values()),
+            "busy_lanes": sum(1 for lane in self._lanes.values() if lane.depth),
+            "sent_total": self.sent,
+            "edited_total": self.edited,
+            # 합쳐진 수정 수는 scrumbot_outbound_coalesced_total 카운터로 따로 내보냅니다.
+            "failed_total": self.failed,
+            "rate_limited_total": self.rate_limited,
+        }
+
+
+outbound = OutboundScheduler(
+    rate=OUTBOUND_CHANNEL_RATE, burst=OUTBOUND_CHANNEL_BURST, ack_timeout=OUTBOUND_ACK_TIMEOUT
+)
+add_response_listener(outbound.observe_response)
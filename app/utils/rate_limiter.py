@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """초당 rate개씩 토큰이 채워지는 비동기 토큰 버킷입니다.
+
+    토큰이 모자라면 채워질 때까지 기다리며, 대기자는 도착 순서대로 처리됩니다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    async def acquire(self, tokens: float = 1) -> float:
+        """토큰을 가져오고, 기다린 시간(초)을 반환합니다."""
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                delay = (tokens - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self._tokens -= tokens
+        return waited
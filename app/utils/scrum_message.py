@@ -0,0 +1,75 @@
+import re
+from dataclasses import dataclass
+
+from app.tracing import traced
+
+
+@dataclass(frozen=True)
+class ScrumSection:
+    key: str
+    heading: str  # 메시지 본문에 들어가는 제목
+    label: str  # 모달 입력창 라벨
+
+
+# 인증 메시지의 섹션 제목 표. 파서, 메시지 렌더러, 모달이 모두 이 표를 사용합니다.
+SCRUM_SECTIONS: tuple[ScrumSection, ...] = (
+    ScrumSection("yesterday", "🧐 어제 무엇을 했나요?", "🧐 어제 무엇을 했나요?"),
+    ScrumSection("today", "🫣 오늘 무엇을 할 계획인가요?", "🫣 오늘 무엇을 할 계획인가요?"),
+    ScrumSection("comment", "😉 하고 싶은 말", "😉 하고 싶은 말 (힘든 점, 좋은 일, 기대하는 모습 등)"),
+)
+SECTION_BY_KEY = {section.key: section for section in SCRUM_SECTIONS}
+
+SCRUM_TITLE_SUFFIX = "님의 인증입니다"
+SCRUM_EDITED_MARK = " (수정됨)"
+SCRUM_AUTHOR_PATTERN = re.compile(rf"^<@!?(\d+)>{SCRUM_TITLE_SUFFIX}")
+
+_HEADINGS = tuple(section.heading for section in SCRUM_SECTIONS)
+
+
+@dataclass
+class ScrumSections:
+    yesterday: str = ""
+    today: str = ""
+    comment: str = ""
+
+
+def parse_scrum_author(text: str) -> int | None:
+    """봇이 보낸 인증 메시지에서 작성자 ID를 추출합니다."""
+    match = SCRUM_AUTHOR_PATTERN.match(text or "")
+    return int(match.group(1)) if match else None
+
+
+@traced("parse_scrum_message")
+def parse_scrum_message(text: str) -> ScrumSections:
+    """인증 메시지를 한 번만 훑어 모든 섹션을 추출합니다."""
+    if not text:
+        return ScrumSections()
+
+    collected: list[list[str]] = [[] for _ in SCRUM_SECTIONS]
+    current: list[str] | None = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        # 대부분의 줄은 제목이 아니므로 튜플 startswith 한 번으로 걸러냅니다.
+        if stripped.startswith(_HEADINGS):
+            for index, heading in enumerate(_HEADINGS):
+                if stripped.startswith(heading):
+                    current = collected[index]
+                    break
+            continue
+        if current is not None:
+            current.append(line)
+
+    return ScrumSections(*("\n".join(lines).strip() for lines in collected))
+
+
+def render_scrum_body(yesterday: str, today: str, comment: str) -> str:
+    """섹션 내용을 인증 메시지 본문으로 만듭니다."""
+    values = (yesterday, today, comment)
+    return "\n\n".join(f"{section.heading}\n{value}" for section, value in zip(SCRUM_SECTIONS, values))
+
+
+@traced("render_scrum_message")
+def render_scrum_message(user_id: int, yesterday: str, today: str, comment: str, edited: bool = False) -> str:
+    """채널에 올릴 인증 메시지 전체를 만듭니다."""
+    title = f"<@{user_id}>{SCRUM_TITLE_SUFFIX}{SCRUM_EDITED_MARK if edited else ''}"
+    return f"{title}\n\n{render_scrum_body(yesterday, today, comment)}"
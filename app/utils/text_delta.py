@@ -0,0 +1,44 @@
+## 텍스트 델타
+# 수정 이력을 전체 사본 대신 직전 버전과의 차이로 저장하기 위한 인코딩입니다.
+# 델타는 JSON 으로 그대로 저장할 수 있는 리스트이며, 각 항목은
+#   양의 정수 n: 이전 텍스트에서 n 글자를 그대로 유지
+#   음의 정수 -n: 이전 텍스트에서 n 글자를 삭제
+#   문자열 s: s 를 삽입
+# 을 뜻합니다. 예) "오늘 공부" -> "오늘 운동" 은 [3, -2, "운동"]
+import difflib
+
+
+def make_delta(old: str, new: str) -> list[int | str]:
+    """old 를 new 로 바꾸는 델타를 만듭니다."""
+    delta: list[int | str] = []
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            delta.append(i2 - i1)
+            continue
+        if i2 > i1:
+            delta.append(-(i2 - i1))
+        if j2 > j1:
+            delta.append(new[j1:j2])
+    # 마지막의 "나머지 유지" 는 적용할 때 자동으로 붙이므로 저장하지 않습니다.
+    if delta and isinstance(delta[-1], int) and delta[-1] > 0:
+        delta.pop()
+    return delta
+
+
+def apply_delta(old: str, delta: list[int | str]) -> str:
+    """old 에 델타를 적용한 텍스트를 반환합니다."""
+    parts: list[str] = []
+    position = 0
+    for op in delta:
+        if isinstance(op, str):
+            parts.append(op)
+        elif op > 0:
+            parts.append(old[position:position + op])
+            position += op
+        else:
+            position -= op
+    if position > len(old):
+        raise ValueError("델타가 원본 텍스트보다 깁니다.")
+    parts.append(old[position:])
+    return "".join(parts)
@@ -0,0 +1,130 @@
+"""인증 내보내기 벤치마크.
+
+SQLite 저장소에 인증을 여러 규모로 채운 뒤 app.export.export_scrum_entries 로 내보내며
+걸린 시간, 조회한 페이지 수, 파이썬 힙 최대 사용량(tracemalloc)을 측정합니다.
+keyset 페이지로 한 페이지씩 쓰므로 인증 수가 늘어도 최대 메모리는 거의 같아야 합니다.
+내보낸 파일을 다시 읽어 행 수가 날짜 범위와 맞는지도 확인합니다.
+
+    python -m benchmarks.bench_export --rows 10000 40000 --format csv
+"""
+import argparse
+import asyncio
+import csv
+import gzip
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+
+# app 모듈을 import 하기 전에 오프라인 실행 환경을 만듭니다.
+os.environ.setdefault("DISCORD_TOKEN", "bench-export")
+os.environ.setdefault("LOCAL_DB_PATH", os.path.join(tempfile.mkdtemp(prefix="scrumbot-export-"), "local.db"))
+
+from app.database.streaks import streak_store  # noqa: E402
+from app.export import date_bounds, export_scrum_entries  # noqa: E402
+from app.repositories.backends import set_backend  # noqa: E402
+from app.repositories.backends.sqlite import SqliteBackend  # noqa: E402
+
+
+CHANNEL_ID = "900000000000000000"
+FIRST_DAY = date(2026, 1, 1)
+
+
+class CountingBackend(SqliteBackend):
+    """조회한 페이지 수를 셉니다."""
+
+    pages = 0
+
+    async def get_scrum_entries_page(self, *args, **kwargs):
+        self.pages += 1
+        return await super().get_scrum_entries_page(*args, **kwargs)
+
+
+async def seed(backend: SqliteBackend, rows: int, per_day: int) -> None:
+    # 다른 채널의 인증도 섞어 채널 조건을 확인합니다.
+    batch = []
+    for index in range(rows):
+        created_at = datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(days=index // per_day, seconds=index % per_day)
+        batch.append(
+            {
+                "user_id": str(700000000000000000 + index % 500),
+                "yesterday_work": f"어제 한 일 {index}\n- 코드 리뷰, 회의",
+                "today_plan": f"오늘 할 일 {index}\n- 배포 준비",
+                "comment": "화이팅" if index % 3 else "",
+                "message_id": str(1000000000000000000 + index),
+                "channel_id": CHANNEL_ID if index % 4 else "900000000000000001",
+                "created_at": created_at.isoformat(),
+                "is_edited": False,
+            }
+        )
+        if len(batch) == 1000:
+            await backend.insert_missing_scrum_entries(batch)
+            batch = []
+    if batch:
+        await backend.insert_missing_scrum_entries(batch)
+
+
+def count_rows(path: str, fmt: str) -> int:
+    with gzip.open(path, "rt", encoding="utf-8-sig", newline="") as file:
+        if fmt == "csv":
+            return sum(1 for _ in csv.reader(file)) - 1
+        return sum(1 for line in file if json.loads(line))
+
+
+async def run_one(rows: int, args: argparse.Namespace, workdir: str) -> dict:
+    backend = CountingBackend(os.path.join(workdir, f"scrum-{rows}.db"))
+    set_backend(backend)
+    await seed(backend, rows, args.per_day)
+
+    # 첫날과 마지막 날을 하루씩 빼고 내보냅니다.
+    days = (rows + args.per_day - 1) // args.per_day
+    start, end = FIRST_DAY + timedelta(days=1), FIRST_DAY + timedelta(days=max(days - 2, 1))
+    since, until = date_bounds(start, end, streak_store.tz)
+    expected = await backend.db.fetchone(
+        "SELECT COUNT(*) AS n FROM scrum_entries WHERE channel_id = ? AND created_at >= ? AND created_at < ?",
+        (CHANNEL_ID, since, until),
+    )
+
+    path = os.path.join(workdir, f"export-{rows}.{args.format}.gz")
+    backend.pages = 0
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = await export_scrum_entries(path, args.format, CHANNEL_ID, start, end, streak_store.tz, args.page_size)
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await backend.close()
+
+    return {
+        "rows_in_db": rows,
+        "exported": result.rows,
+        "expected": expected["n"],
+        "rows_in_file": count_rows(path, args.format),
+        "pages": backend.pages,
+        "seconds": seconds,
+        "rows_per_second": result.rows / seconds if seconds else 0.0,
+        "file_bytes": result.size,
+        "peak_heap_bytes": peak,
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory(prefix="scrumbot-export-") as workdir:
+        results = [await run_one(rows, args, workdir) for rows in args.rows]
+    return {"format": args.format, "page_size": args.page_size, "runs": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 40000], help="저장소에 채울 인증 수 (여러 개면 차례로 측정)")
+    parser.add_argument("--per-day", type=int, default=400, help="하루에 올라온 인증 수")
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
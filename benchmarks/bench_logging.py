@@ -0,0 +1,84 @@
+"""로깅 핸들러 벤치마크.
+
+stdout 파이프가 느릴 때(컨테이너 로그 수집기가 밀릴 때처럼) 로그 한 줄을 남기는 동안
+이벤트 루프가 얼마나 멈추는지, StreamHandler 에 바로 쓰는 방식과
+app.log 의 QueueHandler + QueueListener 방식을 비교합니다.
+
+    python -m benchmarks.bench_logging
+"""
+import argparse
+import io
+import logging
+import logging.handlers
+import queue
+import statistics
+import time
+
+from app.log import ContextFilter, SampleFilter, TextFormatter, TEXT_FORMAT
+
+
+class SlowSink(io.StringIO):
+    """write 마다 delay 초씩 걸리는 출력 대상입니다."""
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    def write(self, text: str) -> int:
+        time.sleep(self.delay)
+        return super().write(text)
+
+
+def measure(logger: logging.Logger, lines: int) -> list[float]:
+    samples = []
+    for i in range(lines):
+        started = time.perf_counter()
+        logger.info("인증 메시지 전송 완료 (user_id=%s)", i)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def build_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+def report(label: str, samples: list[float]) -> None:
+    ordered = sorted(samples)
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    print(
+        f"{label:<12} mean={statistics.mean(samples) * 1e6:8.1f}us "
+        f"p99={p99 * 1e6:8.1f}us total={sum(samples) * 1000:8.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=500)
+    parser.add_argument("--sink-delay", type=float, default=0.002, help="출력 한 번에 걸리는 시간(초)")
+    args = parser.parse_args()
+
+    stream = logging.StreamHandler(SlowSink(args.sink_delay))
+    stream.setFormatter(TextFormatter(TEXT_FORMAT))
+    report("stream", measure(build_logger("bench.stream", stream), args.lines))
+
+    sink = logging.StreamHandler(SlowSink(args.sink_delay))
+    sink.setFormatter(TextFormatter(TEXT_FORMAT))
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.handlers.QueueHandler(log_queue)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    handler.addFilter(ContextFilter())
+    handler.addFilter(SampleFilter(0))
+    listener = logging.handlers.QueueListener(log_queue, sink)
+    listener.start()
+    report("queue", measure(build_logger("bench.queue", handler), args.lines))
+    flush_started = time.perf_counter()
+    listener.stop()
+    print(f"queue 리스너가 남은 로그를 모두 쓰는 데 {(time.perf_counter() - flush_started) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""인증 알림 스케줄러 벤치마크.
+
+여러 길드의 유저 수천 명이 앞으로 몇 분 안의 시각에 알림을 설정했다고 두고,
+app.reminders.ReminderScheduler 가 길드별 설정을 한 번씩 읽어 힙에 올린 뒤
+알림 시각까지 얼마나 적게 깨어나는지(한가할 때의 CPU 사용량)와 DM 을 얼마나 고르게 보내는지 측정합니다.
+일부 유저는 알림 전에 인증한 것으로 표시해 알림을 건너뛰는지도 확인합니다.
+
+저장소는 메모리 백엔드, DM 은 지정한 지연만큼 기다리는 가짜 채널로 대신합니다.
+
+    python -m benchmarks.bench_reminders --users 5000 --guilds 20 --minutes 2
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import tempfile
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+# app 모듈을 import 하기 전에 오프라인 실행 환경을 만듭니다.
+os.environ.setdefault("DISCORD_TOKEN", "bench-reminders")
+os.environ["REPOSITORY_BACKEND"] = "memory"
+os.environ.setdefault("LOCAL_DB_PATH", os.path.join(tempfile.mkdtemp(prefix="scrumbot-reminders-"), "local.db"))
+
+from app.cache.guild_config import guild_configs  # noqa: E402
+from app.database.streaks import streak_store  # noqa: E402
+from app.reminders import ReminderScheduler  # noqa: E402
+from app.repositories.backends import set_backend  # noqa: E402
+from app.repositories.backends.memory import MemoryBackend  # noqa: E402
+from app.repositories.scrum_reminders import set_scrum_reminder  # noqa: E402
+
+
+class FakeDM:
+    def __init__(self, bot: "FakeBot"):
+        self.bot = bot
+
+    async def send(self, content: str) -> None:
+        await asyncio.sleep(self.bot.latency)
+        self.bot.sent_at.append(time.perf_counter())
+
+
+class FakeBot:
+    def __init__(self, channels: dict[int, int], latency: float):
+        # 인증 채널 ID -> 채널이 속한 길드 ID
+        self._channels = {
+            channel_id: SimpleNamespace(id=channel_id, guild=SimpleNamespace(id=guild_id))
+            for channel_id, guild_id in channels.items()
+        }
+        self.latency = latency
+        self.sent_at: list[float] = []
+
+    def get_channel(self, channel_id: int):
+        return self._channels.get(channel_id)
+
+    async def wait_until_ready(self) -> None:
+        return None
+
+    async def create_dm(self, user) -> FakeDM:
+        await asyncio.sleep(self.latency)
+        return FakeDM(self)
+
+
+def cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+async def run(args: argparse.Namespace) -> dict:
+    set_backend(MemoryBackend())
+    guild_ids = [800000000000000000 + index for index in range(args.guilds)]
+    channels = {810000000000000000 + index: guild_id for index, guild_id in enumerate(guild_ids)}
+    for channel_id, guild_id in channels.items():
+        await guild_configs.set(guild_id, channel_id, None)
+
+    # 다음 분부터 args.minutes 분 동안에 알림 시각을 고르게 나눕니다.
+    now = datetime.now(streak_store.tz).replace(second=0, microsecond=0)
+    users = [(guild_ids[index % args.guilds], 700000000000000000 + index) for index in range(args.users)]
+    for index, (guild_id, user_id) in enumerate(users):
+        remind_at = now + timedelta(minutes=1 + index % args.minutes)
+        await set_scrum_reminder(str(guild_id), str(user_id), f"{remind_at:%H:%M}")
+    last_due = (now + timedelta(minutes=args.minutes)).timestamp()
+
+    bot = FakeBot(channels, args.dm_latency)
+    scheduler = ReminderScheduler(streak_store.tz, args.dm_rate, args.dm_burst, late_grace=0)
+    started = time.perf_counter()
+    scheduler.start(bot)
+    while scheduler.stats()["users"] < args.users:
+        await asyncio.sleep(0.01)
+    load_seconds = time.perf_counter() - started
+
+    # 알림 전에 인증한 유저 (ScrumModal 이 mark_posted 를 부르는 것과 같습니다)
+    posted = random.Random(0).sample(users, int(args.users * args.posted_ratio))
+    for guild_id, user_id in posted:
+        scheduler.mark_posted(guild_id, user_id)
+
+    # 첫 알림 시각까지 기다리는 동안의 CPU 사용량과 깨어난 횟수
+    idle_cpu, idle_started, wakeups = cpu_seconds(), time.time(), scheduler.wakeups_total
+    first_due = (now + timedelta(minutes=1)).timestamp()
+    await asyncio.sleep(max(first_due - time.time() - 0.5, 0))
+    idle_seconds = time.time() - idle_started
+    idle_cpu = cpu_seconds() - idle_cpu
+    idle_wakeups = scheduler.wakeups_total - wakeups
+
+    expected = args.users - len(posted)
+    await asyncio.sleep(max(last_due - time.time(), 0))
+    deadline = time.time() + expected / args.dm_rate + 30
+    while len(bot.sent_at) < expected and time.time() < deadline:
+        await asyncio.sleep(0.1)
+    await scheduler.stop()
+
+    # 1초 창 안에 보낸 DM 수의 최댓값 (토큰 버킷이 지키면 dm_rate + dm_burst 이하)
+    peak, start = 0, 0
+    for end, sent_at in enumerate(bot.sent_at):
+        while sent_at - bot.sent_at[start] > 1.0:
+            start += 1
+        peak = max(peak, end - start + 1)
+    return {
+        "users": args.users,
+        "guilds": args.guilds,
+        "load_seconds": load_seconds,
+        "idle": {
+            "seconds": idle_seconds,
+            "cpu_seconds": idle_cpu,
+            "cpu_percent": idle_cpu / idle_seconds * 100 if idle_seconds else 0.0,
+            "wakeups": idle_wakeups,
+        },
+        "dm": {
+            "expected": expected,
+            "sent": len(bot.sent_at),
+            "peak_per_second": peak,
+            "limit_per_second": args.dm_rate + args.dm_burst,
+        },
+        "scheduler": scheduler.stats(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--guilds", type=int, default=20)
+    parser.add_argument("--minutes", type=int, default=2, help="알림 시각을 나눌 분 수 (다음 분부터)")
+    parser.add_argument("--posted-ratio", type=float, default=0.5, help="알림 전에 인증한 것으로 표시할 유저 비율")
+    parser.add_argument("--dm-rate", type=float, default=200, help="초당 DM 수 (운영 기본값은 REMINDER_DM_RATE)")
+    parser.add_argument("--dm-burst", type=int, default=20)
+    parser.add_argument("--dm-latency", type=float, default=0.05, help="DM 채널 생성/전송 한 번의 지연(초)")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
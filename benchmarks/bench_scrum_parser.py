@@ -0,0 +1,76 @@
+"""인증 메시지 파서 마이크로 벤치마크.
+
+기존 extract_section(섹션마다 전체 메시지를 다시 훑는 방식)과
+parse_scrum_message(한 번에 모든 섹션을 추출)를 비교합니다.
+
+    python -m benchmarks.bench_scrum_parser
+"""
+import timeit
+
+from app.utils.scrum_message import parse_scrum_message, render_scrum_message
+
+
+def extract_section(text: str, start_heading: str, end_heading: str) -> str:
+    # 비교 기준: 기존 app/cogs/scrum.py 의 구현 그대로
+    if not text:
+        return ""
+
+    lines = text.splitlines()
+    is_in_section = False
+    collected: list[str] = []
+    for line in lines:
+        if line.strip().startswith(start_heading):
+            is_in_section = True
+            continue
+        if is_in_section and end_heading and line.strip().startswith(end_heading):
+            break
+        if is_in_section:
+            collected.append(line)
+    return "\n".join(collected).strip()
+
+
+def legacy_parse(text: str) -> tuple[str, str, str]:
+    # 기존 edit_scrum 과 같은 방식: 섹션마다 extract_section 한 번씩
+    return (
+        extract_section(text, "🧐 어제 무엇을 했나요?", "🫣 오늘 무엇을 할 계획인가요?"),
+        extract_section(text, "🫣 오늘 무엇을 할 계획인가요?", "😉 하고 싶은 말"),
+        extract_section(text, "😉 하고 싶은 말", ""),
+    )
+
+
+def single_pass_parse(text: str) -> tuple[str, str, str]:
+    sections = parse_scrum_message(text)
+    return sections.yesterday, sections.today, sections.comment
+
+
+def realistic_message() -> str:
+    return render_scrum_message(
+        123456789012345678,
+        "- 알고리즘 문제 2개 풀기\n- 사이드 프로젝트 API 설계",
+        "- 스터디 발표 자료 만들기\n- 운동 30분",
+        "오늘도 화이팅!",
+    )
+
+
+def worst_case_message() -> str:
+    # 디스코드 메시지 최대 길이(2000자)에 가까운, 짧은 줄이 아주 많은 메시지
+    lines = "\n".join(f"- {i}" for i in range(200))
+    message = render_scrum_message(123456789012345678, lines, lines, lines)
+    return message[:1990]
+
+
+def bench(name: str, text: str, number: int) -> None:
+    assert legacy_parse(text) == single_pass_parse(text), f"{name}: 파싱 결과가 다릅니다"
+    legacy = min(timeit.repeat(lambda: legacy_parse(text), number=number, repeat=5)) / number
+    single = min(timeit.repeat(lambda: single_pass_parse(text), number=number, repeat=5)) / number
+    print(
+        f"{name:<12} ({len(text):>4}자, {text.count(chr(10)) + 1:>3}줄)  "
+        f"extract_section x3: {legacy * 1e6:8.2f}µs   "
+        f"parse_scrum_message: {single * 1e6:8.2f}µs   "
+        f"({legacy / single:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    bench("realistic", realistic_message(), number=20000)
+    bench("worst-case", worst_case_message(), number=2000)
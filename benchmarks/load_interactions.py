@@ -0,0 +1,532 @@
+"""가짜 Interaction/Message 로 커맨드와 모달을 끝까지 실행하는 부하 테스트.
+
+ScrumCog/UserCog 의 실제 콜백(/인증복사 → 인증 작성 모달 → /인증수정 → 수정 모달 → /내프로필조회)을
+동시 사용자 수를 단계별로 늘려 가며 실행하고, 단계마다 작업별 p50/p95/p99 지연 시간, 처리량,
+구간별 소요 시간(최근 인증 조회, 프로필 조회, DB 저장, 디스코드 전송)을 JSON 으로 출력합니다.
+
+저장소는 메모리 백엔드(+ 지정한 왕복 지연), 디스코드 REST 는 지정한 지연만큼 기다리는 가짜 채널로 대신합니다.
+
+    python -m benchmarks.load_interactions --users 10,50,200 --ramp 0 --output result.json
+"""
+import argparse
+import asyncio
+import contextvars
+import functools
+import itertools
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+# app 모듈을 import 하기 전에 오프라인 실행 환경을 만듭니다.
+os.environ.setdefault("DISCORD_TOKEN", "load-test")
+os.environ.setdefault("GUILD_ID", "900000000000000000")
+os.environ.setdefault("CHANNEL_ID", "900000000000000001")
+os.environ["REPOSITORY_BACKEND"] = "memory"
+os.environ.setdefault("LOCAL_DB_PATH", os.path.join(tempfile.mkdtemp(prefix="scrumbot-load-"), "local.db"))
+
+import discord  # noqa: E402
+
+from app.cache.scrum_index import scrum_index  # noqa: E402
+from app.cogs import scrum as scrum_cog  # noqa: E402
+from app.cogs import user as user_cog  # noqa: E402
+from app.config import CHANNEL_ID, GUILD_ID  # noqa: E402
+from app.repositories.backends import set_backend  # noqa: E402
+from app.repositories.backends.base import RepositoryBackend  # noqa: E402
+from app.repositories.backends.memory import MemoryBackend  # noqa: E402
+from app.database.outbox import scrum_outbox  # noqa: E402
+from app.repositories.scrum_entries import outbox_replayer, scrum_entry_queue  # noqa: E402
+from app.utils.outbound import OutboundScheduler  # noqa: E402
+from app.repositories.user_profiles import profile_cache  # noqa: E402
+
+
+STAGES = ("history_scan", "profile_fetch", "db_write", "send")
+
+# 현재 작업의 구간별 소요 시간 (구간 -> 초)
+_stage_times: contextvars.ContextVar[dict | None] = contextvars.ContextVar("stage_times", default=None)
+
+
+def timed_stage(stage: str, func):
+    """코루틴 함수의 소요 시간을 현재 작업의 구간 시간에 더하는 래퍼를 만듭니다."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            times = _stage_times.get()
+            if times is not None:
+                times[stage] = times.get(stage, 0.0) + time.perf_counter() - started
+    return wrapper
+
+
+# 가짜 디스코드 객체
+_snowflakes = itertools.count(1_300_000_000_000_000_000)
+
+
+class FakeMessage:
+    def __init__(self, channel: "FakeChannel", content: str = "", message_id: int | None = None):
+        self.id = message_id or next(_snowflakes)
+        self.channel = channel
+        self.content = content
+
+    async def edit(self, *, content: str) -> "FakeMessage":
+        await asyncio.sleep(self.channel.latency)
+        self.content = content
+        return self
+
+
+class FakeChannel(discord.TextChannel):
+    # cog 의 isinstance(channel, discord.TextChannel) 검사를 통과하기 위해 상속만 합니다.
+    def __init__(self, channel_id: int, latency: float):
+        self.id = channel_id
+        self.name = "load-test"
+        self.latency = latency
+        self.sent = 0
+
+    async def send(self, content: str = "", **kwargs) -> FakeMessage:
+        await asyncio.sleep(self.latency)
+        self.sent += 1
+        return FakeMessage(self, content)
+
+    def get_partial_message(self, message_id: int) -> FakeMessage:
+        return FakeMessage(self, message_id=message_id)
+
+
+class FakeBot:
+    def __init__(self, channel: FakeChannel):
+        self.channel_id = channel.id
+        self.user = SimpleNamespace(id=next(_snowflakes))
+        self._channel = channel
+        self.persistent_view: discord.ui.View | None = None
+
+    async def wait_until_ready(self) -> None:
+        return None
+
+    def add_view(self, view: discord.ui.View, *, message_id: int | None = None) -> None:
+        self.persistent_view = view
+
+    def get_channel(self, channel_id: int):
+        return self._channel if channel_id == self._channel.id else None
+
+
+class FakeResponse:
+    def __init__(self, latency: float):
+        self._latency = latency
+        self._done = False
+        self.message: str | None = None
+        self.view: discord.ui.View | None = None
+        self.modal: discord.ui.Modal | None = None
+        self.deferred = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def _respond(self) -> None:
+        if self._done:
+            raise discord.InteractionResponded(None)
+        await asyncio.sleep(self._latency)
+        self._done = True
+
+    async def send_message(self, content: str | None = None, *, view=None, ephemeral: bool = False, **kwargs) -> None:
+        await self._respond()
+        self.message = content
+        self.view = view
+
+    async def send_modal(self, modal: discord.ui.Modal) -> None:
+        await self._respond()
+        self.modal = modal
+
+    async def defer(self, **kwargs) -> None:
+        await self._respond()
+        self.deferred = True
+
+    async def followup(self, content: str | None = None, *, view=None, ephemeral: bool = False, **kwargs) -> None:
+        # defer 한 뒤의 결과 메시지 (첫 응답 자리에 기록합니다)
+        if not self._done:
+            raise discord.NotFound(SimpleNamespace(status=404, reason="Unknown Webhook"), "defer 전 followup")
+        await asyncio.sleep(self._latency)
+        self.message = content
+        self.view = view
+
+
+class FakeInteraction:
+    def __init__(self, bot: FakeBot, user_id: int, latency: float):
+        self.client = bot
+        self.user = SimpleNamespace(id=user_id, display_name=f"user-{user_id}")
+        self.channel_id = bot.channel_id
+        self.guild_id = GUILD_ID
+        self.response = FakeResponse(latency)
+        self.followup = SimpleNamespace(send=self.response.followup)
+        self.final_message: str | None = None
+        self._finalized = asyncio.Event()
+        self._latency = latency
+
+    async def edit_original_response(self, *, content: str | None = None, **kwargs) -> None:
+        # 채널이 밀려 먼저 응답한 뒤, 게시가 끝나면 그 응답을 고칩니다.
+        await asyncio.sleep(self._latency)
+        self.final_message = content
+        self._finalized.set()
+
+    async def wait_final(self) -> "FakeInteraction":
+        await self._finalized.wait()
+        return self
+
+
+class LatencyBackend(RepositoryBackend):
+    """다른 백엔드의 모든 호출 앞에 고정된 왕복 지연을 넣어 원격 DB 를 흉내 냅니다."""
+
+    def __init__(self, inner: RepositoryBackend, latency: float):
+        self.inner = inner
+        self.latency = latency
+        self.calls: dict[str, int] = defaultdict(int)
+
+    async def _call(self, name: str, *args):
+        self.calls[name] += 1
+        await asyncio.sleep(self.latency)
+        return await getattr(self.inner, name)(*args)
+
+    async def insert_scrum_entry(self, entry):
+        return await self._call("insert_scrum_entry", entry)
+
+    async def upsert_scrum_entries(self, entries):
+        return await self._call("upsert_scrum_entries", entries)
+
+    async def insert_missing_scrum_entries(self, entries):
+        return await self._call("insert_missing_scrum_entries", entries)
+
+    async def update_scrum_entry(self, message_id, data):
+        return await self._call("update_scrum_entry", message_id, data)
+
+    async def get_latest_scrum_entry(self, user_id, channel_id):
+        return await self._call("get_latest_scrum_entry", user_id, channel_id)
+
+    async def get_recent_scrum_entries(self, channel_id, limit):
+        return await self._call("get_recent_scrum_entries", channel_id, limit)
+
+    async def get_scrum_entries_page(self, channel_id, after, limit, since=None, until=None):
+        return await self._call("get_scrum_entries_page", channel_id, after, limit, since, until)
+
+    async def insert_scrum_edit(self, edit):
+        return await self._call("insert_scrum_edit", edit)
+
+    async def get_scrum_edits(self, message_id, up_to, limit):
+        return await self._call("get_scrum_edits", message_id, up_to, limit)
+
+    async def get_guild_configs(self):
+        return await self._call("get_guild_configs")
+
+    async def upsert_guild_config(self, data):
+        return await self._call("upsert_guild_config", data)
+
+    async def upsert_user_profile(self, data):
+        return await self._call("upsert_user_profile", data)
+
+    async def get_scrum_reminders(self, guild_id):
+        return await self._call("get_scrum_reminders", guild_id)
+
+    async def upsert_scrum_reminder(self, data):
+        return await self._call("upsert_scrum_reminder", data)
+
+    async def get_user_profile(self, user_id):
+        return await self._call("get_user_profile", user_id)
+
+
+# 측정 대상 구간을 cog 모듈 이름공간에서 감쌉니다.
+def instrument() -> None:
+    scrum_index.lookup = timed_stage("history_scan", scrum_index.lookup)
+    scrum_cog.get_user_profile = timed_stage("profile_fetch", scrum_cog.get_user_profile)
+    user_cog.get_user_profile = timed_stage("profile_fetch", user_cog.get_user_profile)
+    scrum_cog.enqueue_scrum_entry = timed_stage("db_write", scrum_cog.enqueue_scrum_entry)
+    scrum_cog.update_scrum_entry = timed_stage("db_write", scrum_cog.update_scrum_entry)
+    FakeChannel.send = timed_stage("send", FakeChannel.send)
+    FakeMessage.edit = timed_stage("send", FakeMessage.edit)
+    FakeResponse._respond = timed_stage("send", FakeResponse._respond)
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.stages: dict[str, dict[str, list[float]]] = defaultdict(lambda: defaultdict(list))
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def run(self, name: str, coro_factory, ok) -> FakeInteraction | None:
+        times: dict[str, float] = {}
+        token = _stage_times.set(times)
+        started = time.perf_counter()
+        try:
+            interaction = await coro_factory()
+        except Exception:
+            interaction = None
+        finally:
+            elapsed = time.perf_counter() - started
+            _stage_times.reset(token)
+
+        self.latencies[name].append(elapsed)
+        for stage in STAGES:
+            self.stages[name][stage].append(times.get(stage, 0.0))
+        if interaction is None or not ok(interaction):
+            self.errors[name] += 1
+            return None
+        return interaction
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def summarize(values: list[float]) -> dict:
+    return {
+        "p50_ms": round(percentile(values, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(values, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(values, 0.99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(values) * 1000 if values else 0.0, 3),
+        "max_ms": round(max(values, default=0.0) * 1000, 3),
+    }
+
+
+def acknowledged(interaction: FakeInteraction) -> bool:
+    # 바로 결과로 응답했거나(✅), 채널이 밀려 먼저 응답했으면(⏳) 인터랙션 기한 안에 응답한 것입니다.
+    return interaction.response.message.startswith(("✅", "⏳"))
+
+
+async def user_journey(recorder: Recorder, bot: FakeBot, cogs, user_id: int, iteration: int, latency: float) -> None:
+    scrum, user = cogs
+
+    async def copy():
+        interaction = FakeInteraction(bot, user_id, latency)
+        await scrum.copy_scrum.callback(scrum, interaction)
+        return interaction
+
+    copied = await recorder.run("인증복사", copy, lambda i: i.response.view is not None)
+    if copied is None:
+        return
+
+    async def click():
+        # 메시지의 버튼은 봇에 등록된 영구 뷰 하나가 custom_id 로 받아 처리합니다.
+        interaction = FakeInteraction(bot, user_id, latency)
+        await bot.persistent_view.start_scrum.callback(interaction)
+        return interaction
+
+    clicked = await recorder.run("인증 작성 시작", click, lambda i: i.response.modal is not None)
+    if clicked is None:
+        return
+
+    async def submit():
+        modal = clicked.response.modal
+        modal.comment_input._value = f"load test {iteration}"
+        interaction = FakeInteraction(bot, user_id, latency)
+        await modal.on_submit(interaction)
+        return interaction
+
+    submitted = await recorder.run("ScrumModal", submit, acknowledged)
+    if submitted is not None and submitted.response.message.startswith("⏳"):
+        # 채널이 밀려 먼저 응답한 경우, 실제 게시가 끝날 때까지의 추가 시간을 따로 잽니다.
+        await recorder.run("ScrumModal(지연 게시)", submitted.wait_final, lambda i: i.final_message.startswith("✅"))
+
+    async def open_edit():
+        interaction = FakeInteraction(bot, user_id, latency)
+        await scrum.edit_scrum.callback(scrum, interaction)
+        return interaction
+
+    opened = await recorder.run("인증수정", open_edit, lambda i: i.response.modal is not None)
+    if opened is not None:
+        async def edit():
+            modal = opened.response.modal
+            modal.comment_input._value = f"load test {iteration} (edited)"
+            interaction = FakeInteraction(bot, user_id, latency)
+            await modal.on_submit(interaction)
+            return interaction
+
+        edited = await recorder.run("ScrumEditModal", edit, acknowledged)
+        if edited is not None and edited.response.message.startswith("⏳"):
+            await recorder.run("ScrumEditModal(지연 반영)", edited.wait_final, lambda i: i.final_message.startswith("✅"))
+
+    async def profile():
+        interaction = FakeInteraction(bot, user_id, latency)
+        await user.view_profile.callback(user, interaction)
+        return interaction
+
+    await recorder.run("내프로필조회", profile, lambda i: i.response.message.startswith("👤"))
+
+
+def seed(backend: MemoryBackend, user_ids: list[int], channel_id: int) -> None:
+    # 모든 가상 유저는 월간 목표가 있고, 이전 인증이 하나씩 있습니다.
+    for user_id in user_ids:
+        backend.user_profiles[str(user_id)] = {
+            "id": user_id,
+            "user_id": str(user_id),
+            "monthly_goal": "매일 인증하기",
+            "weekly_goal": "부하 테스트 통과",
+            "routine": "",
+            "created_at": "2025-01-01T00:00:00+00:00",
+            "updated_at": None,
+        }
+        backend._insert({
+            "user_id": str(user_id),
+            "yesterday_work": "- 어제 한 일",
+            "today_plan": "- 오늘 할 일",
+            "comment": "",
+            "message_id": str(next(_snowflakes)),
+            "channel_id": str(channel_id),
+            "is_edited": False,
+            "created_at": "2025-01-01T00:00:00+00:00",
+        })
+
+
+async def run_stage(users: int, args: argparse.Namespace, channel: FakeChannel) -> dict:
+    backend = LatencyBackend(MemoryBackend(), args.db_latency)
+    user_ids = [1_000_000 + index for index in range(users)]
+    seed(backend.inner, user_ids, channel.id)
+    set_backend(backend)
+    scrum_index.clear()
+    profile_cache.clear()
+
+    bot = FakeBot(channel)
+    scrum = scrum_cog.ScrumCog(bot)
+    user = user_cog.UserCog(bot)
+    await scrum.cog_load()
+    if not args.cold_index:
+        await scrum._prepare_task
+        await asyncio.gather(*scrum._channel_tasks)
+
+    # 단계마다 새 채널 스케줄러를 씁니다. (--channel-rate 0 이면 채널 버킷 제한 없이 측정)
+    outbound = scrum_cog.outbound = OutboundScheduler(args.channel_rate, args.channel_burst, args.ack_timeout)
+    queue_before = scrum_entry_queue.stats()
+    recorder = Recorder()
+
+    async def virtual_user(index: int, user_id: int) -> None:
+        if args.ramp and users > 1:
+            await asyncio.sleep(args.ramp * index / (users - 1))
+        for iteration in range(args.iterations):
+            await user_journey(recorder, bot, (scrum, user), user_id, iteration, args.discord_latency)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(virtual_user(index, user_id) for index, user_id in enumerate(user_ids)))
+    wall = time.perf_counter() - started
+
+    # 종료 시 큐를 비우는 시간도 DB 저장 비용에 포함해 따로 보고합니다.
+    drain_started = time.perf_counter()
+    await scrum.cog_unload()
+    drain = time.perf_counter() - drain_started
+    queue_after = scrum_entry_queue.stats()
+    outbound_stats = outbound.stats()
+
+    # 저장 중이던 인증에 들어온 수정은 outbox 로 넘어가므로, 남은 작업을 마저 재전송해 다음 단계에 넘기지 않습니다.
+    outbox_backlog = await scrum_outbox.count()
+    replay_started = time.perf_counter()
+    # (--db-latency 가 저장소 시간 한도보다 길면 재전송도 계속 실패하므로, 줄어들지 않으면 멈춥니다)
+    remaining = outbox_backlog
+    while remaining and await outbox_replayer.replay_once():
+        previous, remaining = remaining, await scrum_outbox.count()
+        if remaining >= previous:
+            break
+    replay = time.perf_counter() - replay_started
+
+    operations = sum(len(values) for values in recorder.latencies.values())
+    return {
+        "users": users,
+        "wall_seconds": wall,
+        "operations": operations,
+        "throughput_ops_per_second": operations / wall if wall else 0.0,
+        "errors": sum(recorder.errors.values()),
+        "operations_by_name": {
+            name: {
+                "count": len(values),
+                "errors": recorder.errors.get(name, 0),
+                "throughput_per_second": len(values) / wall if wall else 0.0,
+                **summarize(values),
+                "stages": {
+                    stage: summarize(recorder.stages[name][stage])
+                    for stage in STAGES
+                    if any(recorder.stages[name][stage])
+                },
+            }
+            for name, values in recorder.latencies.items()
+        },
+        "write_queue": {
+            "flushed": queue_after["flushed_total"] - queue_before["flushed_total"],
+            "failed": queue_after["failed_total"] - queue_before["failed_total"],
+            "flushes": queue_after["flush_count"] - queue_before["flush_count"],
+            "avg_flush_ms": queue_after["avg_flush_seconds"] * 1000,
+            "max_flush_ms": queue_after["max_flush_seconds"] * 1000,
+            "drain_ms": drain * 1000,
+        },
+        "outbound": {
+            "sent": outbound_stats["sent_total"],
+            "edited": outbound_stats["edited_total"],
+            "coalesced": outbound.coalesced,
+            "failed": outbound_stats["failed_total"],
+        },
+        "outbox": {
+            "backlog_at_shutdown": outbox_backlog,
+            "replay_ms": replay * 1000,
+            "backlog_after_replay": remaining,
+        },
+        "backend_calls": dict(backend.calls),
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", default="10,50,200", help="단계별 동시 사용자 수 (쉼표로 구분)")
+    parser.add_argument("--iterations", type=int, default=1, help="사용자마다 반복할 시나리오 횟수")
+    parser.add_argument("--ramp", type=float, default=0.0, help="단계마다 사용자 시작을 나눠 퍼뜨릴 시간(초), 0이면 동시에 시작")
+    parser.add_argument("--discord-latency", type=float, default=0.05, help="디스코드 REST 호출 한 번의 지연(초)")
+    parser.add_argument("--db-latency", type=float, default=0.03, help="저장소 호출 한 번의 지연(초)")
+    parser.add_argument("--cold-index", action="store_true", help="최근 인증 인덱스를 미리 채우지 않고 시작")
+    parser.add_argument("--channel-rate", type=float, default=0.0, help="채널당 초당 전송/수정 수 (0이면 제한 없음, 디스코드는 1)")
+    parser.add_argument("--channel-burst", type=int, default=5, help="채널당 한 번에 몰아 보낼 수 있는 수")
+    parser.add_argument("--ack-timeout", type=float, default=1.0, help="게시 결과를 기다렸다 응답할 최대 시간(초)")
+    parser.add_argument("--output", help="결과 JSON 을 저장할 파일 (생략하면 stdout)")
+    return parser.parse_args(argv)
+
+
+async def main(args: argparse.Namespace) -> dict:
+    instrument()
+    channel = FakeChannel(CHANNEL_ID, args.discord_latency)
+    stages = [await run_stage(int(users), args, channel) for users in args.users.split(",")]
+    return {
+        "benchmark": "load_interactions",
+        "revision": git_revision(),
+        "python": sys.version.split()[0],
+        "config": {
+            "iterations": args.iterations,
+            "ramp_seconds": args.ramp,
+            "discord_latency_seconds": args.discord_latency,
+            "db_latency_seconds": args.db_latency,
+            "cold_index": args.cold_index,
+            "channel_rate": args.channel_rate,
+        },
+        "stages": stages,
+    }
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    logging.getLogger("app.log").setLevel(logging.WARNING)
+    result = asyncio.run(main(arguments))
+    report = json.dumps(result, ensure_ascii=False, indent=2)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
@@ -0,0 +1,45 @@
+"""인증 기록 내보내기 CLI.
+
+봇과 같은 환경변수(REPOSITORY_BACKEND, SUPABASE_* 등)로 저장소에 접속해 scrum_entries 를
+gzip 으로 압축한 CSV/JSONL 파일로 내보냅니다. 날짜는 SCRUM_TIMEZONE 기준이며 양 끝을 포함합니다.
+
+    python export.py --channel 123456789 --start 2026-01-01 --end 2026-01-31 --format csv
+    python export.py --format jsonl -o data/exports/all.jsonl.gz
+"""
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+    import os
+    import sys
+
+    from app.config import EXPORT_DIR
+    from app.database.streaks import streak_store
+    from app.export import EXPORT_FORMATS, export_filename, export_scrum_entries, parse_export_date
+    from app.http_pool import http_pool
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--channel", help="내보낼 인증 채널 ID (비우면 전체 채널)")
+    parser.add_argument("--start", help="이 날짜부터 (YYYY-MM-DD)")
+    parser.add_argument("--end", help="이 날짜까지 (YYYY-MM-DD)")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+    parser.add_argument("-o", "--output", help="저장할 파일 (기본: EXPORT_DIR 아래 자동 이름)")
+    args = parser.parse_args()
+
+    try:
+        start, end = parse_export_date(args.start), parse_export_date(args.end)
+    except ValueError as e:
+        parser.error(str(e))
+    output = args.output or os.path.join(EXPORT_DIR, export_filename(args.channel, start, end, args.format))
+
+    async def main() -> None:
+        try:
+            result = await export_scrum_entries(output, args.format, args.channel, start, end, streak_store.tz)
+        finally:
+            await http_pool.close()
+        print(f"인증 {result.rows}개를 {result.path} 에 저장했습니다. ({result.size}바이트)")
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("내보내기를 중단했습니다.")
+        sys.exit(1)
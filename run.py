@@ -1,4 +1,8 @@
 if __name__ == "__main__":
+    # STARTUP_PROFILE=1 이면 이후 import 시간을 측정합니다.
+    from app import startup_profile
+    startup_profile.install()
+
     from app.discord_bot import main
     import asyncio
 
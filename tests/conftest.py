@@ -0,0 +1,7 @@
+import os
+import tempfile
+
+# app 모듈을 import 하기 전에 오프라인 실행 환경을 만듭니다. (benchmarks 와 같은 방식)
+os.environ.setdefault("DISCORD_TOKEN", "tests")
+os.environ["REPOSITORY_BACKEND"] = "memory"
+os.environ.setdefault("LOCAL_DB_PATH", os.path.join(tempfile.mkdtemp(prefix="scrumbot-tests-"), "local.db"))
@@ -0,0 +1,12 @@
+from prometheus_client import CollectorRegistry, generate_latest
+
+from app.metrics import StatsCollector
+
+
+def test_stats_totals_are_exported_as_counters():
+    registry = CollectorRegistry()
+    registry.register(StatsCollector("scrumbot_test", lambda: {"queued": 2, "sent_total": 5}, "테스트"))
+    text = generate_latest(registry).decode()
+    assert "# TYPE scrumbot_test_queued gauge" in text
+    assert "# TYPE scrumbot_test_sent_total counter" in text
+    assert "scrumbot_test_sent_total 5.0" in text
@@ -0,0 +1,67 @@
+import asyncio
+import os
+
+from app.database.local import LocalDatabase
+from app.database.outbox import ScrumOutbox
+from app.repositories.backends import set_backend
+from app.repositories.backends.memory import MemoryBackend
+from app.repositories.scrum_entries import (
+    ScrumEntryWriteQueue,
+    ScrumOutboxReplayer,
+    _build_scrum_entry,
+)
+
+
+class RecordingBackend(MemoryBackend):
+    """upsert 로 보낸 배치를 그대로 남깁니다."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches: list[list[dict]] = []
+
+    async def upsert_scrum_entries(self, entries: list[dict]) -> list[dict]:
+        self.batches.append([dict(entry) for entry in entries])
+        return await super().upsert_scrum_entries(entries)
+
+
+def _entry(index: int) -> dict:
+    return _build_scrum_entry(str(index), "어제", "오늘", "", str(1000 + index), "1")
+
+
+def test_mixed_write_batch_has_uniform_keys(tmp_path):
+    async def run() -> list[list[dict]]:
+        backend = RecordingBackend()
+        set_backend(backend)
+        outbox = ScrumOutbox(LocalDatabase(os.path.join(tmp_path, "local.db")))
+        queue = ScrumEntryWriteQueue(outbox, ScrumOutboxReplayer(outbox, 10, 1), 10, 1, 1)
+        for index in range(3):
+            queue.enqueue(_entry(index))
+        # 저장 전에 한 인증만 수정해 수정된 행과 아닌 행을 한 배치에 섞습니다.
+        await queue.merge_update("1001", {"today_plan": "고친 계획", "updated_at": "2026-01-01T00:00:00+00:00", "is_edited": True})
+        await queue.flush()
+        return backend.batches
+
+    batches = asyncio.run(run())
+    assert len(batches) == 1 and len(batches[0]) == 3
+    assert len({frozenset(row) for row in batches[0]}) == 1
+    assert [row["is_edited"] for row in batches[0]] == [False, True, False]
+
+
+def test_mixed_outbox_replay_batch_has_uniform_keys(tmp_path):
+    async def run() -> list[list[dict]]:
+        backend = RecordingBackend()
+        set_backend(backend)
+        outbox = ScrumOutbox(LocalDatabase(os.path.join(tmp_path, "local.db")))
+        # 수정 컬럼이 없던 때 쌓인 생성 작업, 새 생성 작업, 재전송 전에 수정된 생성 작업을 섞습니다.
+        legacy = {key: value for key, value in _entry(0).items() if key not in ("updated_at", "is_edited")}
+        await outbox.put_create(legacy)
+        await outbox.put_create(_entry(1))
+        await outbox.put_create(_entry(2))
+        await outbox.put_update("1002", {"today_plan": "고친 계획", "updated_at": "2026-01-01T00:00:00+00:00", "is_edited": True})
+        await ScrumOutboxReplayer(outbox, 10, 1).replay_once()
+        return backend.batches
+
+    batches = asyncio.run(run())
+    assert len(batches) == 1 and len(batches[0]) == 3
+    assert len({frozenset(row) for row in batches[0]}) == 1
+    assert sorted(row["is_edited"] for row in batches[0]) == [False, False, True]
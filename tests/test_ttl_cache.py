@@ -0,0 +1,26 @@
+import asyncio
+
+from app.cache.ttl_cache import TTLCache
+
+
+def test_cancelled_first_caller_does_not_cancel_other_waiters():
+    async def run() -> tuple:
+        cache = TTLCache(10, 60)
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "value"
+
+        first = asyncio.create_task(cache.get_or_load("key", loader))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.get_or_load("key", loader))
+        await asyncio.sleep(0.01)
+        # 로드를 시작한 쪽만 취소합니다.
+        first.cancel()
+        value = await second
+        return value, calls, first.cancelled(), "key" in cache
+
+    assert asyncio.run(run()) == ("value", 1, True, True)